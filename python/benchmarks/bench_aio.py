@@ -0,0 +1,44 @@
+"""Compare one executor submission per call with AsyncBatcher micro-batching.
+
+Both serve the same burst of concurrent conversion requests from a single
+event loop on a thread pool of the same size.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from transtex import AsyncBatcher, convert_citation
+from bench_batch import build_citations
+
+
+async def per_call(texts: list[str], executor: ThreadPoolExecutor) -> list[str]:
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(loop.run_in_executor(executor, convert_citation, "apa", "ieee", text) for text in texts)
+    )
+
+
+async def batched(texts: list[str], batcher: AsyncBatcher) -> list[str]:
+    return await asyncio.gather(*(batcher.convert("apa", "ieee", text) for text in texts))
+
+
+async def main(count: int = 20_000, workers: int = 4) -> None:
+    texts = build_citations(count)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        started = time.perf_counter()
+        await per_call(texts, executor)
+        print(f"run_in_executor per call {count / (time.perf_counter() - started):10.0f} citations/s")
+        async with AsyncBatcher(executor) as batcher:
+            started = time.perf_counter()
+            await batched(texts, batcher)
+            print(f"AsyncBatcher             {count / (time.perf_counter() - started):10.0f} citations/s")
+            started = time.perf_counter()
+            async for _ in batcher.convert_many("apa", "ieee", texts, chunksize=256):
+                pass
+            print(f"AsyncBatcher stream      {count / (time.perf_counter() - started):10.0f} citations/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
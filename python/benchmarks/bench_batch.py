@@ -0,0 +1,76 @@
+"""Measure how batch conversion scales with workers on process and thread pools.
+
+Worker counts double from 1 up to the CPU count (at least 2, so the pool
+overhead is visible on single-core machines too). Throughput on one worker
+is the in-process baseline. Run it under a regular and a free-threaded
+(``python3.13t``) interpreter to compare thread pools with and without the
+GIL; the header line reports which kind of build is running.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import sysconfig
+import time
+from typing import List
+
+from transtex import Reference, convert_many, format_apa
+
+
+def build_citations(count: int) -> List[str]:
+    return [
+        format_apa(
+            Reference(
+                entry_type="article",
+                cite_key=f"ref{index}",
+                title=f"Deep Learning for Everything, Part {index}",
+                authors=["John Doe", "Jane Smith", "Alan M. Turing"][: 1 + index % 3],
+                journal="Journal of Omniscience",
+                year=str(1990 + index % 30),
+                volume=str(index % 60 + 1),
+                issue=str(index % 12 + 1),
+                pages=f"{index}-{index + 12}",
+                doi=f"10.1000/j.jo.{index:05d}",
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def worker_counts() -> List[int]:
+    limit = max(os.cpu_count() or 1, 2)
+    counts = [1]
+    while counts[-1] * 2 <= limit:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != limit:
+        counts.append(limit)
+    return counts
+
+
+def describe_interpreter() -> str:
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    build = "free-threaded" if free_threaded else "regular"
+    return f"Python {sys.version.split()[0]} ({build} build, GIL {'enabled' if gil else 'disabled'})"
+
+
+def main(count: int = 50_000, chunksize: int = 256) -> None:
+    print(describe_interpreter())
+    citations = build_citations(count)
+    baseline = None
+    for executor in ("process", "thread"):
+        for workers in worker_counts():
+            for ordered in (True, False):
+                started = time.perf_counter()
+                for _ in convert_many(
+                    "apa", "ieee", citations, workers=workers, chunksize=chunksize, ordered=ordered, executor=executor
+                ):
+                    pass
+                rate = count / (time.perf_counter() - started)
+                baseline = baseline or rate
+                label = "ordered" if ordered else "as completed"
+                print(f"{executor:7} workers={workers:<3} {label:13} {rate:10.0f} citations/s  x{rate / baseline:4.2f}")
+
+
+if __name__ == "__main__":
+    main()
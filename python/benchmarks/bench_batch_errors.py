@@ -0,0 +1,46 @@
+"""Compare per-item try/except around convert_citation with captured results.
+
+Both run in-process on the same mix of good and dirty input; dirty items are
+empty lines, oversized pastes and text that no parser accepts.
+"""
+from __future__ import annotations
+
+import timeit
+from typing import List, Optional
+
+from transtex import ConversionError, convert_citation, convert_many
+from bench_batch import build_citations
+
+DIRTY = ["", "not a citation at all", "x" * 5000, "Doe, J. (2020)."]
+
+
+def build_mix(count: int, dirty_share: float) -> List[str]:
+    clean = build_citations(count)
+    step = int(1 / dirty_share) if dirty_share else 0
+    return [DIRTY[index % len(DIRTY)] if step and index % step == 0 else text for index, text in enumerate(clean)]
+
+
+def try_except(texts: List[str]) -> List[Optional[str]]:
+    results: List[Optional[str]] = []
+    for text in texts:
+        try:
+            results.append(convert_citation("apa", "ieee", text))
+        except ConversionError:
+            results.append(None)
+    return results
+
+
+def captured(texts: List[str]) -> list:
+    return list(convert_many("apa", "ieee", texts, workers=1, chunksize=256, errors="capture"))
+
+
+def main(count: int = 5000) -> None:
+    for share in (0.0, 0.2, 0.5):
+        texts = build_mix(count, share)
+        for label, run in (("try/except", try_except), ("errors=capture", captured)):
+            seconds = min(timeit.repeat(lambda: run(texts), number=1, repeat=5))
+            print(f"{share:4.0%} dirty  {label:15} {seconds / count * 1e6:7.2f} µs/item")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Compare the brace-aware casing engine against the previous casing helpers."""
+from __future__ import annotations
+
+import re
+import timeit
+from typing import List
+
+from transtex.formatters.shared import sentence_case, title_case
+
+PLAIN_TITLES = [
+    "Deep Learning for Everything",
+    "On the Electrodynamics of Moving Bodies",
+    "The Art of Computer Programming",
+    "A Survey of DNA Sequencing Methods in the Age of Bayesian Inference",
+]
+BRACED_TITLES = [
+    "A Survey of {DNA} Sequencing Methods in the Age of {Bayesian} Inference",
+    "{RNA} Folding and the Origin of Life: a Review of {MCMC} Approaches",
+]
+
+
+def legacy_sentence_case(text: str) -> str:
+    if not text:
+        return ""
+    parts = re.split(r"(\s+)", text.strip())
+    result: List[str] = []
+    first_word_done = False
+    for part in parts:
+        if not part.strip():
+            result.append(part)
+            continue
+        if not first_word_done:
+            result.append(part[:1].upper() + part[1:].lower())
+            first_word_done = True
+            continue
+        result.append(part if part.isupper() else part.lower())
+    return "".join(result)
+
+
+def legacy_title_case(text: str) -> str:
+    if not text:
+        return ""
+    small_words = {
+        "a", "an", "the", "and", "but", "or", "nor", "for", "so",
+        "yet", "on", "in", "to", "of", "by", "at", "from",
+    }
+    tokens = re.split(r"(\s+)", text.strip())
+    result: List[str] = []
+    first_word = True
+    for token in tokens:
+        if not token.strip():
+            result.append(token)
+            continue
+        lowered = token.lower()
+        if first_word or lowered not in small_words:
+            token = token[0].upper() + token[1:]
+        else:
+            token = lowered
+        first_word = False
+        result.append(token)
+    return "".join(result)
+
+
+def _bench(label: str, func, titles: List[str], number: int) -> None:
+    elapsed = timeit.timeit(lambda: [func(title) for title in titles], number=number)
+    per_call = elapsed / (number * len(titles)) * 1e6
+    print(f"{label:<36} {per_call:8.2f} us/title")
+
+
+def main(number: int = 20000) -> None:
+    for name, titles in (("plain", PLAIN_TITLES), ("braced", BRACED_TITLES)):
+        _bench(f"legacy sentence_case ({name})", legacy_sentence_case, titles, number)
+        _bench(f"sentence_case ({name})", sentence_case, titles, number)
+        _bench(f"legacy title_case ({name})", legacy_title_case, titles, number)
+        _bench(f"title_case ({name})", title_case, titles, number)
+
+
+if __name__ == "__main__":
+    main()
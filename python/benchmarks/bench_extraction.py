@@ -0,0 +1,32 @@
+"""Time find_reference_section on a large document.
+
+The filler lines carry inline ``[n]`` markers, so a scanner that inspects
+every line as a possible numbered entry does far more work than the single
+regex passes ``find_reference_section`` makes.
+"""
+from __future__ import annotations
+
+import timeit
+
+from transtex import find_reference_section
+
+IEEE_ENTRY = (
+    'J. Doe and J. Smith, "Deep Learning for Everything," Journal of Omniscience, '
+    "vol. 42, no. 7, pp. 1–10, 2020, doi: 10.1000/j.jo.2020.01.001."
+)
+
+
+def build_document(lines: int = 170_000) -> str:
+    filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit [12].\n" * lines
+    return f"{filler}References\n[1] {IEEE_ENTRY}\n"
+
+
+def main() -> None:
+    document = build_document()
+    seconds = min(timeit.repeat(lambda: find_reference_section(document), number=1, repeat=5))
+    megabytes = len(document.encode("utf-8")) / 1e6
+    print(f"find_reference_section on {megabytes:.1f} MB: {seconds * 1000:.1f} ms ({megabytes / seconds:,.0f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
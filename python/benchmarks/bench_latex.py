@@ -0,0 +1,126 @@
+"""Time LaTeX decoding and encoding of BibTeX entries on an accent-heavy corpus.
+
+The replace-loop baseline applies one ``str.replace`` per table entry to
+every field after parsing, which is how values were decoded outside the
+reader before it could do so itself. Encoding is timed on the decoded
+corpus and on plain ASCII references, with the cost of a million-entry
+export extrapolated from the per-entry time.
+"""
+from __future__ import annotations
+
+import timeit
+import unicodedata
+from typing import Callable, Dict, List
+
+from transtex import Reference, parse_bibtex_entry, reference_to_bibtex
+
+NAMES = [
+    r"J{\"u}rgen M{\"u}ller",
+    r"Fran\c{c}ois Dvo{\v{r}}{\'a}k",
+    r"Paul Erd\H{o}s",
+    r"S{\o}ren Kierkeg{\aa}rd",
+    r"Jan {\L}ukasiewicz",
+    r"Ren\'e Descartes",
+    r"Andr\'{e} Bj{\"o}rklund",
+]
+TITLES = [
+    r"Stra{\ss}en \& Br\"ucken in {\"O}sterreich, 1900--1950",
+    r"{\'E}tudes sur la th\'eorie des {\'e}quations --- nouvelle s\'erie",
+    r"Na\"{\i}ve approaches to {\em ad hoc} caf\'e networks",
+    r"``Sm{\o}rrebr{\o}d'' and other {\AA}rhus delicacies",
+]
+
+
+def build_entries(count: int = 500) -> List[str]:
+    entries = []
+    for index in range(count):
+        authors = " and ".join(NAMES[(index + offset) % len(NAMES)] for offset in range(3))
+        entries.append(
+            f"@article{{ref{index},\n"
+            f"  author = {{{authors}}},\n"
+            f"  title = {{{TITLES[index % len(TITLES)]}}},\n"
+            f"  journal = {{Revue d'{{\\'E}}conomie Politique}},\n"
+            f"  year = {{{1990 + index % 30}}},\n"
+            f"  pages = {{{index}--{index + 12}}},\n"
+            f"  url = {{https://example.org/~ref{index}}}\n"
+            "}"
+        )
+    return entries
+
+
+def _replace_table() -> Dict[str, str]:
+    table = {
+        r"\&": "&", r"\%": "%", "---": "—", "--": "–", "~": " ",
+        r"{\ss}": "ß", r"{\o}": "ø", r"{\aa}": "å", r"{\AA}": "Å", r"{\L}": "Ł", r"\i": "ı",
+    }
+    marks = {"'": "́", "`": "̀", "^": "̂", '"': "̈", "~": "̃", "c": "̧", "v": "̌", "H": "̋"}
+    for name, mark in marks.items():
+        for letter in "aceinoruszAEINOUSZ":
+            char = unicodedata.normalize("NFC", letter + mark)
+            for template in ("{{\\{0}{1}}}", "\\{0}{{{1}}}", "\\{0}{1}"):
+                table[template.format(name, letter)] = char
+    return table
+
+
+REPLACEMENTS = _replace_table()
+
+
+def replace_loop(value: str) -> str:
+    for source, target in REPLACEMENTS.items():
+        if source in value:
+            value = value.replace(source, target)
+    return value.replace("{\\em ", "").replace("{", "").replace("}", "")
+
+
+def decode_after_parse(entry: str) -> Reference:
+    reference = parse_bibtex_entry(entry)
+    reference.title = replace_loop(reference.title or "")
+    reference.journal = replace_loop(reference.journal or "")
+    reference.pages = replace_loop(reference.pages or "")
+    reference.authors = [replace_loop(author) for author in reference.authors]
+    return reference
+
+
+def _bench(label: str, run: Callable[[str], Reference], entries: List[str]) -> None:
+    seconds = min(timeit.repeat(lambda: [run(entry) for entry in entries], number=1, repeat=10))
+    print(f"{label:36} {seconds / len(entries) * 1e6:7.2f} µs/entry")
+
+
+def _bench_write(label: str, references: List[Reference], encode: bool) -> None:
+    seconds = min(
+        timeit.repeat(
+            lambda: [reference_to_bibtex(reference, encode_latex=encode) for reference in references],
+            number=1,
+            repeat=10,
+        )
+    )
+    per_entry = seconds / len(references)
+    print(f"{label:36} {per_entry * 1e6:7.2f} µs/entry  ({per_entry * 1e6:5.1f} s per million)")
+
+
+def main() -> None:
+    entries = build_entries()
+    _bench("parse, no decoding", parse_bibtex_entry, entries)
+    _bench("parse + replace loop", decode_after_parse, entries)
+    _bench("parse with decode_latex=True", lambda entry: parse_bibtex_entry(entry, decode_latex=True), entries)
+
+    accented = [parse_bibtex_entry(entry, decode_latex=True) for entry in entries]
+    ascii_only = [
+        Reference(
+            entry_type="article",
+            cite_key=f"ref{index}",
+            title=f"Deep Learning for Everything, Part {index}",
+            authors=["John Doe", "Jane Smith"],
+            journal="Journal of Omniscience",
+            year=str(1990 + index % 30),
+            pages=f"{index}-{index + 12}",
+        )
+        for index in range(len(entries))
+    ]
+    for label, references in (("accented", accented), ("ascii", ascii_only)):
+        _bench_write(f"write {label}, verbatim", references, False)
+        _bench_write(f"write {label}, encode_latex=True", references, True)
+
+
+if __name__ == "__main__":
+    main()
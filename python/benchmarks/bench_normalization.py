@@ -0,0 +1,83 @@
+"""Compare normalizing once before parsing with parse-fail-clean-retry.
+
+The retry path parses the raw text first and, when that fails, cleans it up
+and parses again, which is what callers had to do before the parsers
+normalized their input.
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Callable, List
+
+from transtex import Reference, format_ieee, format_mla
+from transtex.normalization import normalize_citation_text
+from transtex.parsers import parse_ieee_citation, parse_mla_citation
+
+
+def pdf_paste(text: str) -> str:
+    """Mimic text copied out of a PDF: curly quotes, NBSPs, soft hyphens."""
+    opened = False
+    pieces = []
+    for char in text:
+        if char == '"':
+            pieces.append("\u201d" if opened else "\u201c")
+            opened = not opened
+        else:
+            pieces.append(char)
+    return "".join(pieces).replace(", ", ",\u00a0").replace("Learn", "Le\u00adarn")
+
+
+def build_citations(formatter: Callable[[Reference], str], count: int = 500) -> List[str]:
+    return [
+        formatter(
+            Reference(
+                entry_type="article",
+                cite_key=f"ref{index}",
+                title=f"Deep Learning for Everything, Part {index}",
+                authors=["John Doe", "Jane Smith"],
+                journal="Journal of Omniscience",
+                year=str(1990 + index % 30),
+                volume=str(index % 60 + 1),
+                issue=str(index % 12 + 1),
+                pages=f"{index}-{index + 12}",
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def retry_parse(parser: Callable[[str], Reference], text: str) -> Reference:
+    try:
+        reference = parser(text)
+    except ValueError:
+        return parser(normalize_citation_text(text))
+    # Some pasted citations parse but lose fields; callers re-parsed those too.
+    if reference.volume is None:
+        return parser(normalize_citation_text(text))
+    return reference
+
+
+def normalize_then_parse(parser: Callable[[str], Reference], text: str) -> Reference:
+    return parser(normalize_citation_text(text))
+
+
+def _bench(label: str, run: Callable[[str], Reference], citations: List[str]) -> None:
+    seconds = min(timeit.repeat(lambda: [run(text) for text in citations], number=1, repeat=10))
+    print(f"{label:40} {seconds / len(citations) * 1e6:7.2f} µs/citation")
+
+
+def main() -> None:
+    for name, formatter, parser in (
+        ("ieee", format_ieee, parse_ieee_citation),
+        ("mla", format_mla, parse_mla_citation),
+    ):
+        clean = build_citations(formatter)
+        pasted = [pdf_paste(text) for text in clean]
+        _bench(f"{name} clean, parse only", parser, clean)
+        _bench(f"{name} clean, normalize + parse", lambda text: normalize_then_parse(parser, text), clean)
+        _bench(f"{name} pasted, parse + retry", lambda text: retry_parse(parser, text), pasted)
+        _bench(f"{name} pasted, normalize + parse", lambda text: normalize_then_parse(parser, text), pasted)
+
+
+if __name__ == "__main__":
+    main()
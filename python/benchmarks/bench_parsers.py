@@ -0,0 +1,65 @@
+"""Time every citation parser on formatter output.
+
+Run against two checkouts to compare parser implementations; the shared
+lexer is timed separately when it is available.
+"""
+from __future__ import annotations
+
+import timeit
+from typing import Callable, Dict, List
+
+from transtex import Reference, format_apa, format_chicago, format_ieee, format_mla, format_vancouver
+from transtex.parsers import (
+    parse_apa_citation,
+    parse_chicago_citation,
+    parse_ieee_citation,
+    parse_mla_citation,
+    parse_vancouver_citation,
+)
+
+STYLES: Dict[str, tuple[Callable[[Reference], str], Callable[[str], Reference]]] = {
+    "apa": (format_apa, parse_apa_citation),
+    "ieee": (format_ieee, parse_ieee_citation),
+    "mla": (format_mla, parse_mla_citation),
+    "chicago": (format_chicago, parse_chicago_citation),
+    "vancouver": (format_vancouver, parse_vancouver_citation),
+}
+
+
+def build_references(count: int = 200) -> List[Reference]:
+    references = []
+    for index in range(count):
+        references.append(
+            Reference(
+                entry_type="article",
+                cite_key=f"ref{index}",
+                title=f"Deep Learning for Everything, Part {index}",
+                authors=["John Doe", "Jane Smith", "Alan M. Turing"][: 1 + index % 3],
+                journal="Journal of Omniscience",
+                year=str(1990 + index % 30),
+                volume=str(index % 60 + 1),
+                issue=str(index % 12 + 1),
+                pages=f"{index}-{index + 12}",
+                doi=f"10.1000/j.jo.{index:05d}" if index % 2 else None,
+                url=None if index % 2 else f"https://example.org/{index}",
+            )
+        )
+    return references
+
+
+def main(rounds: int = 20) -> None:
+    references = build_references()
+    for style, (formatter, parser) in STYLES.items():
+        citations = [formatter(reference) for reference in references]
+        seconds = min(timeit.repeat(lambda: [parser(text) for text in citations], number=1, repeat=rounds))
+        print(f"{style:10} parse {seconds / len(citations) * 1e6:7.2f} µs/citation")
+        try:
+            from transtex.parsers.lexer import tokenize
+        except ImportError:
+            continue
+        seconds = min(timeit.repeat(lambda: [tokenize(text) for text in citations], number=1, repeat=rounds))
+        print(f"{style:10} lex   {seconds / len(citations) * 1e6:7.2f} µs/citation")
+
+
+if __name__ == "__main__":
+    main()
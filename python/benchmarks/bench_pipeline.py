@@ -0,0 +1,79 @@
+"""Compare a list-at-every-step .bib → IEEE job with the equivalent Pipeline.
+
+Both read the same generated BibTeX file, keep the articles, upper-case
+their titles and write IEEE references. The list version materializes the
+entries, the parsed references and the formatted strings in turn; the
+pipeline streams one entry at a time. Peak traced memory is reported for
+each, so run with a large ``--count`` to see the list version grow with
+the input while the pipeline stays flat.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from transtex import Reference, format_reference, iter_bibtex_entries, parse_bibtex_entry, read_bib, reference_to_bibtex
+
+
+def write_bib(path: str, count: int) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        for index in range(count):
+            reference = Reference(
+                entry_type="article" if index % 4 else "book",
+                cite_key=f"ref{index}",
+                title=f"Deep Learning for Everything, Part {index}",
+                authors=["John Doe", "Jane Smith"],
+                journal="Journal of Omniscience",
+                publisher="Omniscience Press",
+                year=str(1990 + index % 30),
+                pages=f"{index}-{index + 12}",
+            )
+            handle.write(reference_to_bibtex(reference) + "\n\n")
+
+
+def shout(reference: Reference) -> Reference:
+    reference.title = (reference.title or "").upper()
+    return reference
+
+
+def with_lists(source: str, target: str) -> None:
+    with open(source, encoding="utf-8") as handle:
+        entries = list(iter_bibtex_entries(handle))
+    references = [parse_bibtex_entry(entry) for entry in entries]
+    articles = [shout(reference) for reference in references if reference.entry_type == "article"]
+    lines = [format_reference("ieee", reference) for reference in articles]
+    with open(target, "w", encoding="utf-8") as handle:
+        handle.write("".join(line + "\n" for line in lines))
+
+
+def with_pipeline(source: str, target: str) -> None:
+    read_bib(source).filter(lambda reference: reference.entry_type == "article").map(shout).format("ieee").write(target)
+
+
+def measure(label: str, run: Callable[[str, str], None], source: str, target: str) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    run(source, target)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:10} {elapsed:7.2f} s   peak {peak / 2**20:8.2f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000, help="entries in the generated file")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "refs.bib")
+        write_bib(source, args.count)
+        for label, run in (("lists", with_lists), ("pipeline", with_pipeline)):
+            measure(label, run, source, os.path.join(directory, f"{label}.txt"))
+
+
+if __name__ == "__main__":
+    main()
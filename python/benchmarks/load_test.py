@@ -0,0 +1,101 @@
+"""Load-test the HTTP service on localhost over keep-alive connections.
+
+Starts ``transtex serve`` on a free port (unless ``--url`` points at a
+running server), then opens ``--connections`` client threads that each send
+``--requests`` single-citation (or ``--batch``-sized) ``/convert`` requests
+and reports throughput and latency percentiles. Compare ``--window 0``
+with the default to see what request coalescing buys.
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List
+from urllib.parse import urlsplit
+
+from bench_batch import build_citations
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def start_server(workers: int, window: float) -> tuple[subprocess.Popen, str]:
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    command = [sys.executable, "-m", "transtex", "serve", "--port", "0", "--workers", str(workers), "--window", str(window)]
+    process = subprocess.Popen(command, stderr=subprocess.PIPE, text=True, env=env)
+    line = process.stderr.readline()
+    if "serving on" not in line:
+        process.kill()
+        raise SystemExit(f"server did not start: {line}")
+    return process, line.split()[-1]
+
+
+def client(url: str, payloads: List[bytes], latencies: List[float]) -> None:
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=60)
+    for payload in payloads:
+        started = time.perf_counter()
+        connection.request("POST", "/convert", body=payload, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise SystemExit(f"unexpected status {response.status}")
+        latencies.append(time.perf_counter() - started)
+    connection.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="target an already running server")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--window", type=float, default=2.0, help="coalescing window in ms for the spawned server")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="requests per connection")
+    parser.add_argument("--batch", type=int, default=1, help="citations per request")
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_server(args.workers, args.window)
+    try:
+        citations = build_citations(1000)
+        per_client = []
+        for connection in range(args.connections):
+            payloads = []
+            for request in range(args.requests):
+                start = (connection * args.requests + request) * args.batch
+                batch = [citations[(start + offset) % len(citations)] for offset in range(args.batch)]
+                payloads.append(json.dumps({"from": "apa", "to": "ieee", "citations": batch}).encode())
+            per_client.append(payloads)
+        latencies: List[List[float]] = [[] for _ in per_client]
+        threads = [
+            threading.Thread(target=client, args=(url, payloads, bucket)) for payloads, bucket in zip(per_client, latencies)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    samples = sorted(value for bucket in latencies for value in bucket)
+    requests = len(samples)
+    print(f"{requests} requests, {args.connections} connections, {args.batch} citation(s) each, {elapsed:.2f} s")
+    print(f"{requests / elapsed:10.0f} requests/s {requests * args.batch / elapsed:10.0f} citations/s")
+    for label, share in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        print(f"{label} latency {samples[min(requests - 1, int(requests * share))] * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
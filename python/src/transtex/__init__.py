@@ -1,40 +1,124 @@
 """TransTex: Reference format conversion helpers."""
-from .bibtex import BibTeXError, parse_bibtex_entry, reference_to_bibtex
+from typing import Any
+
+from .batch import BatchResult, convert_many, format_many, parse_many
+from .bibliography import render_bibliography, sort_references
+from .bibtex import BibTeXError, iter_bibtex_entries, parse_bibtex_entry, reference_to_bibtex
+from .cache import CacheStats, ParseCache, RenderCache
+from .citations import CitationIndex, cite_keys
 from .converter import ConversionError, convert_citation, format_reference
+from .extraction import ReferenceSection, extract_references, find_reference_section
 from .formatting import (
     format_apa,
+    format_apa_intext,
     format_apa7,
+    format_apa7_intext,
     format_chicago,
+    format_chicago_intext,
     format_ieee,
+    format_ieee_intext,
     format_mla,
+    format_mla_intext,
     format_vancouver,
+    format_vancouver_intext,
 )
+from .latex import decode_latex, encode_latex
+from .normalization import normalize_citation_text
 from .parsing import (
     CitationParseError,
+    StyleDetection,
     citation_to_bibtex,
+    detect_style,
     parse_apa_citation,
     parse_citation,
     parse_ieee_citation,
 )
+from .pipeline import Pipeline, read_bib, read_citations
 from .reference import Reference
+from .segmentation import (
+    CitationPart,
+    ParsedCitation,
+    iter_citation_blocks,
+    iter_citation_parts,
+    parse_citations,
+    parse_reference_list,
+)
+from .writers import write_bibliography
+
+# The asyncio front end is imported on first use: asyncio alone costs more
+# to import than the rest of the package.
+_AIO_NAMES = ("AsyncBatcher", "aconvert", "aconvert_many", "aformat", "aformat_many", "aparse", "aparse_many")
 
 __all__ = [
+    "AsyncBatcher",
+    "BatchResult",
     "BibTeXError",
+    "CacheStats",
+    "CitationIndex",
     "CitationParseError",
+    "CitationPart",
     "ConversionError",
+    "ParseCache",
+    "ParsedCitation",
+    "Pipeline",
+    "ReferenceSection",
+    "StyleDetection",
     "citation_to_bibtex",
+    "cite_keys",
     "convert_citation",
+    "convert_many",
+    "decode_latex",
+    "encode_latex",
+    "detect_style",
+    "extract_references",
+    "find_reference_section",
     "format_reference",
+    "format_many",
+    "iter_bibtex_entries",
+    "iter_citation_blocks",
+    "iter_citation_parts",
+    "normalize_citation_text",
     "Reference",
+    "aconvert",
+    "aconvert_many",
+    "aformat",
+    "aformat_many",
+    "aparse",
+    "aparse_many",
+    "RenderCache",
     "parse_bibtex_entry",
+    "parse_citations",
+    "parse_many",
+    "parse_reference_list",
+    "read_bib",
+    "read_citations",
     "reference_to_bibtex",
+    "render_bibliography",
+    "sort_references",
+    "write_bibliography",
     "format_chicago",
+    "format_chicago_intext",
     "format_apa",
+    "format_apa_intext",
     "format_apa7",
+    "format_apa7_intext",
     "format_ieee",
+    "format_ieee_intext",
     "format_mla",
+    "format_mla_intext",
     "format_vancouver",
+    "format_vancouver_intext",
     "parse_citation",
     "parse_apa_citation",
     "parse_ieee_citation",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _AIO_NAMES:
+        from . import aio
+
+        value = getattr(aio, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,4 @@
+"""Allow ``python -m transtex``."""
+from .cli import main
+
+raise SystemExit(main())
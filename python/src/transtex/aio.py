@@ -0,0 +1,329 @@
+"""Asyncio front end that batches concurrent calls onto an executor."""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from .batch import (
+    DEFAULT_CHUNKSIZE,
+    BatchResult,
+    _capture,
+    _chunks,
+    _convert_chunk_captured,
+    _format_chunk_captured,
+    _formatter_style,
+    _parse_chunk_captured,
+    _parser_style,
+)
+from .converter import ConversionError
+from .parsing import CitationParseError
+from .reference import Reference
+
+Items = Union[Iterable[Any], AsyncIterable[Any]]
+_Task = Callable[[List[Any]], List[BatchResult]]
+
+
+class _Batch:
+    """Calls waiting for the same operation, flushed as one executor job."""
+
+    def __init__(self, task: _Task) -> None:
+        self.task = task
+        self.items: List[Any] = []
+        self.futures: List[asyncio.Future[BatchResult]] = []
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class _LoopState:
+    def __init__(self, max_queued: int) -> None:
+        self.batches: Dict[Tuple[str, ...], _Batch] = {}
+        self.slots = asyncio.Semaphore(max_queued)
+
+
+class AsyncBatcher:
+    """Run parse/format/convert calls from coroutines without blocking the loop.
+
+    Calls made within ``window`` seconds of each other for the same styles
+    are collected and submitted to the executor as one job of at most
+    ``max_batch`` items, so per-call executor overhead is paid once per
+    batch. At most ``max_queued`` calls wait at a time; further callers
+    are suspended until earlier ones finish, which keeps memory bounded
+    under load. Without an ``executor`` a thread pool of ``max_workers``
+    threads is created and shut down by :meth:`close`; pass a
+    ``ProcessPoolExecutor`` to use several cores, with ``max_workers`` set
+    to its size (default: the CPU count) so the streaming methods keep
+    every worker busy.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        *,
+        max_workers: Optional[int] = None,
+        window: float = 0.002,
+        max_batch: int = 256,
+        max_queued: int = 4096,
+    ) -> None:
+        if max_batch < 1 or max_queued < 1:
+            raise ValueError("max_batch and max_queued must be at least 1")
+        self._owns_executor = executor is None
+        self._workers = max_workers or os.cpu_count() or 1
+        self._executor = executor or ThreadPoolExecutor(max_workers=self._workers)
+        self.window = window
+        self.max_batch = max_batch
+        self.max_queued = max_queued
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def __aenter__(self) -> "AsyncBatcher":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the executor if this batcher created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def convert(self, from_style: str, to_style: str, text: str) -> str:
+        """Async counterpart of :func:`transtex.convert_citation`."""
+        source, target = _parser_style(from_style), _formatter_style(to_style)
+        task = partial(_convert_chunk_captured, source, target)
+        result = await self._submit(("convert", source, target), task, text)
+        return _converted(result, from_style, to_style)
+
+    async def parse(self, style: str, text: str) -> Reference:
+        """Async counterpart of :func:`transtex.parse_citation`."""
+        normalized = _parser_style(style)
+        result = await self._submit(("parse", normalized), partial(_parse_chunk_captured, normalized), text)
+        if not result.ok:
+            raise CitationParseError(result.message)
+        return result.value
+
+    async def format(self, style: str, reference: Reference) -> str:
+        """Async counterpart of :func:`transtex.format_reference`."""
+        normalized = _formatter_style(style)
+        result = await self._submit(("format", normalized), partial(_format_chunk_captured, normalized), reference)
+        if not result.ok:
+            raise ConversionError(f"Failed to format citation as {style} style: {result.message}")
+        return result.value
+
+    def convert_many(
+        self,
+        from_style: str,
+        to_style: str,
+        texts: Items,
+        *,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        errors: str = "raise",
+    ) -> AsyncIterator[Any]:
+        """Convert a (sync or async) stream of citations, yielding results in order.
+
+        Input is read in chunks of ``chunksize``; each chunk is one executor
+        job and only two chunks per worker are in flight, so a slow consumer
+        stops the input from being read further. Failures raise
+        :class:`ConversionError`, or yield :class:`BatchResult` values with
+        ``errors="capture"``.
+        """
+        capture = _capture(errors)
+        source, target = _parser_style(from_style), _formatter_style(to_style)
+        task = partial(_convert_chunk_captured, source, target)
+        unwrap = partial(_converted, from_style=from_style, to_style=to_style)
+        return self._stream(task, texts, chunksize, None if capture else unwrap)
+
+    def parse_many(
+        self, style: str, texts: Items, *, chunksize: int = DEFAULT_CHUNKSIZE, errors: str = "raise"
+    ) -> AsyncIterator[Any]:
+        """Parse a stream of citations; see :meth:`convert_many`."""
+        capture = _capture(errors)
+        task = partial(_parse_chunk_captured, _parser_style(style))
+        return self._stream(task, texts, chunksize, None if capture else _parsed)
+
+    def format_many(
+        self, style: str, references: Items, *, chunksize: int = DEFAULT_CHUNKSIZE, errors: str = "raise"
+    ) -> AsyncIterator[Any]:
+        """Format a stream of references; see :meth:`convert_many`."""
+        capture = _capture(errors)
+        task = partial(_format_chunk_captured, _formatter_style(style))
+        unwrap = partial(_formatted, style=style)
+        return self._stream(task, references, chunksize, None if capture else unwrap)
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState(self.max_queued)
+        return state
+
+    async def _submit(self, key: Tuple[str, ...], task: _Task, item: Any) -> BatchResult:
+        state = self._state()
+        async with state.slots:
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future[BatchResult] = loop.create_future()
+            batch = state.batches.get(key)
+            if batch is None:
+                batch = state.batches[key] = _Batch(task)
+                batch.handle = loop.call_later(self.window, self._flush, state, key)
+            batch.items.append(item)
+            batch.futures.append(future)
+            if len(batch.items) >= self.max_batch:
+                self._flush(state, key)
+            return await future
+
+    def _flush(self, state: _LoopState, key: Tuple[str, ...]) -> None:
+        batch = state.batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        job = asyncio.get_running_loop().run_in_executor(self._executor, batch.task, batch.items)
+        job.add_done_callback(partial(_deliver, batch.futures))
+
+    def _stream(
+        self,
+        task: _Task,
+        items: Items,
+        chunksize: int,
+        unwrap: Optional[Callable[[BatchResult], Any]],
+    ) -> AsyncIterator[Any]:
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+        return self._iterate(task, items, chunksize, unwrap)
+
+    async def _iterate(
+        self,
+        task: _Task,
+        items: Items,
+        chunksize: int,
+        unwrap: Optional[Callable[[BatchResult], Any]],
+    ) -> AsyncIterator[Any]:
+        loop = asyncio.get_running_loop()
+        pending: Deque[asyncio.Future[List[BatchResult]]] = deque()
+        chunks = _achunks(items, chunksize).__aiter__()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self._workers * 2:
+                    try:
+                        chunk = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.append(loop.run_in_executor(self._executor, task, chunk))
+                if not pending:
+                    return
+                for result in await pending.popleft():
+                    yield result if unwrap is None else unwrap(result)
+        finally:
+            for job in pending:
+                job.cancel()
+
+
+def _deliver(futures: List[asyncio.Future[BatchResult]], job: asyncio.Future[List[BatchResult]]) -> None:
+    if job.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+    error = job.exception()
+    if error is not None:
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+        return
+    for future, result in zip(futures, job.result()):
+        if not future.done():
+            future.set_result(result)
+
+
+async def _achunks(items: Items, size: int) -> AsyncIterator[List[Any]]:
+    if not isinstance(items, AsyncIterable):
+        for chunk in _chunks(items, size):
+            yield chunk
+        return
+    chunk: List[Any] = []
+    async for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _converted(result: BatchResult, from_style: str, to_style: str) -> str:
+    if result.ok:
+        return result.value
+    style = from_style if result.stage == "parse" else to_style
+    raise ConversionError(f"Failed to {result.stage} citation as {style} style: {result.message}")
+
+
+def _parsed(result: BatchResult) -> Reference:
+    if result.ok:
+        return result.value
+    raise CitationParseError(result.message)
+
+
+def _formatted(result: BatchResult, style: str) -> str:
+    if result.ok:
+        return result.value
+    raise ConversionError(f"Failed to format citation as {style} style: {result.message}")
+
+
+_DEFAULT: Optional[AsyncBatcher] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def _default() -> AsyncBatcher:
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = AsyncBatcher()
+        return _DEFAULT
+
+
+async def aconvert(from_style: str, to_style: str, text: str) -> str:
+    """Convert a citation on the shared :class:`AsyncBatcher`."""
+    return await _default().convert(from_style, to_style, text)
+
+
+async def aparse(style: str, text: str) -> Reference:
+    """Parse a citation on the shared :class:`AsyncBatcher`."""
+    return await _default().parse(style, text)
+
+
+async def aformat(style: str, reference: Reference) -> str:
+    """Format a reference on the shared :class:`AsyncBatcher`."""
+    return await _default().format(style, reference)
+
+
+def aconvert_many(from_style: str, to_style: str, texts: Items, **options: Any) -> AsyncIterator[Any]:
+    """Stream conversions on the shared :class:`AsyncBatcher`."""
+    return _default().convert_many(from_style, to_style, texts, **options)
+
+
+def aparse_many(style: str, texts: Items, **options: Any) -> AsyncIterator[Any]:
+    """Stream parses on the shared :class:`AsyncBatcher`."""
+    return _default().parse_many(style, texts, **options)
+
+
+def aformat_many(style: str, references: Items, **options: Any) -> AsyncIterator[Any]:
+    """Stream formatted references on the shared :class:`AsyncBatcher`."""
+    return _default().format_many(style, references, **options)
+
+
+__all__ = [
+    "AsyncBatcher",
+    "aconvert",
+    "aconvert_many",
+    "aformat",
+    "aformat_many",
+    "aparse",
+    "aparse_many",
+]
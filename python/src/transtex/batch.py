@@ -0,0 +1,356 @@
+"""Parse, format and convert many citations on a process or thread pool."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+from .bibtex import BibTeXError, parse_bibtex_entry
+from .converter import _FORMATTERS, ConversionError, convert_citation, format_reference
+from .detection import detect_style
+from .normalization import normalize_citation_text
+from .parsers import shared
+from .parsing import _PARSERS, parse_citation
+from .reference import Reference
+
+DEFAULT_CHUNKSIZE = 64
+
+# Error codes reported by BatchResult.code.
+EMPTY_INPUT = "empty_input"
+TOO_LONG = "too_long"
+UNDETECTED_STYLE = "undetected_style"
+PARSE_FAILED = "parse_failed"
+FORMAT_FAILED = "format_failed"
+READ_FAILED = "read_failed"
+
+
+@dataclass(frozen=True, slots=True)
+class BatchResult:
+    """Outcome of one item of a batch run with ``errors="capture"``.
+
+    Successful items carry ``value``; failed ones carry an error ``code``, a
+    ``message`` and the ``stage`` (``"parse"`` or ``"format"``) that failed;
+    the command line also reports input it could not read at stage
+    ``"read"``.
+    """
+
+    value: Any = None
+    code: Optional[str] = None
+    message: Optional[str] = None
+    stage: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.code is None
+
+
+def parse_many(
+    style: str,
+    texts: Iterable[str],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    errors: str = "raise",
+    executor: str = "process",
+) -> Iterator[Any]:
+    """Parse citation strings in ``style`` on ``workers`` processes or threads.
+
+    See :func:`convert_many` for the batching options.
+    """
+    if _capture(errors):
+        task = partial(_parse_chunk_captured, _parser_style(style))
+    else:
+        task = partial(_parse_chunk, style)
+    return _run(task, texts, workers, chunksize, ordered, executor)
+
+
+def format_many(
+    style: str,
+    references: Iterable[Reference],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    errors: str = "raise",
+    executor: str = "process",
+) -> Iterator[Any]:
+    """Format references in ``style`` on ``workers`` processes or threads.
+
+    See :func:`convert_many` for the batching options.
+    """
+    if _capture(errors):
+        task = partial(_format_chunk_captured, _formatter_style(style))
+    else:
+        task = partial(_format_chunk, style)
+    return _run(task, references, workers, chunksize, ordered, executor)
+
+
+def convert_many(
+    from_style: str,
+    to_style: str,
+    texts: Iterable[str],
+    *,
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    errors: str = "raise",
+    executor: str = "process",
+) -> Iterator[Any]:
+    """Convert citation strings from one style to another on a worker pool.
+
+    Input is consumed lazily in chunks of ``chunksize`` items, and only a
+    few chunks per worker are in flight at a time, so arbitrarily long
+    iterables run in bounded memory. ``workers`` defaults to the CPU count;
+    ``workers=1`` runs in the calling process without a pool. With
+    ``ordered=True`` results are yielded in input order; with
+    ``ordered=False`` ``(index, result)`` pairs are yielded as chunks
+    finish.
+
+    By default the first failure raises its :class:`ConversionError`. With
+    ``errors="capture"`` every item yields a :class:`BatchResult` instead,
+    and failing items stay cheap: empty, oversized and undetectable input is
+    rejected without raising, and parser errors are reduced to a code and
+    message where they occur rather than wrapped and chained. Unsupported
+    styles are rejected before any input is read.
+
+    ``executor="process"`` (the default) runs chunks on a process pool;
+    ``executor="thread"`` uses a thread pool, which avoids pickling items
+    and results and scales across cores on free-threaded CPython builds.
+    Every function in the library is safe to call from several threads at
+    once; the module-level memo tables are guarded by locks.
+    """
+    if _capture(errors):
+        task = partial(_convert_chunk_captured, _parser_style(from_style), _formatter_style(to_style))
+    else:
+        task = partial(_convert_chunk, from_style, to_style)
+    return _run(task, texts, workers, chunksize, ordered, executor)
+
+
+def _parse_chunk(style: str, texts: List[str]) -> List[Reference]:
+    return [parse_citation(style, text) for text in texts]
+
+
+def _format_chunk(style: str, references: List[Reference]) -> List[str]:
+    return [format_reference(style, reference) for reference in references]
+
+
+def _convert_chunk(from_style: str, to_style: str, texts: List[str]) -> List[str]:
+    return [convert_citation(from_style, to_style, text) for text in texts]
+
+
+def _capture(errors: str) -> bool:
+    if errors not in ("raise", "capture"):
+        raise ValueError("errors must be 'raise' or 'capture'")
+    return errors == "capture"
+
+
+def _parser_style(style: str) -> str:
+    normalized = style.strip().lower()
+    if normalized != "auto" and normalized not in _PARSERS:
+        supported = ", ".join(sorted([*_PARSERS, "auto"]))
+        raise ConversionError(f"Unsupported style '{style}'. Supported styles: {supported}")
+    return normalized
+
+
+def _formatter_style(style: str) -> str:
+    normalized = style.strip().lower()
+    if normalized not in _FORMATTERS:
+        supported = ", ".join(sorted(_FORMATTERS))
+        raise ConversionError(f"Unsupported style '{style}'. Supported styles: {supported}")
+    return normalized
+
+
+def _parse_one(style: str, text: str) -> BatchResult:
+    text = normalize_citation_text(text)
+    raw = text.strip()
+    if not raw:
+        return BatchResult(code=EMPTY_INPUT, message="citation is empty", stage="parse")
+    if len(raw) > shared.MAX_CITATION_LENGTH:
+        message = f"citation exceeds {shared.MAX_CITATION_LENGTH} characters"
+        return BatchResult(code=TOO_LONG, message=message, stage="parse")
+    if style == "auto":
+        detected = detect_style(text)
+        if detected.style is None:
+            return BatchResult(code=UNDETECTED_STYLE, message="could not detect the citation style", stage="parse")
+        if detected.reference is not None:
+            return BatchResult(detected.reference)
+        style = detected.style
+    try:
+        return BatchResult(_PARSERS[style](text))
+    except ValueError as exc:
+        return BatchResult(code=PARSE_FAILED, message=str(exc), stage="parse")
+
+
+def _format_one(style: str, reference: Reference) -> BatchResult:
+    try:
+        return BatchResult(_FORMATTERS[style](reference))
+    except Exception as exc:
+        return BatchResult(code=FORMAT_FAILED, message=str(exc), stage="format")
+
+
+def _parse_chunk_captured(style: str, texts: List[str]) -> List[BatchResult]:
+    return [_parse_one(style, text) for text in texts]
+
+
+def _format_chunk_captured(style: str, references: List[Reference]) -> List[BatchResult]:
+    return [_format_one(style, reference) for reference in references]
+
+
+def _convert_chunk_captured(from_style: str, to_style: str, texts: List[str]) -> List[BatchResult]:
+    results = []
+    for text in texts:
+        parsed = _parse_one(from_style, text)
+        results.append(_format_one(to_style, parsed.value) if parsed.ok else parsed)
+    return results
+
+
+def _format_bibtex_chunk_captured(style: str, decode_latex: bool, entries: List[str]) -> List[BatchResult]:
+    results = []
+    for entry in entries:
+        try:
+            reference = parse_bibtex_entry(entry, decode_latex=decode_latex)
+        except BibTeXError as exc:
+            results.append(BatchResult(code=PARSE_FAILED, message=str(exc), stage="parse"))
+            continue
+        results.append(_format_one(style, reference))
+    return results
+
+
+def _read_failed(name: str, exc: UnicodeDecodeError) -> BatchResult:
+    return BatchResult(code=READ_FAILED, message=f"not valid UTF-8 ({exc}); rest of {name} skipped", stage="read")
+
+
+def _warm_up() -> None:
+    # Import every style module and compile the lexer before the first chunk
+    # arrives instead of inside it.
+    from . import formatters, parsers  # noqa: F401
+    from .parsers import lexer  # noqa: F401
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    # Forking a process that runs threads (an asyncio executor, a web server)
+    # can deadlock the child; start workers from a clean server process.
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_warm_up)
+
+
+_EXECUTORS: dict[str, Callable[[int], Executor]] = {
+    "process": _process_pool,
+    "thread": lambda workers: ThreadPoolExecutor(max_workers=workers),
+}
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _run(
+    task: Callable[[List[Any]], List[Any]],
+    items: Iterable[Any],
+    workers: Optional[int],
+    chunksize: int,
+    ordered: bool,
+    executor: str = "process",
+) -> Iterator[Any]:
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if executor not in _EXECUTORS:
+        raise ValueError("executor must be 'process' or 'thread'")
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if workers == 1:
+        return _run_inline(task, items, chunksize, ordered)
+    return _run_pool(
+        partial(_EXECUTORS[executor], workers),
+        workers,
+        task,
+        items,
+        chunksize,
+        ordered,
+    )
+
+
+def _run_inline(
+    task: Callable[[List[Any]], List[Any]],
+    items: Iterable[Any],
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    offset = 0
+    for chunk in _chunks(items, chunksize):
+        results = task(chunk)
+        if ordered:
+            yield from results
+        else:
+            yield from enumerate(results, offset)
+        offset += len(chunk)
+
+
+def _run_pool(
+    make_executor: Callable[[], Executor],
+    workers: int,
+    task: Callable[[List[Any]], List[Any]],
+    items: Iterable[Any],
+    chunksize: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    max_pending = workers * 2
+    with make_executor() as executor:
+        chunks = _chunks(items, chunksize)
+        pending: Deque[Tuple[int, Future[List[Any]]]] = deque()
+        offset = 0
+
+        def submit_next() -> bool:
+            nonlocal offset
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            pending.append((offset, executor.submit(task, chunk)))
+            offset += len(chunk)
+            return True
+
+        while len(pending) < max_pending and submit_next():
+            pass
+        try:
+            while pending:
+                if ordered:
+                    _, future = pending.popleft()
+                    results = future.result()
+                    submit_next()
+                    yield from results
+                    continue
+                done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                finished = [entry for entry in pending if entry[1] in done]
+                for entry in finished:
+                    pending.remove(entry)
+                for start, future in finished:
+                    results = future.result()
+                    submit_next()
+                    yield from enumerate(results, start)
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+__all__ = [
+    "BatchResult",
+    "DEFAULT_CHUNKSIZE",
+    "EMPTY_INPUT",
+    "FORMAT_FAILED",
+    "PARSE_FAILED",
+    "TOO_LONG",
+    "UNDETECTED_STYLE",
+    "convert_many",
+    "format_many",
+    "parse_many",
+]
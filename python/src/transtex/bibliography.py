@@ -0,0 +1,145 @@
+"""Render ordered reference lists with year disambiguation."""
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+
+from .cache import RenderCache
+from .converter import ConversionError, _FORMATTERS, format_reference
+from .formatters.shared import name_parts
+from .reference import Reference
+
+# Styles whose in-text citations are author-date and therefore need 2020a/2020b.
+AUTHOR_DATE_STYLES = frozenset({"apa", "apa6", "apa7", "chicago"})
+# Styles whose reference lists keep citation order and carry a number.
+NUMBERED_STYLES = frozenset({"ieee", "vancouver"})
+
+# Sort keys are flattened into one string so comparisons stay in C. The group
+# separator splits each author's surname from their given names, the unit
+# separator joins authors and the record separator closes each component,
+# which orders shorter author lists before longer ones sharing a prefix.
+_GIVEN_SEPARATOR = "\x1d"
+_NAME_SEPARATOR = "\x1f"
+_FIELD_SEPARATOR = "\x1e"
+
+
+def sort_references(references: Iterable[Reference], style: str) -> List[Reference]:
+    """Return references in reference-list order for ``style``.
+
+    Author-date and MLA lists are sorted by author surnames, year and title.
+    Numbered styles keep the order the references were supplied in. For
+    author-date styles, works sharing authors and year receive ``a``/``b``
+    suffixes on copies of the references; the inputs are never modified.
+    """
+    normalized_style = _normalize_style(style)
+    items = list(references)
+    if normalized_style in NUMBERED_STYLES:
+        return items
+
+    group_keys = [_group_key(reference) for reference in items]
+    keys = [
+        f"{group}{_FIELD_SEPARATOR}{(reference.title or '').casefold()}"
+        for group, reference in zip(group_keys, items)
+    ]
+    order = sorted(range(len(items)), key=keys.__getitem__)
+    ordered = [items[index] for index in order]
+    if normalized_style not in AUTHOR_DATE_STYLES:
+        return ordered
+
+    # The group key prefixes the sort key, so colliding works are adjacent.
+    ordered_groups = [group_keys[index] for index in order]
+    run_start = 0
+    for position in range(1, len(ordered) + 1):
+        if position < len(ordered) and ordered_groups[position] == ordered_groups[run_start]:
+            continue
+        if position - run_start > 1:
+            for offset in range(position - run_start):
+                suffixed = ordered[run_start + offset].copy()
+                suffixed.year = _suffixed_year(suffixed.year, offset)
+                ordered[run_start + offset] = suffixed
+        run_start = position
+    return ordered
+
+
+def render_bibliography(
+    references: Iterable[Reference],
+    style: str,
+    cache: Optional[RenderCache] = None,
+) -> List[str]:
+    """Format a complete, ordered reference list in ``style``.
+
+    Numbered styles are prefixed with their label (``[1]`` for IEEE,
+    ``1.`` for Vancouver).
+    """
+    normalized_style = _normalize_style(style)
+    rendered: List[str] = []
+    for number, reference in enumerate(sort_references(references, normalized_style), start=1):
+        text = format_reference(normalized_style, reference, cache=cache)
+        label = entry_label(normalized_style, number)
+        rendered.append(f"{label} {text}" if label else text)
+    return rendered
+
+
+def entry_label(style: str, number: int) -> str:
+    """Return the list label for the ``number``-th entry, or ``""``."""
+    normalized_style = style.strip().lower()
+    if normalized_style == "ieee":
+        return f"[{number}]"
+    if normalized_style == "vancouver":
+        return f"{number}."
+    return ""
+
+
+def year_suffix(offset: int) -> str:
+    """Return the disambiguation suffix for a zero-based offset (a, b, ..., z, aa, ...)."""
+    letters = ""
+    offset += 1
+    while offset:
+        offset, remainder = divmod(offset - 1, 26)
+        letters = chr(ord("a") + remainder) + letters
+    return letters
+
+
+def _group_key(reference: Reference) -> str:
+    """Return the author/year prefix shared by works that need suffixes.
+
+    Authors are keyed on surname and then given names, so different people
+    sharing a surname neither collide nor lose surname order.
+    """
+    names = _NAME_SEPARATOR.join(_author_key(author) for author in reference.normalized_authors())
+    if not names:
+        names = (reference.title or "").casefold()
+    year = (reference.year or "").strip()
+    # Undated works ("n.d.") sort ahead of dated ones.
+    year_rank = "1" if year[:4].isdigit() else "0"
+    return f"{names}{_FIELD_SEPARATOR}{year_rank}{year}"
+
+
+def _author_key(author: str) -> str:
+    surname, given = name_parts(author)
+    given_names = " ".join(part.strip(".") for part in given)
+    return f"{surname or author}{_GIVEN_SEPARATOR}{given_names}".casefold()
+
+
+def _suffixed_year(year: Optional[str], offset: int) -> str:
+    suffix = year_suffix(offset)
+    if year and year.strip():
+        return f"{year.strip()}{suffix}"
+    return f"n.d.-{suffix}"
+
+
+def _normalize_style(style: str) -> str:
+    normalized_style = style.strip().lower()
+    if normalized_style not in _FORMATTERS:
+        supported = ", ".join(sorted(_FORMATTERS.keys()))
+        raise ConversionError(f"Unsupported style '{style}'. Supported styles: {supported}")
+    return normalized_style
+
+
+__all__ = [
+    "AUTHOR_DATE_STYLES",
+    "NUMBERED_STYLES",
+    "entry_label",
+    "render_bibliography",
+    "sort_references",
+    "year_suffix",
+]
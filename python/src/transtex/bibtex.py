@@ -1,17 +1,31 @@
 """Utility helpers for parsing and writing BibTeX entries."""
 from __future__ import annotations
 
-from typing import Dict, Tuple
+import io
+from typing import Dict, Iterable, Iterator, Tuple, Union
 
+from . import latex
 from .reference import Reference
 
+# Identifiers are kept verbatim when LaTeX is decoded or encoded: ``--``,
+# ``~`` and ``_`` are common in URLs and DOIs.
+_VERBATIM_FIELDS = frozenset({"doi", "url", "eprint", "file"})
+# Entry types that carry no reference.
+_NON_REFERENCE_TYPES = frozenset({"comment", "preamble", "string"})
+
 
 class BibTeXError(ValueError):
     """Raised when the library cannot parse a BibTeX entry."""
 
 
-def parse_bibtex_entry(entry: str) -> Reference:
-    """Parse a single BibTeX entry into a :class:`Reference`."""
+def parse_bibtex_entry(entry: str, *, decode_latex: bool = False) -> Reference:
+    """Parse a single BibTeX entry into a :class:`Reference`.
+
+    With ``decode_latex`` set, accents, escaped specials, dashes and other
+    LaTeX markup in field values are turned into Unicode (see
+    :func:`transtex.latex.decode_latex`); DOI, URL, eprint and file fields are
+    left verbatim.
+    """
     text = entry.strip()
     if not text:
         raise BibTeXError("Empty BibTeX entry")
@@ -37,12 +51,48 @@ def parse_bibtex_entry(entry: str) -> Reference:
     if not cite_key:
         raise BibTeXError("Entry cite key is missing")
 
-    fields = _parse_fields(field_blob)
+    fields = _parse_fields(field_blob, decode_latex)
     return _reference_from_fields(entry_type, cite_key, fields)
 
 
-def reference_to_bibtex(reference: Reference) -> str:
-    """Serialize a :class:`Reference` back into a BibTeX entry."""
+def iter_bibtex_entries(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Yield the text of each entry in a .bib file, one at a time.
+
+    ``source`` is a string or any iterable of lines, such as an open file,
+    read lazily so only the current entry is held in memory. An entry runs
+    from a line starting with ``@`` until its braces balance; text between
+    entries and ``@comment``, ``@preamble`` and ``@string`` blocks are
+    skipped. An unterminated final entry is yielded as is so that
+    :func:`parse_bibtex_entry` reports it.
+    """
+    lines = io.StringIO(source) if isinstance(source, str) else source
+    buffer: list[str] = []
+    depth = 0
+    opened = False
+    for line in lines:
+        if not buffer and not line.lstrip().startswith("@"):
+            continue
+        buffer.append(line)
+        opens = line.count("{")
+        opened = opened or opens > 0
+        depth += opens - line.count("}")
+        if opened and depth <= 0:
+            entry = "".join(buffer).strip()
+            buffer, depth, opened = [], 0, False
+            if entry[1 : entry.find("{")].strip().lower() not in _NON_REFERENCE_TYPES:
+                yield entry
+    if buffer:
+        yield "".join(buffer).strip()
+
+
+def reference_to_bibtex(reference: Reference, *, encode_latex: bool = False) -> str:
+    """Serialize a :class:`Reference` back into a BibTeX entry.
+
+    With ``encode_latex`` set, values are made safe for legacy BibTeX
+    toolchains (see :func:`transtex.latex.encode_latex`): specials are
+    escaped, Unicode is spelled as LaTeX and unbalanced braces are escaped.
+    DOI, URL, eprint and file fields are written verbatim.
+    """
     fields = reference.merged_fields()
     order = [
         "author",
@@ -64,6 +114,11 @@ def reference_to_bibtex(reference: Reference) -> str:
             ordered_items.append((key, value))
     for key in sorted(fields.keys()):
         ordered_items.append((key, fields[key]))
+    if encode_latex:
+        ordered_items = [
+            (key, value if key in _VERBATIM_FIELDS else latex.encode_latex(value))
+            for key, value in ordered_items
+        ]
 
     if not ordered_items:
         body = ""
@@ -75,7 +130,7 @@ def reference_to_bibtex(reference: Reference) -> str:
     return f"@{reference.entry_type}{{{reference.cite_key},{body}}}"
 
 
-def _parse_fields(blob: str) -> Dict[str, str]:
+def _parse_fields(blob: str, decode_latex: bool = False) -> Dict[str, str]:
     fields: Dict[str, str] = {}
     idx = 0
     length = len(blob)
@@ -101,6 +156,8 @@ def _parse_fields(blob: str) -> Dict[str, str]:
             idx += 1
         value, idx = _consume_value(blob, idx)
         cleaned = _clean_value(value)
+        if decode_latex and name not in _VERBATIM_FIELDS:
+            cleaned = latex.decode_latex(cleaned)
         fields[name] = cleaned
 
         while idx < length and blob[idx].isspace():
@@ -222,4 +279,4 @@ def _split_authors(raw: str) -> list[str]:
     return [author.strip() for author in raw.split(" and ") if author.strip()]
 
 
-__all__ = ["BibTeXError", "parse_bibtex_entry", "reference_to_bibtex"]
+__all__ = ["BibTeXError", "iter_bibtex_entries", "parse_bibtex_entry", "reference_to_bibtex"]
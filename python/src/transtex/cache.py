@@ -0,0 +1,316 @@
+"""Content-addressed caching for rendered citations."""
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from .reference import Reference
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_REFERENCE_FIELDS = tuple(item.name for item in fields(Reference))
+_VERSION_CACHE: Dict[str, str] = {}
+_VERSION_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Hit/miss counters reported by the caches in this module."""
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """Small thread-safe least-recently-used mapping."""
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, size=len(self._data))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def reference_digest(reference: Reference) -> str:
+    """Return a stable content digest for every field of ``reference``."""
+    values = []
+    for name in _REFERENCE_FIELDS:
+        value = getattr(reference, name)
+        if isinstance(value, dict):
+            value = sorted(value.items())
+        values.append(value)
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def formatter_version(formatter: Callable[[Reference], str]) -> str:
+    """Return a digest of the source files a formatter depends on.
+
+    The digest covers the formatter's own module plus the shared formatter
+    helpers and the :class:`Reference` definition, so editing any of them
+    invalidates previously cached output.
+    """
+    module_name = formatter.__module__
+    with _VERSION_LOCK:
+        cached = _VERSION_CACHE.get(module_name)
+    if cached is not None:
+        return cached
+    hasher = hashlib.blake2b(digest_size=16)
+    for name in (module_name, f"{__package__}.formatters.shared", f"{__package__}.reference"):
+        module = sys.modules.get(name)
+        source = getattr(module, "__file__", None)
+        if source and Path(source).exists():
+            hasher.update(Path(source).read_bytes())
+        else:
+            hasher.update(name.encode("utf-8"))
+    version = hasher.hexdigest()
+    with _VERSION_LOCK:
+        _VERSION_CACHE[module_name] = version
+    return version
+
+
+_DASHES = re.compile("[\u2010-\u2015\u2212]")
+
+
+def citation_cache_key(text: str) -> str:
+    """Return ``text`` with whitespace runs collapsed and dash variants as ``-``."""
+    key = " ".join(text.split())
+    # str.translate is slow on non-ASCII text; a compiled class is not.
+    return key if key.isascii() else _DASHES.sub("-", key)
+
+
+class ParseCache:
+    """Bounded cache of parsed citations keyed on ``(style, canonical text)``.
+
+    Citation strings that differ only in whitespace or dash characters share
+    an entry. The canonical text from :func:`citation_cache_key` is both the
+    key and what the parser sees, so a hit returns exactly what the first
+    caller got, whichever variant it passed; dashes in titles come back as
+    ``-``. Every lookup returns a fresh copy of the cached
+    :class:`Reference`, so callers may mutate results freely.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._entries: LRUCache[Tuple[str, str], Reference] = LRUCache(maxsize)
+
+    def parse(self, style: str, text: str, parser: Callable[[str], Reference]) -> Reference:
+        """Return a copy of the cached parse of ``text`` or run ``parser`` on its canonical form."""
+        canonical = citation_cache_key(text)
+        key = (style, canonical)
+        cached = self._entries.get(key)
+        if cached is not None:
+            return cached.copy()
+        reference = parser(canonical)
+        self._entries.put(key, reference.copy())
+        return reference
+
+    def stats(self) -> CacheStats:
+        return self._entries.stats()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RenderCache:
+    """Two-tier cache of formatted citations.
+
+    Entries are keyed by ``(formatter, formatter version, reference digest)``.
+    Lookups consult an in-memory LRU tier first and, when ``path`` is given,
+    a SQLite database that persists between runs. Rows written by an older
+    version of a formatter module are purged the first time that formatter
+    is used against the database.
+
+    New rows are written to SQLite in batches of ``_FLUSH_EVERY``. Call
+    :meth:`close` (or use the cache as a context manager) to write the rest;
+    a cache that is dropped or still open at interpreter exit flushes them
+    from a finalizer as a last resort.
+    """
+
+    _FLUSH_EVERY = 256
+
+    def __init__(self, path: str | Path | None = None, *, maxsize: int = 4096) -> None:
+        self._memory: LRUCache[Tuple[str, str, str], str] = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str, str], str] = {}
+        self._checked: set[Tuple[str, str]] = set()
+        self._hits = 0
+        self._misses = 0
+        self._connection: sqlite3.Connection | None = None
+        if path is not None:
+            self._connection = sqlite3.connect(str(path), check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS renders ("
+                " formatter TEXT NOT NULL,"
+                " version TEXT NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " output TEXT NOT NULL,"
+                " PRIMARY KEY (formatter, version, digest))"
+            )
+            self._connection.commit()
+            self._finalizer = weakref.finalize(self, _flush_and_close, self._connection, self._pending, self._lock)
+
+    def render(self, formatter: Callable[[Reference], str], reference: Reference) -> str:
+        """Return the cached rendering of ``reference`` or format and store it."""
+        formatter_id = f"{formatter.__module__}.{formatter.__qualname__}"
+        key = (formatter_id, formatter_version(formatter), reference_digest(reference))
+        cached = self._memory.get(key)
+        if cached is None and self._connection is not None:
+            cached = self._load(key)
+            if cached is not None:
+                self._memory.put(key, cached)
+        with self._lock:
+            if cached is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if cached is not None:
+            return cached
+
+        output = formatter(reference)
+        self._memory.put(key, output)
+        if self._connection is not None:
+            self._store(key, output)
+        return output
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, size=len(self._memory))
+
+    def flush(self) -> None:
+        """Write pending rows to the SQLite tier."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Write pending rows and close the SQLite tier."""
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection = None
+        self._finalizer()
+
+    def __enter__(self) -> "RenderCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _load(self, key: Tuple[str, str, str]) -> Optional[str]:
+        formatter_id, version, digest = key
+        with self._lock:
+            assert self._connection is not None
+            self._purge_stale_locked(formatter_id, version)
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+            row = self._connection.execute(
+                "SELECT output FROM renders WHERE formatter = ? AND version = ? AND digest = ?",
+                (formatter_id, version, digest),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _store(self, key: Tuple[str, str, str], output: str) -> None:
+        with self._lock:
+            self._pending[key] = output
+            if len(self._pending) >= self._FLUSH_EVERY:
+                self._flush_locked()
+
+    def _purge_stale_locked(self, formatter_id: str, version: str) -> None:
+        marker = (formatter_id, version)
+        if marker in self._checked or self._connection is None:
+            return
+        self._connection.execute(
+            "DELETE FROM renders WHERE formatter = ? AND version <> ?",
+            (formatter_id, version),
+        )
+        self._connection.commit()
+        self._checked.add(marker)
+
+    def _flush_locked(self) -> None:
+        if self._connection is not None:
+            _write_pending(self._connection, self._pending)
+
+
+def _write_pending(connection: sqlite3.Connection, pending: Dict[Tuple[str, str, str], str]) -> None:
+    if not pending:
+        return
+    connection.executemany(
+        "INSERT OR REPLACE INTO renders (formatter, version, digest, output) VALUES (?, ?, ?, ?)",
+        [(*key, output) for key, output in pending.items()],
+    )
+    connection.commit()
+    pending.clear()
+
+
+def _flush_and_close(
+    connection: sqlite3.Connection, pending: Dict[Tuple[str, str, str], str], lock: threading.Lock
+) -> None:
+    # Runs from RenderCache.close() or, if that was never called, when the
+    # cache is collected or the interpreter exits; it must not hold ``self``.
+    with lock:
+        _write_pending(connection, pending)
+        connection.close()
+
+
+__all__ = [
+    "CacheStats",
+    "LRUCache",
+    "ParseCache",
+    "RenderCache",
+    "citation_cache_key",
+    "formatter_version",
+    "reference_digest",
+]
@@ -0,0 +1,170 @@
+"""Checkpoints that let a long batch job resume where it stopped.
+
+A checkpoint pairs a position in the input files with the size of the
+output written up to that position. Resuming truncates the output to that
+size and continues reading from that position, so an interrupted job that
+is resumed produces the same bytes as one that ran straight through.
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from .batch import BatchResult, _read_failed
+from .bibtex import iter_bibtex_entries
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+@dataclass(frozen=True)
+class InputPosition:
+    """A point in a sequence of input files, just after one record.
+
+    ``offset`` is in bytes from the start of file number ``file``; ``line``
+    and ``entry`` count the lines and BibTeX entries read from it so far,
+    so record labels carry on from the right numbers.
+    """
+
+    file: int = 0
+    offset: int = 0
+    line: int = 0
+    entry: int = 0
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Progress of a job: input read, items done and output bytes written.
+
+    ``job`` describes the job (command, options, inputs and output) so that
+    a checkpoint is never applied to a different one.
+    """
+
+    job: Dict[str, Any]
+    position: InputPosition = field(default_factory=InputPosition)
+    items: int = 0
+    failed: int = 0
+    output_offset: int = 0
+
+
+def save_checkpoint(path: PathLike, checkpoint: Checkpoint) -> None:
+    """Write ``checkpoint`` to ``path`` atomically.
+
+    The file is written and synced under a temporary name and then renamed
+    over the previous checkpoint, so a crash leaves either the old or the
+    new checkpoint, never a mix. Sync the output before calling this.
+    """
+    target = Path(path)
+    temporary = target.with_name(f".{target.name}.tmp")
+    with open(temporary, "w", encoding="utf-8") as handle:
+        json.dump(asdict(checkpoint), handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, target)
+
+
+def load_checkpoint(path: PathLike) -> Optional[Checkpoint]:
+    """Read the checkpoint at ``path``, or return ``None`` if there is none."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        return None
+    return Checkpoint(
+        job=data["job"],
+        position=InputPosition(**data["position"]),
+        items=data["items"],
+        failed=data["failed"],
+        output_offset=data["output_offset"],
+    )
+
+
+def describe_inputs(paths: Sequence[str]) -> list[Dict[str, Any]]:
+    """Identify input files by absolute path, size and modification time."""
+    described = []
+    for path in paths:
+        stat = os.stat(path)
+        described.append({"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+    return described
+
+
+def iter_lines(
+    paths: Sequence[str], start: InputPosition = InputPosition()
+) -> Iterator[Tuple[str, Union[str, BatchResult], InputPosition]]:
+    """Yield ``(label, line, position)`` for each non-blank line, from ``start`` on.
+
+    A file that is not valid UTF-8 yields a failed
+    :class:`~transtex.batch.BatchResult` in place of the first bad line,
+    positioned at the start of the next file, so the failure is recorded
+    once and a resumed job carries on after it.
+    """
+    for index, path, lines in _read(paths, start):
+        position = start if index == start.file else InputPosition(file=index)
+        try:
+            for position, line in lines:
+                text = line.strip()
+                if text:
+                    yield f"{path}:{position.line}", text, position
+        except UnicodeDecodeError as exc:
+            yield f"{path}:{position.line + 1}", _read_failed(path, exc), InputPosition(file=index + 1)
+
+
+def iter_entries(
+    paths: Sequence[str], start: InputPosition = InputPosition()
+) -> Iterator[Tuple[str, Union[str, BatchResult], InputPosition]]:
+    """Yield ``(label, entry, position)`` for each BibTeX entry, from ``start`` on.
+
+    Undecodable files are reported as in :func:`iter_lines`.
+    """
+    for index, path, lines in _read(paths, start):
+        entry_number = start.entry if index == start.file else 0
+        last = [start]
+
+        def text() -> Iterator[str]:
+            for last[0], line in lines:
+                yield line
+
+        # iter_bibtex_entries yields an entry as soon as its closing line is
+        # read, so ``last`` is the position just after that entry.
+        try:
+            for entry in iter_bibtex_entries(text()):
+                entry_number += 1
+                yield f"{path}: entry {entry_number}", entry, replace(last[0], entry=entry_number)
+        except UnicodeDecodeError as exc:
+            yield f"{path}: entry {entry_number + 1}", _read_failed(path, exc), InputPosition(file=index + 1)
+
+
+def _read(
+    paths: Sequence[str], start: InputPosition
+) -> Iterator[Tuple[int, str, Iterator[Tuple[InputPosition, str]]]]:
+    for index in range(start.file, len(paths)):
+        begin = start if index == start.file else InputPosition(file=index)
+        with open(paths[index], "rb") as handle:
+            handle.seek(begin.offset)
+            yield index, paths[index], _decoded(handle, begin)
+
+
+def _decoded(handle: Any, begin: InputPosition) -> Iterator[Tuple[InputPosition, str]]:
+    # Lines are read as bytes so the offset after each one is exact; text
+    # mode cannot report a seekable position while it is being iterated.
+    offset, line_number = begin.offset, begin.line
+    for raw in handle:
+        offset += len(raw)
+        line_number += 1
+        line = raw.decode("utf-8")
+        if line.endswith("\r\n"):
+            line = line[:-2] + "\n"
+        yield InputPosition(begin.file, offset, line_number, begin.entry), line
+
+
+__all__ = [
+    "Checkpoint",
+    "InputPosition",
+    "describe_inputs",
+    "iter_entries",
+    "iter_lines",
+    "load_checkpoint",
+    "save_checkpoint",
+]
@@ -0,0 +1,107 @@
+"""Batch in-text citation generation against an indexed reference collection."""
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from .bibliography import NUMBERED_STYLES, sort_references
+from .converter import ConversionError, _FORMATTERS
+from .formatters.intext import (
+    apa_intext_body,
+    chicago_intext_body,
+    ieee_intext_body,
+    mla_intext_body,
+    vancouver_intext_body,
+)
+from .reference import Reference
+
+CiteKeys = Union[str, Sequence[str]]
+
+_AUTHOR_BODIES: Dict[str, Callable[[Reference, Optional[str]], str]] = {
+    "apa": partial(apa_intext_body, max_names=5),
+    "apa6": partial(apa_intext_body, max_names=5),
+    "apa7": apa_intext_body,
+    "chicago": chicago_intext_body,
+    "mla": mla_intext_body,
+}
+_NUMBER_BODIES: Dict[str, Callable[[int, Optional[str]], str]] = {
+    "ieee": ieee_intext_body,
+    "vancouver": vancouver_intext_body,
+}
+
+
+class CitationIndex:
+    """Index a reference collection by cite key for repeated in-text citations.
+
+    Year suffixes (``2020a``) match :func:`transtex.render_bibliography` for
+    the same collection, and IEEE/Vancouver numbers follow collection order.
+    The author/year part of each key is computed once and reused for every
+    later citation of that key.
+    """
+
+    def __init__(self, references: Iterable[Reference], style: str) -> None:
+        normalized_style = style.strip().lower()
+        if normalized_style not in _FORMATTERS:
+            supported = ", ".join(sorted(_FORMATTERS.keys()))
+            raise ConversionError(f"Unsupported style '{style}'. Supported styles: {supported}")
+        self.style = normalized_style
+        ordered = sort_references(references, normalized_style)
+        self._references: Dict[str, Reference] = {}
+        self._numbers: Dict[str, int] = {}
+        for number, reference in enumerate(ordered, start=1):
+            self._references.setdefault(reference.cite_key, reference)
+            self._numbers.setdefault(reference.cite_key, number)
+        self._bodies: Dict[str, str] = {}
+
+    def __contains__(self, cite_key: object) -> bool:
+        return cite_key in self._references
+
+    def __len__(self) -> int:
+        return len(self._references)
+
+    def cite(self, keys: CiteKeys, locator: Optional[str] = None) -> str:
+        """Return one in-text citation covering ``keys``.
+
+        ``locator`` (a page or page range) is attached to the last key.
+        """
+        key_list = [keys] if isinstance(keys, str) else list(keys)
+        if not key_list:
+            raise ConversionError("At least one cite key is required")
+        bodies = [self._body(key) for key in key_list[:-1]]
+        bodies.append(self._body(key_list[-1], locator))
+        if self.style == "ieee":
+            return ", ".join(f"[{body}]" for body in bodies)
+        separator = ", " if self.style in NUMBERED_STYLES else "; "
+        return f"({separator.join(bodies)})"
+
+    def cite_many(self, groups: Iterable[CiteKeys]) -> List[str]:
+        """Return one citation per entry of ``groups`` (a key or a list of keys)."""
+        return [self.cite(keys) for keys in groups]
+
+    def _body(self, cite_key: str, locator: Optional[str] = None) -> str:
+        if locator is None:
+            cached = self._bodies.get(cite_key)
+            if cached is not None:
+                return cached
+        reference = self._references.get(cite_key)
+        if reference is None:
+            raise ConversionError(f"Unknown cite key '{cite_key}'")
+        if self.style in _NUMBER_BODIES:
+            body = _NUMBER_BODIES[self.style](self._numbers[cite_key], locator)
+        else:
+            body = _AUTHOR_BODIES[self.style](reference, locator)
+        if locator is None:
+            self._bodies[cite_key] = body
+        return body
+
+
+def cite_keys(
+    references: Iterable[Reference],
+    style: str,
+    groups: Iterable[CiteKeys],
+) -> List[str]:
+    """Index ``references`` once and return a citation for every key group."""
+    return CitationIndex(references, style).cite_many(groups)
+
+
+__all__ = ["CitationIndex", "cite_keys"]
@@ -0,0 +1,440 @@
+"""Command-line interface: ``transtex format|convert|parse|serve|shard|watch``."""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from contextlib import ExitStack
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from .batch import (
+    DEFAULT_CHUNKSIZE,
+    BatchResult,
+    _convert_chunk_captured,
+    _format_bibtex_chunk_captured,
+    _parse_one,
+    _run,
+)
+from .bibtex import reference_to_bibtex
+from .checkpoint import (
+    Checkpoint,
+    InputPosition,
+    describe_inputs,
+    iter_entries,
+    iter_lines,
+    load_checkpoint,
+    save_checkpoint,
+)
+from .converter import _FORMATTERS
+from .inputs import _entries, _lines
+from .parsing import _PARSERS
+
+FORMAT_STYLES = sorted(_FORMATTERS)
+PARSE_STYLES = sorted([*_PARSERS, "auto"])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the ``transtex`` command and return its exit status.
+
+    Exit status is 0 when every item succeeded, 1 when some failed (each
+    failure is reported on stderr) and 2 for usage or I/O errors.
+    """
+    args = _build_parser().parse_args(argv)
+    if args.command == "serve":
+        return _serve(args)
+    if args.command == "shard":
+        return _shard(args)
+    if args.command == "watch":
+        return _watch(args)
+    if args.command == "format":
+        task = partial(_format_bibtex_chunk_captured, args.style, args.decode_latex)
+    elif args.command == "convert":
+        task = partial(_convert_chunk_captured, args.from_style, args.to_style)
+    else:
+        task = partial(_parse_to_bibtex, args.style, args.encode_latex)
+    separator = "\n" if args.command == "parse" else ""
+    if args.checkpoint is not None or args.resume:
+        return _run_checkpointed(args, task, separator)
+    records = _entries(args.inputs) if args.command == "format" else _lines(args.inputs)
+
+    # Labels of items handed to the pool, in input order, with the inputs
+    # that could not be read in between so they are reported in place.
+    pending: Deque[Tuple[str, Optional[BatchResult]]] = deque()
+
+    def items() -> Iterator[str]:
+        for label, item in records:
+            if isinstance(item, BatchResult):
+                pending.append((label, item))
+            else:
+                pending.append((label, None))
+                yield item
+
+    def results() -> Iterator[Tuple[str, BatchResult]]:
+        for result in _run(task, items(), args.jobs or None, args.chunksize, True, args.executor):
+            while pending[0][1] is not None:
+                yield pending.popleft()  # type: ignore[misc]
+            yield pending.popleft()[0], result
+        yield from pending  # type: ignore[misc]
+
+    return _write_results(results(), args.output, separator, args.quiet, args.command, args.chunksize)
+
+
+def _write_results(
+    results: Iterable[Tuple[str, BatchResult]],
+    output: Optional[str],
+    separator: str,
+    quiet: bool,
+    name: str,
+    flush_every: int,
+    started: Optional[float] = None,
+    checkpointer: Optional["_Checkpointer"] = None,
+) -> int:
+    resumed = checkpointer.resumed if checkpointer is not None else None
+    total, failed = (resumed.items, resumed.failed) if resumed is not None else (0, 0)
+    initial = total
+    started = time.perf_counter() if started is None else started
+    with ExitStack() as stack:
+        try:
+            mode = "a" if resumed is not None else "w"
+            out: TextIO = stack.enter_context(open(output, mode, encoding="utf-8")) if output else sys.stdout
+            for label, result in results:
+                total += 1
+                if result.ok:
+                    out.write(f"{separator if total - failed > 1 else ''}{result.value}\n")
+                else:
+                    failed += 1
+                    print(f"transtex: {label}: {result.stage} failed: {result.message}", file=sys.stderr)
+                if total % flush_every == 0:
+                    out.flush()
+                if checkpointer is not None:
+                    checkpointer.after_item(total, failed, out)
+            out.flush()
+            if checkpointer is not None:
+                checkpointer.save(total, failed, out)
+        except OSError as exc:
+            if isinstance(exc, BrokenPipeError):
+                # The reader went away (``transtex ... | head``); stop quietly.
+                devnull = os.open(os.devnull, os.O_WRONLY)
+                os.dup2(devnull, sys.stdout.fileno())
+                return 1
+            print(f"transtex: {exc}", file=sys.stderr)
+            return 2
+
+    if not quiet:
+        elapsed = time.perf_counter() - started
+        rate = (total - initial) / elapsed if elapsed > 0 else 0.0
+        resumed_note = f" ({initial} from checkpoint)" if initial else ""
+        print(
+            f"transtex: {name}: {total} items{resumed_note}, {failed} failed, "
+            f"{elapsed:.2f} s, {rate:,.0f} items/s",
+            file=sys.stderr,
+        )
+    return 1 if failed else 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="transtex", description="Convert between BibTeX and citation styles.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    format_command = commands.add_parser("format", help="format BibTeX entries in a citation style")
+    format_command.add_argument("--style", required=True, choices=FORMAT_STYLES)
+    format_command.add_argument(
+        "--decode-latex",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="turn LaTeX accents and commands into Unicode before formatting (default: off)",
+    )
+
+    convert_command = commands.add_parser("convert", help="convert citations, one per line, between styles")
+    convert_command.add_argument("--from", dest="from_style", required=True, choices=PARSE_STYLES)
+    convert_command.add_argument("--to", dest="to_style", required=True, choices=FORMAT_STYLES)
+
+    parse_command = commands.add_parser("parse", help="parse citations, one per line, into BibTeX")
+    parse_command.add_argument("--style", default="auto", choices=PARSE_STYLES)
+    parse_command.add_argument(
+        "--encode-latex", action="store_true", help="write LaTeX-safe BibTeX for legacy toolchains"
+    )
+
+    serve_command = commands.add_parser("serve", help="run the HTTP conversion service")
+    serve_command.add_argument("--host", default="127.0.0.1")
+    serve_command.add_argument("--port", type=_non_negative, default=8000, help="0 picks a free port")
+    serve_command.add_argument(
+        "--workers", type=_non_negative, default=1, help="preforked server processes; 0 uses every CPU (default: 1)"
+    )
+    serve_command.add_argument(
+        "--window", type=float, default=2.0, help="milliseconds to wait for concurrent requests to batch (default: 2)"
+    )
+    serve_command.add_argument("--max-batch", type=_positive, default=1024, help="items per coalesced batch")
+
+    watch_command = commands.add_parser("watch", help="keep formatted copies of .bib files up to date as they change")
+    watch_command.add_argument("paths", nargs="+", help=".bib files, or directories to search for them")
+    watch_command.add_argument("--style", required=True, choices=FORMAT_STYLES)
+    watch_command.add_argument("--decode-latex", action=argparse.BooleanOptionalAction, default=False)
+    watch_command.add_argument(
+        "--output-dir", help="write NAME.STYLE.txt here instead of next to each .bib file"
+    )
+    watch_command.add_argument("--interval", type=float, default=1.0, help="seconds between polls (default: 1)")
+    watch_command.add_argument("--once", action="store_true", help="update the outputs once and exit")
+    watch_command.add_argument(
+        "-j", "--jobs", type=_non_negative, default=1, help="worker count; 0 uses every CPU (default: 1)"
+    )
+    watch_command.add_argument("-q", "--quiet", action="store_true", help="only report failed entries")
+
+    shard_command = commands.add_parser("shard", help="run a format or convert job as shards in a work directory")
+    actions = shard_command.add_subparsers(dest="action", required=True)
+    split_action = actions.add_parser("split", help="split inputs into shards by cite key hash")
+    map_action = actions.add_parser("map", help="process one shard (on any host sharing the work directory)")
+    map_action.add_argument("index", type=_non_negative, help="shard number, from 0")
+    reduce_action = actions.add_parser("reduce", help="merge finished shard outputs in input order")
+    run_action = actions.add_parser("run", help="split, map every shard in its own process, and reduce")
+    run_action.add_argument(
+        "--processes", type=_positive, help="shard processes running at once (default: one per shard)"
+    )
+    for action in (split_action, run_action):
+        action.add_argument("--shards", type=_positive, required=True)
+        job = action.add_mutually_exclusive_group(required=True)
+        job.add_argument("--format", dest="style", choices=FORMAT_STYLES, help="format BibTeX entries in STYLE")
+        job.add_argument("--convert", nargs=2, metavar=("FROM", "TO"), help="convert citations, one per line")
+        action.add_argument("--decode-latex", action=argparse.BooleanOptionalAction, default=False)
+        action.add_argument("inputs", nargs="*", default=["-"], help="input files; '-' or none reads stdin")
+    for action in actions.choices.values():
+        action.add_argument("-d", "--workdir", required=True, help="work directory shared by every node")
+    for action in (reduce_action, run_action):
+        action.add_argument("-o", "--output", help="write results to this file instead of stdout")
+
+    for command in (format_command, convert_command, parse_command, map_action, run_action):
+        command.add_argument(
+            "-j", "--jobs", type=_non_negative, default=1, help="worker count; 0 uses every CPU (default: 1)"
+        )
+    for command in (format_command, convert_command, parse_command, map_action):
+        command.add_argument("--chunksize", type=_positive, default=DEFAULT_CHUNKSIZE, help="items per worker task")
+        command.add_argument("--executor", choices=("process", "thread"), default="process")
+    for command in (format_command, convert_command, parse_command):
+        command.add_argument("inputs", nargs="*", default=["-"], help="input files; '-' or none reads stdin")
+        command.add_argument("-o", "--output", help="write results to this file instead of stdout")
+        command.add_argument("--checkpoint", metavar="PATH", help="record progress in this file as the job runs")
+        command.add_argument(
+            "--checkpoint-every",
+            type=_positive,
+            default=10_000,
+            metavar="N",
+            help="items between checkpoints (default: 10000)",
+        )
+        command.add_argument(
+            "--resume", action="store_true", help="continue from the --checkpoint file if there is one"
+        )
+    for command in (format_command, convert_command, parse_command, *actions.choices.values()):
+        command.add_argument("-q", "--quiet", action="store_true", help="do not print the summary")
+    return parser
+
+
+class _Checkpointer:
+    """Save a checkpoint every ``every`` items, after syncing the output."""
+
+    def __init__(self, path: str, job: Dict[str, Any], every: int, resumed: Optional[Checkpoint]) -> None:
+        self.path = path
+        self.job = job
+        self.every = every
+        self.resumed = resumed
+        # Input position just after the item most recently written.
+        self.position = resumed.position if resumed is not None else InputPosition()
+
+    def after_item(self, total: int, failed: int, out: TextIO) -> None:
+        if total % self.every == 0:
+            self.save(total, failed, out)
+
+    def save(self, total: int, failed: int, out: TextIO) -> None:
+        out.flush()
+        os.fsync(out.fileno())
+        offset = out.buffer.tell()  # type: ignore[attr-defined]
+        save_checkpoint(self.path, Checkpoint(self.job, self.position, total, failed, offset))
+
+
+def _run_checkpointed(args: argparse.Namespace, task: Callable[[List[Any]], List[BatchResult]], separator: str) -> int:
+    if args.checkpoint is None:
+        print("transtex: --resume needs --checkpoint", file=sys.stderr)
+        return 2
+    if not args.output or "-" in args.inputs:
+        print("transtex: --checkpoint needs input files and -o (not stdin or stdout)", file=sys.stderr)
+        return 2
+    options = ("style", "from_style", "to_style", "decode_latex", "encode_latex")
+    try:
+        job = {
+            "command": args.command,
+            "options": {name: value for name, value in vars(args).items() if name in options},
+            "inputs": describe_inputs(args.inputs),
+            "output": os.path.abspath(args.output),
+        }
+        resumed = load_checkpoint(args.checkpoint) if args.resume else None
+        if resumed is not None:
+            if resumed.job != job:
+                print(
+                    f"transtex: {args.checkpoint} is for a different job, or the inputs have changed",
+                    file=sys.stderr,
+                )
+                return 2
+            if os.path.getsize(args.output) < resumed.output_offset:
+                print(f"transtex: {args.output} is shorter than {args.checkpoint} records", file=sys.stderr)
+                return 2
+            # Drop whatever was written after the checkpoint; it is redone.
+            with open(args.output, "r+b") as handle:
+                handle.truncate(resumed.output_offset)
+    except OSError as exc:
+        print(f"transtex: {exc}", file=sys.stderr)
+        return 2
+
+    checkpointer = _Checkpointer(args.checkpoint, job, args.checkpoint_every, resumed)
+    read = iter_entries if args.command == "format" else iter_lines
+    pending: Deque[Tuple[str, InputPosition, Optional[BatchResult]]] = deque()
+
+    def items() -> Iterator[str]:
+        for label, item, position in read(args.inputs, checkpointer.position):
+            if isinstance(item, BatchResult):
+                pending.append((label, position, item))
+            else:
+                pending.append((label, position, None))
+                yield item
+
+    def failed() -> Iterator[Tuple[str, BatchResult]]:
+        while pending and pending[0][2] is not None:
+            label, checkpointer.position, result = pending.popleft()
+            yield label, result  # type: ignore[misc]
+
+    def results() -> Iterator[Tuple[str, BatchResult]]:
+        for result in _run(task, items(), args.jobs or None, args.chunksize, True, args.executor):
+            yield from failed()
+            label, checkpointer.position, _ = pending.popleft()
+            yield label, result
+        yield from failed()
+
+    return _write_results(
+        results(), args.output, separator, args.quiet, args.command, args.chunksize, checkpointer=checkpointer
+    )
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from .server import serve
+
+    def ready(address: tuple[str, int]) -> None:
+        print(f"transtex: serving on http://{address[0]}:{address[1]}", file=sys.stderr, flush=True)
+
+    try:
+        serve(
+            args.host,
+            args.port,
+            workers=args.workers or os.cpu_count() or 1,
+            window=args.window / 1000,
+            max_batch=args.max_batch,
+            ready=ready,
+        )
+    except OSError as exc:
+        print(f"transtex: {exc}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def _shard(args: argparse.Namespace) -> int:
+    from . import sharding
+
+    started = time.perf_counter()
+    try:
+        if args.action in ("split", "run"):
+            from_style, to_style = args.convert or (None, None)
+            count = sharding.split(
+                args.workdir,
+                args.inputs,
+                shards=args.shards,
+                style=args.style,
+                from_style=from_style,
+                to_style=to_style,
+                decode_latex=args.decode_latex,
+            )
+            if args.action == "split":
+                if not args.quiet:
+                    print(f"transtex: shard split: {count} items in {args.shards} shards", file=sys.stderr)
+                return 0
+            sharding.map_local(args.workdir, processes=args.processes, jobs=args.jobs)
+        elif args.action == "map":
+            count = sharding.map_shard(
+                args.workdir, args.index, workers=args.jobs or None, chunksize=args.chunksize, executor=args.executor
+            )
+            if not args.quiet:
+                elapsed = time.perf_counter() - started
+                print(f"transtex: shard map: shard {args.index}, {count} items, {elapsed:.2f} s", file=sys.stderr)
+            return 0
+        results = sharding.merge_shards(args.workdir)
+    except (sharding.ShardError, ValueError, OSError) as exc:
+        print(f"transtex: {exc}", file=sys.stderr)
+        return 2
+    return _write_results(results, args.output, "", args.quiet, f"shard {args.action}", DEFAULT_CHUNKSIZE, started)
+
+
+def _watch(args: argparse.Namespace) -> int:
+    from .watch import BibWatcher, WatchUpdate
+
+    watcher = BibWatcher(
+        args.paths, args.style, output_dir=args.output_dir, decode_latex=args.decode_latex, workers=args.jobs or None
+    )
+    failed = False
+
+    def report(update: WatchUpdate) -> None:
+        nonlocal failed
+        if update.error is not None:
+            failed = True
+            print(f"transtex: {update.source}: {update.error}", file=sys.stderr, flush=True)
+            return
+        for label, result in update.failures:
+            failed = True
+            print(f"transtex: {label}: {result.stage} failed: {result.message}", file=sys.stderr)
+        if update.deleted:
+            if not args.quiet:
+                print(f"transtex: {update.source}: deleted, removed {update.output}", file=sys.stderr, flush=True)
+            return
+        if not args.quiet:
+            print(
+                f"transtex: {update.source}: {update.formatted} formatted, {update.unchanged} unchanged, "
+                f"{update.removed} removed -> {update.output} ({update.bytes_written} bytes written)",
+                file=sys.stderr,
+                flush=True,
+            )
+
+    try:
+        if args.once:
+            for update in watcher.poll():
+                report(update)
+            return 1 if failed else 0
+        watcher.run(args.interval, report=report)
+    except OSError as exc:
+        print(f"transtex: {exc}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _non_negative(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be 0 or more")
+    return number
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def _parse_to_bibtex(style: str, encode_latex: bool, texts: List[str]) -> List[BatchResult]:
+    results = []
+    for text in texts:
+        parsed = _parse_one(style, text)
+        results.append(BatchResult(reference_to_bibtex(parsed.value, encode_latex=encode_latex)) if parsed.ok else parsed)
+    return results
+
+
+__all__ = ["main"]
@@ -1,8 +1,9 @@
 """Citation style conversion functions."""
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Optional
 
+from .cache import RenderCache
 from .formatters import (
     format_apa,
     format_apa7,
@@ -19,12 +20,25 @@ class ConversionError(ValueError):
     """Raised when citation conversion fails."""
 
 
-def format_reference(style: str, reference: Reference) -> str:
+_FORMATTERS: dict[str, Callable[[Reference], str]] = {
+    "apa": format_apa,
+    "apa6": format_apa,
+    "apa7": format_apa7,
+    "ieee": format_ieee,
+    "mla": format_mla,
+    "chicago": format_chicago,
+    "vancouver": format_vancouver,
+}
+
+
+def format_reference(style: str, reference: Reference, cache: Optional[RenderCache] = None) -> str:
     """Format a Reference object into a citation string using the specified style.
 
     Args:
         style: Citation style (apa, apa6, apa7, ieee, mla, chicago, vancouver)
         reference: Reference object to format
+        cache: Optional :class:`RenderCache`; unchanged references are served
+            from it instead of being formatted again
 
     Returns:
         Formatted citation string
@@ -33,23 +47,15 @@ def format_reference(style: str, reference: Reference) -> str:
         ConversionError: If the style is not supported
     """
     normalized_style = style.strip().lower()
-    formatters: dict[str, Callable[[Reference], str]] = {
-        "apa": format_apa,
-        "apa6": format_apa,
-        "apa7": format_apa7,
-        "ieee": format_ieee,
-        "mla": format_mla,
-        "chicago": format_chicago,
-        "vancouver": format_vancouver,
-    }
-
-    formatter = formatters.get(normalized_style)
+    formatter = _FORMATTERS.get(normalized_style)
     if not formatter:
-        supported = ", ".join(sorted(formatters.keys()))
+        supported = ", ".join(sorted(_FORMATTERS.keys()))
         raise ConversionError(
             f"Unsupported style '{style}'. Supported styles: {supported}"
         )
 
+    if cache is not None:
+        return cache.render(formatter, reference)
     return formatter(reference)
 
 
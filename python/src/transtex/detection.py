@@ -0,0 +1,114 @@
+"""Guess the citation style of unlabeled citation strings."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+
+from .normalization import normalize_citation_text
+from .parsers import (
+    parse_apa_citation,
+    parse_chicago_citation,
+    parse_ieee_citation,
+    parse_mla_citation,
+    parse_vancouver_citation,
+)
+from .reference import Reference
+
+
+@dataclass(frozen=True)
+class StyleDetection:
+    """Result of :func:`detect_style`.
+
+    ``style`` is ``None`` when no style matched. ``confidence`` is the share
+    of the lexical evidence that points at ``style`` (1.0 when only one
+    style matched); it is discounted when a full parse had to break a tie.
+    ``reference`` is the winning parse when a tie was broken by parsing, so
+    callers need not parse the text again.
+    """
+
+    style: Optional[str]
+    confidence: float
+    reference: Optional[Reference] = field(default=None, compare=False, repr=False)
+
+
+# (style, literal gate, compiled probe, weight). The regex only runs when the
+# literal gate occurs in the text; a probe of None means the gate is enough.
+# No probe backtracks across the whole string.
+_PROBES: List[Tuple[str, str, Optional[Pattern[str]], int]] = [
+    ("apa", ").", re.compile(r"\((?:\d{4}[a-z]?|n\.d\.)\)\."), 4),
+    ("apa", ", & ", None, 1),
+    ("ieee", ',"', None, 3),
+    ("ieee", "doi: ", re.compile(r"\bdoi: 10\."), 1),
+    ("ieee", "pp. ", re.compile(r", pp\. [\w–-]+, \d{4}"), 1),
+    ("mla", '."', None, 1),
+    ("mla", "pp. ", re.compile(r", \d{4}, pp\. "), 2),
+    ("mla", "vol. ", re.compile(r"\bvol\. \w+, no\. \w+, \d{4}"), 1),
+    ("chicago", ". ", re.compile(r"\. (?:\d{4}[a-z]?|n\.d\.)\. "), 3),
+    ("chicago", "): ", re.compile(r" \d+ \([^()]{1,20}\): "), 2),
+    ("vancouver", ";", re.compile(r"\d{4}[a-z]?;\d*(?:\([^()]{1,20}\))?:"), 4),
+    ("vancouver", "doi:1", re.compile(r"\bdoi:10\."), 1),
+]
+
+# Full parsers used to settle ties, in the order they are tried.
+_PARSERS: Dict[str, Callable[[str], Reference]] = {
+    "apa": parse_apa_citation,
+    "ieee": parse_ieee_citation,
+    "mla": parse_mla_citation,
+    "chicago": parse_chicago_citation,
+    "vancouver": parse_vancouver_citation,
+}
+
+_TIE_DISCOUNT = 0.5
+
+
+def detect_style(text: str) -> StyleDetection:
+    """Guess which citation style ``text`` is written in.
+
+    Lexical probes (a ``(2020).`` year block, quoted titles ending in ``,"``
+    or ``."``, ``vol.``/``no.``/``pp.`` runs, the Vancouver ``;42(7):``
+    timeline) score every style first. The full parsers only run when
+    several styles share the best score, and the candidate that parses into
+    the most complete :class:`Reference` wins. Text that no probe matches is
+    reported as undetected without parsing it at all.
+    """
+    raw = normalize_citation_text(text).strip()
+    scores: Dict[str, int] = {}
+    for style, gate, probe, weight in _PROBES:
+        if gate in raw and (probe is None or probe.search(raw)):
+            scores[style] = scores.get(style, 0) + weight
+
+    if not scores:
+        return StyleDetection(None, 0.0)
+    total = sum(scores.values())
+    best = max(scores.values())
+    leaders = [style for style in _PARSERS if scores.get(style, 0) == best]
+    if len(leaders) == 1:
+        return StyleDetection(leaders[0], best / total)
+
+    chosen = _settle_by_parsing(raw, leaders)
+    if chosen is None:
+        # Every leader failed to parse; fall back to the other styles that
+        # showed some evidence.
+        chosen = _settle_by_parsing(raw, [style for style in _PARSERS if style in scores and style not in leaders])
+    if chosen is None:
+        return StyleDetection(None, 0.0)
+    style, reference = chosen
+    return StyleDetection(style, scores[style] / total * _TIE_DISCOUNT, reference)
+
+
+def _settle_by_parsing(raw: str, candidates: List[str]) -> Optional[Tuple[str, Reference]]:
+    chosen: Optional[Tuple[str, Reference]] = None
+    chosen_fields = -1
+    for style in candidates:
+        try:
+            reference = _PARSERS[style](raw)
+        except ValueError:
+            continue
+        filled = len(reference.merged_fields())
+        if filled > chosen_fields:
+            chosen, chosen_fields = (style, reference), filled
+    return chosen
+
+
+__all__ = ["StyleDetection", "detect_style"]
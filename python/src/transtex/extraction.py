@@ -0,0 +1,129 @@
+"""Locate the reference section inside full-text documents."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from .segmentation import ParsedCitation, parse_reference_list
+
+_HEADING = re.compile(
+    r"^[ \t]*(?:(?:\d{1,2}|[IVXLC]{1,6})\.?[ \t]+)?"
+    r"(references|bibliography|works cited|literature cited|reference list|cited references)"
+    r"[ \t]*:?[ \t]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Only the heading words ignore case, so "A."/"IV." prefixes stay capitals,
+# and a heading line may not end in "." or "," like a wrapped entry would.
+_NEXT_SECTION = re.compile(
+    r"^[ \t]*(?:(?:\d{1,2}|[IVXLC]{1,6}|[A-Z])\.?[ \t]+)?"
+    r"(?i:(appendix|appendices|acknowledg(?:e)?ments?|supplementary material|author contributions"
+    r"|conflicts? of interest|index))\b(?:[^\n]{0,60}[^\s.,])?[ \t]*$",
+    re.MULTILINE,
+)
+_REFERENCE_LINE = re.compile(r"^[ \t]*(?:\[\d{1,4}\]|\d{1,4}\.)[ \t]+\S", re.MULTILINE)
+
+# Numbered lines more than this many lines apart belong to different runs.
+_MAX_RUN_GAP = 8
+# A run of numbered lines needs this many entries to count as a reference list.
+_MIN_RUN_ENTRIES = 3
+
+
+@dataclass(frozen=True)
+class ReferenceSection:
+    """The reference section of a document.
+
+    ``start``/``end`` are character offsets into the document and
+    ``start_line`` is the 1-based line where ``text`` begins. ``heading`` is
+    the matched heading, or ``None`` when the section was found from a run
+    of numbered reference-like lines.
+    """
+
+    text: str
+    start: int
+    end: int
+    start_line: int
+    heading: Optional[str]
+
+
+def find_reference_section(document: str) -> Optional[ReferenceSection]:
+    """Return the reference section of ``document`` or ``None``.
+
+    The last "References"/"Bibliography"/"Works Cited" style heading wins,
+    since tables of contents mention the same words earlier on; the section
+    runs to the next appendix/acknowledgements heading or the end of the
+    text. Without a heading, the longest run of ``[n]``/``n.`` lines is
+    used. Every scan is a single compiled-regex pass over the text.
+    """
+    heading = None
+    for heading in _HEADING.finditer(document):
+        pass
+    if heading is not None:
+        start = heading.end() + 1 if heading.end() < len(document) else heading.end()
+        following = _NEXT_SECTION.search(document, start)
+        end = following.start() if following else len(document)
+        return ReferenceSection(
+            text=document[start:end],
+            start=start,
+            end=end,
+            start_line=document.count("\n", 0, start) + 1,
+            heading=heading.group(1),
+        )
+    return _longest_numbered_run(document)
+
+
+def extract_references(
+    document: str,
+    style: str,
+    *,
+    layout: str = "auto",
+    skip_invalid: bool = True,
+) -> Iterator[ParsedCitation]:
+    """Find the reference section of ``document`` and parse its entries.
+
+    Line spans in the results refer to lines of the whole document.
+    Unparseable entries are skipped unless ``skip_invalid`` is false.
+    """
+    section = find_reference_section(document)
+    if section is None:
+        return
+    offset = section.start_line - 1
+    for item in parse_reference_list(section.text, style, layout=layout, skip_invalid=skip_invalid):
+        yield ParsedCitation(item.reference, item.start_line + offset, item.end_line + offset)
+
+
+def _longest_numbered_run(document: str) -> Optional[ReferenceSection]:
+    best: Optional[tuple[int, int, int]] = None  # (entries, start, end)
+    run_start = run_end = -1
+    run_entries = 0
+    last_line = 0
+    last_position = 0
+    for match in _REFERENCE_LINE.finditer(document):
+        line = last_line + document.count("\n", last_position, match.start())
+        if run_entries and line - last_line <= _MAX_RUN_GAP:
+            run_entries += 1
+        else:
+            if run_entries and (best is None or run_entries > best[0]):
+                best = (run_entries, run_start, run_end)
+            run_start, run_entries = match.start(), 1
+        end_of_line = document.find("\n", match.end())
+        run_end = len(document) if end_of_line == -1 else end_of_line
+        last_line, last_position = line, match.start()
+    if run_entries and (best is None or run_entries > best[0]):
+        best = (run_entries, run_start, run_end)
+    if best is None or best[0] < _MIN_RUN_ENTRIES:
+        return None
+    _, start, end = best
+    # Keep wrapped continuation lines of the final entry.
+    blank = document.find("\n\n", end)
+    end = len(document) if blank == -1 else blank
+    return ReferenceSection(
+        text=document[start:end],
+        start=start,
+        end=end,
+        start_line=document.count("\n", 0, start) + 1,
+        heading=None,
+    )
+
+
+__all__ = ["ReferenceSection", "extract_references", "find_reference_section"]
@@ -3,14 +3,28 @@ from .apa6 import format_apa
 from .apa7 import format_apa7
 from .chicago import format_chicago
 from .ieee import format_ieee
+from .intext import (
+    format_apa7_intext,
+    format_apa_intext,
+    format_chicago_intext,
+    format_ieee_intext,
+    format_mla_intext,
+    format_vancouver_intext,
+)
 from .mla import format_mla
 from .vancouver import format_vancouver
 
 __all__ = [
     "format_apa",
     "format_apa7",
+    "format_apa_intext",
+    "format_apa7_intext",
     "format_chicago",
+    "format_chicago_intext",
     "format_ieee",
+    "format_ieee_intext",
     "format_mla",
+    "format_mla_intext",
     "format_vancouver",
+    "format_vancouver_intext",
 ]
@@ -0,0 +1,141 @@
+"""In-text citation formatters.
+
+These only look at the author surnames and the year of a reference, so
+they are much cheaper than rendering the full reference-list entry.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from ..reference import Reference
+from .shared import name_parts, normalize_page_range
+
+
+def format_apa_intext(reference: Reference, locator: Optional[str] = None) -> str:
+    """Return an APA 6th parenthetical citation such as ``(Doe, Smith, & Lee, 2020)``."""
+    return f"({apa_intext_body(reference, locator, max_names=5)})"
+
+
+def format_apa7_intext(reference: Reference, locator: Optional[str] = None) -> str:
+    """Return an APA 7th parenthetical citation such as ``(Doe & Smith, 2020, p. 15)``."""
+    return f"({apa_intext_body(reference, locator, max_names=2)})"
+
+
+def format_chicago_intext(reference: Reference, locator: Optional[str] = None) -> str:
+    """Return a Chicago author-date citation such as ``(Doe and Smith 2020, 15)``."""
+    return f"({chicago_intext_body(reference, locator)})"
+
+
+def format_mla_intext(reference: Reference, locator: Optional[str] = None) -> str:
+    """Return an MLA parenthetical citation such as ``(Doe and Smith 15)``."""
+    return f"({mla_intext_body(reference, locator)})"
+
+
+def format_ieee_intext(number: int, locator: Optional[str] = None) -> str:
+    """Return an IEEE citation such as ``[12]`` or ``[12, p. 15]``."""
+    return f"[{ieee_intext_body(number, locator)}]"
+
+
+def format_vancouver_intext(number: int, locator: Optional[str] = None) -> str:
+    """Return a Vancouver citation such as ``(12)``."""
+    return f"({vancouver_intext_body(number, locator)})"
+
+
+def apa_intext_body(reference: Reference, locator: Optional[str] = None, *, max_names: int = 2) -> str:
+    """Return the unbracketed APA author/year part of an in-text citation."""
+    surnames = intext_surnames(reference)
+    if not surnames:
+        author = _title_stand_in(reference)
+    elif len(surnames) > max_names:
+        author = f"{surnames[0]} et al."
+    elif len(surnames) == 1:
+        author = surnames[0]
+    elif len(surnames) == 2:
+        author = f"{surnames[0]} & {surnames[1]}"
+    else:
+        author = ", ".join(surnames[:-1]) + f", & {surnames[-1]}"
+    parts = [author, reference.year or "n.d."]
+    if locator:
+        parts.append(_page_locator(locator))
+    return ", ".join(part for part in parts if part)
+
+
+def chicago_intext_body(reference: Reference, locator: Optional[str] = None) -> str:
+    """Return the unbracketed Chicago author/year part of an in-text citation."""
+    author = _joined_surnames(intext_surnames(reference), max_names=3) or _title_stand_in(reference)
+    body = f"{author} {reference.year or 'n.d.'}".strip()
+    if locator:
+        body = f"{body}, {normalize_page_range(locator.strip())}"
+    return body
+
+
+def mla_intext_body(reference: Reference, locator: Optional[str] = None) -> str:
+    """Return the unbracketed MLA author part of an in-text citation."""
+    author = _joined_surnames(intext_surnames(reference), max_names=2) or _title_stand_in(reference)
+    if locator:
+        return f"{author} {normalize_page_range(locator.strip())}".strip()
+    return author
+
+
+def ieee_intext_body(number: int, locator: Optional[str] = None) -> str:
+    """Return the unbracketed IEEE citation number with an optional locator."""
+    if locator:
+        return f"{number}, {_page_locator(locator)}"
+    return str(number)
+
+
+def vancouver_intext_body(number: int, locator: Optional[str] = None) -> str:
+    """Return the unbracketed Vancouver citation number with an optional locator."""
+    if locator:
+        return f"{number}, {_page_locator(locator)}"
+    return str(number)
+
+
+def intext_surnames(reference: Reference) -> List[str]:
+    """Return author surnames, ignoring placeholder entries such as ``et al.``."""
+    surnames: List[str] = []
+    for author in reference.normalized_authors():
+        if author.lower().startswith("et al"):
+            continue
+        last, _ = name_parts(author)
+        surnames.append(last or author)
+    return surnames
+
+
+def _joined_surnames(surnames: List[str], *, max_names: int) -> str:
+    if not surnames:
+        return ""
+    if len(surnames) > max_names:
+        return f"{surnames[0]} et al."
+    if len(surnames) == 1:
+        return surnames[0]
+    if len(surnames) == 2:
+        return f"{surnames[0]} and {surnames[1]}"
+    return ", ".join(surnames[:-1]) + f", and {surnames[-1]}"
+
+
+def _title_stand_in(reference: Reference) -> str:
+    return f'"{reference.title}"' if reference.title else ""
+
+
+def _page_locator(locator: str) -> str:
+    pages = normalize_page_range(locator.strip()) or ""
+    if not pages or not pages[0].isdigit():
+        return pages
+    return f"pp. {pages}" if "–" in pages else f"p. {pages}"
+
+
+__all__ = [
+    "apa_intext_body",
+    "chicago_intext_body",
+    "format_apa_intext",
+    "format_apa7_intext",
+    "format_chicago_intext",
+    "format_ieee_intext",
+    "format_mla_intext",
+    "format_vancouver_intext",
+    "ieee_intext_body",
+    "intext_surnames",
+    "mla_intext_body",
+    "vancouver_intext_body",
+]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 from ..reference import Reference
 
@@ -181,25 +181,28 @@ def author_initials(authors: Sequence[str], *, split_initials: bool = True) -> L
 
 
 def sentence_case(text: str) -> str:
-    """Convert a title to sentence case while preserving all-caps tokens."""
+    """Convert a title to sentence case while preserving all-caps tokens.
+
+    Brace-protected spans such as ``{DNA}`` or ``{B}ayesian`` keep their
+    casing and lose the protecting braces.
+    """
     if not text:
         return ""
-    parts = re.split(r"(\s+)", text.strip())
-    result: List[str] = []
-    first_word_done = False
-    for part in parts:
-        if not part.strip():
-            result.append(part)
-            continue
-        if not first_word_done:
-            result.append(part[:1].upper() + part[1:].lower())
-            first_word_done = True
-            continue
-        if part.isupper():
-            result.append(part)
+    parts = _casing_tokens(text)
+    for index in range(0, len(parts), 2):
+        word = parts[index]
+        if isinstance(word, str):
+            if index == 0:
+                parts[index] = word[:1].upper() + word[1:].lower()
+            elif not word.isupper():
+                parts[index] = word.lower()
+        elif index == 0:
+            parts[index] = _apply_case(word, _CAPITALIZE)
+        elif _unprotected_text(word).isupper():
+            parts[index] = _apply_case(word, _KEEP)
         else:
-            result.append(part.lower())
-    return "".join(result)
+            parts[index] = _apply_case(word, _LOWER)
+    return "".join(parts)  # type: ignore[arg-type]
 
 
 def normalize_page_range(pages: str | None) -> str | None:
@@ -234,10 +237,29 @@ def abbreviate_page_range(pages: str | None) -> str | None:
 
 
 def title_case(text: str) -> str:
-    """Convert text to basic title case while keeping small words lower."""
+    """Convert text to basic title case while keeping small words lower.
+
+    Brace-protected spans keep their casing, as in :func:`sentence_case`.
+    """
     if not text:
         return ""
-    small_words = {
+    parts = _casing_tokens(text)
+    for index in range(0, len(parts), 2):
+        word = parts[index]
+        if isinstance(word, str):
+            if index == 0 or word.lower() not in _SMALL_WORDS:
+                parts[index] = word[0].upper() + word[1:]
+            else:
+                parts[index] = word.lower()
+        elif index == 0 or "".join(segment for segment, _ in word).lower() not in _SMALL_WORDS:
+            parts[index] = _apply_case(word, _UPPER_FIRST)
+        else:
+            parts[index] = _apply_case(word, _LOWER)
+    return "".join(parts)  # type: ignore[arg-type]
+
+
+_SMALL_WORDS = frozenset(
+    {
         "a",
         "an",
         "the",
@@ -256,22 +278,95 @@ def title_case(text: str) -> str:
         "at",
         "from",
     }
-    tokens = re.split(r"(\s+)", text.strip())
-    result: List[str] = []
-    first_word = True
-    for token in tokens:
-        if not token.strip():
-            result.append(token)
-            continue
-        word = token
-        lowered = word.lower()
-        if first_word or lowered not in small_words:
-            word = word[0].upper() + word[1:]
+)
+
+# Casing modes understood by _apply_case.
+_KEEP = 0
+_LOWER = 1
+_CAPITALIZE = 2
+_UPPER_FIRST = 3
+
+_Word = Tuple[Tuple[str, bool], ...]
+_WHITESPACE_SPLIT = re.compile(r"(\s+)")
+_BRACED_PIECES = re.compile(r"[{}]|[^{}\s]+|\s+")
+
+
+def _casing_tokens(text: str) -> List[Union[str, _Word]]:
+    """Split ``text`` once into alternating words and whitespace runs.
+
+    Words sit at even indexes. Plain words are strings; words containing a
+    brace group are tuples of ``(segment, protected)`` pairs. Braces only
+    split words at depth zero, and a group opened with a LaTeX command
+    (``{\\"o}``) stays protected but keeps its braces in the output.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return []
+    if "{" not in stripped and "}" not in stripped:
+        return _WHITESPACE_SPLIT.split(stripped)  # type: ignore[return-value]
+
+    tokens: List[Union[str, _Word]] = []
+    word: List[Tuple[str, bool]] = []
+    group: List[str] = []
+    depth = 0
+    for piece in _BRACED_PIECES.findall(stripped):
+        if piece == "{":
+            if depth:
+                group.append(piece)
+            depth += 1
+        elif piece == "}":
+            if depth == 0:
+                return _WHITESPACE_SPLIT.split(stripped)  # type: ignore[return-value]
+            depth -= 1
+            if depth:
+                group.append(piece)
+            else:
+                inner = "".join(group)
+                word.append((f"{{{inner}}}" if inner.startswith("\\") else inner, True))
+                group = []
+        elif depth:
+            group.append(piece)
+        elif piece[0].isspace():
+            tokens.append(_pack_word(word))
+            tokens.append(piece)
+            word = []
+        else:
+            word.append((piece, False))
+    if depth:
+        # Unbalanced braces carry no protection; treat them as ordinary text.
+        return _WHITESPACE_SPLIT.split(stripped)  # type: ignore[return-value]
+    tokens.append(_pack_word(word))
+    return tokens
+
+
+def _pack_word(word: List[Tuple[str, bool]]) -> Union[str, _Word]:
+    if len(word) == 1 and not word[0][1]:
+        return word[0][0]
+    return tuple(word)
+
+
+def _unprotected_text(word: _Word) -> str:
+    return "".join(segment for segment, protected in word if not protected)
+
+
+def _apply_case(word: _Word, mode: int) -> str:
+    if mode == _KEEP:
+        return "".join(segment for segment, _ in word)
+    parts: List[str] = []
+    for index, (segment, protected) in enumerate(word):
+        if protected or not segment:
+            parts.append(segment)
+        elif mode == _LOWER:
+            parts.append(segment.lower())
+        elif index == 0 and mode == _CAPITALIZE:
+            parts.append(segment[0].upper() + segment[1:].lower())
+        elif index == 0:
+            parts.append(segment[0].upper() + segment[1:])
+        elif mode == _CAPITALIZE:
+            parts.append(segment.lower())
         else:
-            word = lowered
-        first_word = False
-        result.append(word)
-    return "".join(result)
+            parts.append(segment)
+    return "".join(parts)
 
 
 __all__ = [
@@ -1,12 +1,26 @@
 """Backward compatible import surface for citation formatters."""
 from .formatters import format_apa, format_chicago, format_ieee, format_mla, format_vancouver
 from .formatters.apa7 import format_apa7
+from .formatters.intext import (
+    format_apa7_intext,
+    format_apa_intext,
+    format_chicago_intext,
+    format_ieee_intext,
+    format_mla_intext,
+    format_vancouver_intext,
+)
 
 __all__ = [
     "format_apa",
+    "format_apa_intext",
     "format_apa7",
+    "format_apa7_intext",
     "format_chicago",
+    "format_chicago_intext",
     "format_ieee",
+    "format_ieee_intext",
     "format_mla",
+    "format_mla_intext",
     "format_vancouver",
+    "format_vancouver_intext",
 ]
@@ -0,0 +1,57 @@
+"""Read the records of command-line and shard inputs: citation lines or BibTeX entries.
+
+Inputs are paths, with ``-`` for standard input. Each record is labelled
+with its file and line or entry number for error reports. Files are read as
+bytes and decoded a line at a time, so a file that is not valid UTF-8
+yields a failed :class:`~transtex.batch.BatchResult` at the first bad line
+after every record before it.
+"""
+from __future__ import annotations
+
+import sys
+from typing import IO, Any, Iterable, Iterator, Tuple, Union
+
+from .batch import BatchResult, _read_failed
+from .bibtex import iter_bibtex_entries
+
+
+def _open_inputs(paths: Iterable[str]) -> Iterator[Tuple[str, Iterator[str]]]:
+    for path in paths:
+        if path == "-":
+            yield "<stdin>", _utf8_lines(getattr(sys.stdin, "buffer", sys.stdin))
+            continue
+        with open(path, "rb") as handle:
+            yield path, _utf8_lines(handle)
+
+
+def _utf8_lines(handle: IO[Any]) -> Iterator[str]:
+    for raw in handle:
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        yield line[:-2] + "\n" if line.endswith("\r\n") else line
+
+
+def _lines(paths: Iterable[str]) -> Iterator[Tuple[str, Union[str, BatchResult]]]:
+    """Yield ``(label, line)`` per non-blank line, or a failed result for undecodable input."""
+    for name, lines in _open_inputs(paths):
+        number = 0
+        try:
+            for number, line in enumerate(lines, 1):
+                text = line.strip()
+                if text:
+                    yield f"{name}:{number}", text
+        except UnicodeDecodeError as exc:
+            yield f"{name}:{number + 1}", _read_failed(name, exc)
+
+
+def _entries(paths: Iterable[str]) -> Iterator[Tuple[str, Union[str, BatchResult]]]:
+    """Yield ``(label, entry)`` per BibTeX entry, or a failed result for undecodable input."""
+    for name, lines in _open_inputs(paths):
+        number = 0
+        try:
+            for number, entry in enumerate(iter_bibtex_entries(lines), 1):
+                yield f"{name}: entry {number}", entry
+        except UnicodeDecodeError as exc:
+            yield f"{name}: entry {number + 1}", _read_failed(name, exc)
+
+
+__all__: list[str] = []
@@ -0,0 +1,297 @@
+"""Translate between LaTeX escapes in BibTeX values and Unicode."""
+from __future__ import annotations
+
+import re
+import threading
+import unicodedata
+from string import ascii_letters
+
+# Accent commands and the combining mark each one applies to its argument.
+_ACCENTS = {
+    "'": "\u0301",
+    "`": "\u0300",
+    "^": "\u0302",
+    '"': "\u0308",
+    "~": "\u0303",
+    "=": "\u0304",
+    ".": "\u0307",
+    "c": "\u0327",
+    "v": "\u030c",
+    "u": "\u0306",
+    "H": "\u030b",
+    "k": "\u0328",
+    "r": "\u030a",
+    "d": "\u0323",
+    "b": "\u0331",
+}
+
+# Commands that stand for a character. Font and emphasis commands map to the
+# empty string, which leaves just their argument.
+_SYMBOLS = {
+    "ss": "ß",
+    "ae": "æ",
+    "AE": "Æ",
+    "oe": "œ",
+    "OE": "Œ",
+    "o": "ø",
+    "O": "Ø",
+    "aa": "å",
+    "AA": "Å",
+    "l": "ł",
+    "L": "Ł",
+    "i": "ı",
+    "j": "ȷ",
+    "dh": "ð",
+    "DH": "Ð",
+    "dj": "đ",
+    "DJ": "Đ",
+    "th": "þ",
+    "TH": "Þ",
+    "ng": "ŋ",
+    "NG": "Ŋ",
+    "&": "&",
+    "%": "%",
+    "$": "$",
+    "#": "#",
+    "_": "_",
+    "{": "{",
+    "}": "}",
+    ",": " ",
+    "\\": " ",
+    "-": "",
+    "/": "",
+    "textendash": "–",
+    "textemdash": "—",
+    "textquoteleft": "‘",
+    "textquoteright": "’",
+    "textquotedblleft": "“",
+    "textquotedblright": "”",
+    "guillemotleft": "«",
+    "guillemotright": "»",
+    "textbackslash": "\\",
+    "textasciitilde": "~",
+    "textasciicircum": "^",
+    "textbar": "|",
+    "textbraceleft": "{",
+    "textbraceright": "}",
+    "textless": "<",
+    "textgreater": ">",
+    "textunderscore": "_",
+    "textdollar": "$",
+    "textbullet": "•",
+    "textdegree": "°",
+    "textellipsis": "…",
+    "ldots": "…",
+    "dots": "…",
+    "S": "§",
+    "P": "¶",
+    "copyright": "©",
+    "textcopyright": "©",
+    "textregistered": "®",
+    "texttrademark": "™",
+    "dag": "†",
+    "ddag": "‡",
+    "pounds": "£",
+    "euro": "€",
+    "quad": " ",
+    "relax": "",
+}
+for _name in (
+    "emph", "textit", "textbf", "textsc", "textrm", "texttt", "textsf", "textsl",
+    "textup", "textnormal", "mbox", "em", "it", "bf", "sc", "rm", "tt", "sf", "sl", "up",
+):
+    _SYMBOLS[_name] = ""
+
+# Ligatures TeX builds from plain characters; ``~`` is a tie between words.
+_LIGATURES = {"---": "—", "--": "–", "``": "“", "''": "”", "~": " "}
+
+_DOTLESS = {"\\i": "i", "\\j": "j"}
+
+# Every accent applied to every ASCII letter, composed up front so decoding
+# is a dictionary lookup.
+_ACCENTED = {
+    (name, letter): unicodedata.normalize("NFC", letter + mark)
+    for name, mark in _ACCENTS.items()
+    for letter in ascii_letters
+}
+
+_DOTLESS_ARG = r"\\[ij](?![A-Za-z])"
+# One scan finds, in order of preference: a brace group opening with a
+# command (``{\"o}``, ``{\ss}``, ``{\em x}``); a command with its argument,
+# braced (``\"{o}``), after the spaces TeX skips behind a control word
+# (``\c c``), or bare after a control symbol (``\'e``); and ligatures.
+_LATEX = re.compile(
+    r"\{(?P<group>\\[^{}]*(?:\{[^{}]*\}[^{}]*)*)\}"
+    r"|\\(?P<name>[A-Za-z]+|[^A-Za-z\s])"
+    r"(?:\{(?P<braced>[^{}]*)\}"
+    rf"|(?<=[A-Za-z])\s+(?P<spaced>{_DOTLESS_ARG}|[A-Za-z])"
+    rf"|(?<![A-Za-z])\s*(?P<bare>{_DOTLESS_ARG}|[A-Za-z]))?"
+    r"|---|--|``|''|~"
+)
+
+
+# Escapes recur across a corpus, so short ones are decoded once and then
+# served from this table. Reads need no lock; inserts take one so the size
+# limit holds when batch threads decode concurrently.
+_SEEN: dict[str, str] = {}
+_SEEN_LIMIT = 8192
+_SEEN_LOCK = threading.Lock()
+
+
+def _replace_cached(match: re.Match[str]) -> str:
+    text = match.group()
+    decoded = _SEEN.get(text)
+    if decoded is None:
+        decoded = _replace(match)
+        if len(text) <= 12:
+            with _SEEN_LOCK:
+                if len(_SEEN) < _SEEN_LIMIT:
+                    _SEEN[text] = decoded
+    return decoded
+
+
+def _replace(match: re.Match[str]) -> str:
+    group = match.group("group")
+    if group is not None:
+        inner = _LATEX.sub(_replace, group)
+        # Braces around a decoded character only grouped it; keep them when
+        # an unknown command is left inside.
+        return "{" + inner + "}" if "\\" in inner else inner
+    name = match.group("name")
+    if name is None:
+        return _LIGATURES[match.group()]
+    braced = match.group("braced")
+    loose = match.group("spaced") or match.group("bare")
+    accent = _ACCENTS.get(name)
+    if accent is not None:
+        if braced == "" and not name.isalpha():
+            return name  # ``\~{}`` and ``\^{}`` print the accent itself.
+        base = (braced if braced is not None else loose or "").strip()
+        base = _DOTLESS.get(base, base)
+        if len(base) != 1:
+            return match.group()
+        return _ACCENTED.get((name, base)) or unicodedata.normalize("NFC", base + accent)
+    symbol = _SYMBOLS.get(name)
+    if symbol is None:
+        if braced is not None:
+            return f"\\{name}{{{_LATEX.sub(_replace, braced)}}}"
+        return match.group()
+    if braced is not None:
+        return symbol + _LATEX.sub(_replace, braced)
+    if match.group("spaced") is not None:
+        return symbol + (_SYMBOLS[loose[1]] if loose in _DOTLESS else loose)
+    if loose is not None:
+        # Control symbols such as ``\&`` do not swallow the text after them.
+        return symbol + _LATEX.sub(_replace, match.group()[len(name) + 1 :])
+    return symbol
+
+
+def decode_latex(value: str) -> str:
+    """Return ``value`` with LaTeX accents, commands and ligatures as Unicode.
+
+    ``{\\"o}``, ``\\'e``, ``\\c{c}``, ``{\\ss}``, escaped specials such as
+    ``\\&``, ``--``/``---`` dashes, TeX quotes and ``~`` ties are decoded in a
+    single scan against precomputed tables; emphasis commands are reduced to
+    their argument. Braces that only protect text (``{DNA}``), math and
+    unknown commands are left as they are.
+    """
+    return _LATEX.sub(_replace_cached, value)
+
+
+# Characters BibTeX or LaTeX treat specially, spelled so they print as is.
+_ESCAPES = {
+    "\\": "\\textbackslash{}",
+    "&": "\\&",
+    "%": "\\%",
+    "$": "\\$",
+    "#": "\\#",
+    "_": "\\_",
+    "~": "\\textasciitilde{}",
+    "^": "\\textasciicircum{}",
+    # BibTeX counts ``\{`` and ``\}`` when matching braces, so stray braces
+    # need commands that contain none.
+    "{": "\\textbraceleft{}",
+    "}": "\\textbraceright{}",
+    "\\{": "\\textbraceleft{}",
+    "\\}": "\\textbraceright{}",
+}
+
+
+def _encoding_table() -> dict[str, str]:
+    table = dict(_ESCAPES)
+    for (name, letter), char in _ACCENTED.items():
+        if len(char) == 1:
+            table.setdefault(char, f"{{\\{name}{letter}}}" if not name.isalpha() else f"{{\\{name}{{{letter}}}}}")
+    for name, char in _SYMBOLS.items():
+        if len(char) == 1 and not char.isascii() and name.isalpha():
+            table.setdefault(char, f"{{\\{name}}}")
+    table.update({"–": "--", "—": "---", "“": "``", "”": "''", "\u00a0": "~"})
+    return table
+
+
+# Unicode characters and specials to their LaTeX spelling, built once from
+# the decoding tables so encoded values decode back to the same text (only
+# no-break spaces come back as plain spaces).
+_ENCODE = _encoding_table()
+_ENCODE_LIMIT = len(_ENCODE) + 8192
+_ENCODE_LOCK = threading.Lock()
+_MARK_COMMANDS = {mark: name for name, mark in _ACCENTS.items()}
+# LaTeX already in a value, whether a command (``{\"o}``, ``\&``) or math
+# with a command in it (``$\alpha$``), is matched first and written as it
+# is; a backslash that starts no command is escaped. Balanced braces protect
+# text from case changes and are kept too; the second pattern also escapes
+# braces for values where they do not pair up.
+_EXISTING = r"\$[^$]*\\[^$]*\$|\\(?:[A-Za-z]+|[^A-Za-z\s])|"
+_ENCODE_SPECIAL = re.compile(_EXISTING + r"[\\&%$#_~^\x80-\U0010ffff]")
+_ENCODE_SPECIAL_AND_BRACES = re.compile(_EXISTING + r"[\\&%$#_~^{}\x80-\U0010ffff]")
+_BRACES = re.compile(r"[{}]")
+
+
+def _encode_char(match: re.Match[str]) -> str:
+    char = match.group()
+    encoded = _ENCODE.get(char)
+    if encoded is None and len(char) > 1:
+        return char
+    if encoded is None:
+        # Other letters with one accent on an ASCII base (``ǵ``) are spelled
+        # with the accent command; the rest are left for a Unicode-aware
+        # toolchain.
+        encoded = char
+        base, *marks = unicodedata.normalize("NFD", char)
+        name = _MARK_COMMANDS.get(marks[0]) if len(marks) == 1 and base.isascii() else None
+        if name is not None:
+            encoded = f"{{\\{name}{base}}}" if not name.isalpha() else f"{{\\{name}{{{base}}}}}"
+        with _ENCODE_LOCK:
+            if len(_ENCODE) < _ENCODE_LIMIT:
+                _ENCODE[char] = encoded
+    return encoded
+
+
+def _balanced(value: str) -> bool:
+    depth = 0
+    for match in _BRACES.finditer(value):
+        depth += 1 if match.group() == "{" else -1
+        if depth < 0:
+            return False
+    return depth == 0
+
+
+def encode_latex(value: str) -> str:
+    """Return ``value`` spelled so legacy BibTeX and LaTeX read it correctly.
+
+    The inverse of :func:`decode_latex`: special characters are escaped and
+    accented letters, dashes, quotes and other Unicode characters with a
+    LaTeX spelling are replaced from a precomputed table in a single scan.
+    LaTeX the value already contains, such as ``{\\"o}``, ``\\&`` or
+    ``$\\alpha$``, is kept, so values read without decoding are not escaped
+    twice. Balanced braces are kept, since they protect capitalization;
+    braces that do not pair up are escaped so the entry still parses. ASCII
+    values without special characters are returned unchanged.
+    """
+    if "{" in value or "}" in value:
+        if not _balanced(value):
+            return _ENCODE_SPECIAL_AND_BRACES.sub(_encode_char, value)
+    return _ENCODE_SPECIAL.sub(_encode_char, value)
+
+
+__all__ = ["decode_latex", "encode_latex"]
@@ -0,0 +1,70 @@
+"""Clean up citation text pasted from PDFs and word processors."""
+from __future__ import annotations
+
+import re
+import unicodedata
+
+_REPLACEMENTS = {
+    # Typographic quotes become the ASCII quotes the parsers look for.
+    "“": '"',
+    "”": '"',
+    "„": '"',
+    "‟": '"',
+    "«": '"',
+    "»": '"',
+    "″": '"',
+    "‘": "'",
+    "’": "'",
+    "‚": "'",
+    "‛": "'",
+    "′": "'",
+    # Hyphens become "-"; dashes that stand for ranges become en dashes.
+    "‐": "-",
+    "‑": "-",
+    "‒": "–",
+    "−": "–",
+    "―": "—",
+    # Ligatures produced by PDF text extraction.
+    "ﬀ": "ff",
+    "ﬁ": "fi",
+    "ﬂ": "fl",
+    "ﬃ": "ffi",
+    "ﬄ": "ffl",
+    "ﬅ": "st",
+    "ﬆ": "st",
+}
+# No-break, fixed-width and line/paragraph separator spaces.
+for _code in (0x00A0, *range(0x2000, 0x200B), 0x2028, 0x2029, 0x202F, 0x205F, 0x3000):
+    _REPLACEMENTS[chr(_code)] = " "
+# Soft hyphens, zero-width spaces, word joiners and byte-order marks vanish.
+for _code in (0x00AD, 0x200B, 0x2060, 0xFEFF):
+    _REPLACEMENTS[chr(_code)] = ""
+
+# str.translate looks every character of a non-ASCII string up in the table,
+# which costs more than the parse itself; a compiled class only stops at the
+# characters that need replacing.
+_SPECIAL = re.compile("[" + "".join(_REPLACEMENTS) + "]")
+
+
+def _replace(match: re.Match[str]) -> str:
+    return _REPLACEMENTS[match.group()]
+
+
+def normalize_citation_text(text: str) -> str:
+    """Return ``text`` with typographic punctuation mapped to what parsers expect.
+
+    Curly quotes, no-break and fixed-width spaces, soft hyphens, zero-width
+    characters, ligatures and dash variants are replaced from one
+    precomputed table in a single scan, then the result is NFC-composed so
+    decomposed accents compare equal. ASCII input is returned unchanged
+    without copying.
+    """
+    if text.isascii():
+        return text
+    text = _SPECIAL.sub(_replace, text)
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return text
+
+
+__all__ = ["normalize_citation_text"]
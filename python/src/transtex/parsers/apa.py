@@ -4,7 +4,9 @@ from __future__ import annotations
 import re
 
 from ..reference import Reference
+from .lexer import PAREN, tokenize, trailing_locator
 from .shared import (
+    check_length,
     clean_locator,
     generate_cite_key,
     normalize_pages,
@@ -12,31 +14,42 @@ from .shared import (
     strip_trailing_period,
 )
 
+_CONTAINER = re.compile(
+    r"(?P<container>.+?)(?:,\s*(?P<volume>\d+)(?:\((?P<issue>[^()]+)\))?)?(?:,\s*(?P<pages>[\w\-–]+))?$"
+)
+
 
 def parse_apa_citation(text: str) -> Reference:
     raw = text.strip()
     if not raw:
         raise ValueError("Empty APA citation string")
+    check_length(raw, "APA")
 
-    year_match = re.search(r"\(([^)]+)\)\.", raw)
-    if not year_match:
+    tokens = tokenize(raw)
+    year_token = next(
+        (token for token in tokens if token.kind == PAREN and raw.startswith(".", token.end)),
+        None,
+    )
+    if not year_token:
         raise ValueError("APA citation missing year segment '(year).'")
 
-    authors_segment = raw[: year_match.start()].strip()
-    remainder = raw[year_match.end() :].strip()
-    year = year_match.group(1).strip() or None
-
-    if ". " in remainder:
-        title, remainder = remainder.split(". ", 1)
+    authors_segment = raw[: year_token.start].strip()
+    year = year_token.value.strip() or None
+    body_start = year_token.end + 1
+    title_end = raw.find(". ", body_start)
+    if title_end == -1:
+        title, rest_start = raw[body_start:], len(raw)
     else:
-        title, remainder = remainder, ""
+        title, rest_start = raw[body_start:title_end], title_end + 2
     title = strip_trailing_period(title.strip())
 
     locator = None
-    locator_match = re.search(r"(https?://\S+|10\.\S+)$", remainder)
-    if locator_match:
-        locator = locator_match.group(1).strip()
-        remainder = remainder[: locator_match.start()].strip()
+    rest_end = len(raw)
+    locator_token = trailing_locator(tokens, raw, rest_start)
+    if locator_token:
+        locator = locator_token.value
+        rest_end = locator_token.start
+    remainder = raw[rest_start:rest_end].strip()
 
     container_segment = remainder.rstrip(".").strip().replace("*", "")
     if container_segment.lower().startswith("retrieved from"):
@@ -72,10 +85,7 @@ def parse_apa_citation(text: str) -> Reference:
 def _parse_container(segment: str) -> tuple[str | None, str | None, str | None, str | None]:
     if not segment:
         return None, None, None, None
-    match = re.match(
-        r"(?P<container>.+?)(?:,\s*(?P<volume>\d+)(?:\((?P<issue>[^)]+)\))?)?(?:,\s*(?P<pages>[\w\-–]+))?$",
-        segment,
-    )
+    match = _CONTAINER.match(segment)
     if not match:
         return segment, None, None, None
     container = (match.group("container") or "").strip() or None
@@ -4,7 +4,9 @@ from __future__ import annotations
 import re
 
 from ..reference import Reference
+from .lexer import QUOTED, YEAR, Token, first, tokenize, trailing_locator
 from .shared import (
+    check_length,
     clean_locator,
     generate_cite_key,
     normalize_pages,
@@ -12,33 +14,37 @@ from .shared import (
     strip_trailing_period,
 )
 
+_JOURNAL = re.compile(r"(.+?)\s+(\d+)\s*\(([^()]+)\):\s*([\w–-]+)")
+_PLACE_PUBLISHER = re.compile(r"([^:]+):\s*([^,]+)")
+
 
 def parse_chicago_citation(text: str) -> Reference:
     raw = text.strip()
     if not raw:
         raise ValueError("Empty Chicago citation string")
+    check_length(raw, "Chicago")
 
-    match = re.match(r"^(?P<authors>.*?)\.\s+(?P<year>\d{4}|n\.d\.)\.\s+(?P<rest>.+)$", raw)
-    if not match:
+    tokens = tokenize(raw)
+    year_token = next((token for token in tokens if token.kind == YEAR and _is_year_block(raw, token)), None)
+    if not year_token:
         raise ValueError("Chicago citation missing expected segments")
-    authors_segment = match.group("authors").strip()
-    year = strip_trailing_period(match.group("year").strip()) or None
-    remainder = match.group("rest").strip()
+    authors_segment = raw[: year_token.start].rstrip()[:-1].strip()
+    year = year_token.value
 
-    title_match = re.search(r"\"(.+?)\"", remainder)
-    if not title_match:
+    title_token = first(tokens, QUOTED, year_token.end)
+    if not title_token:
         raise ValueError("Chicago citation missing title")
-    title = strip_trailing_period(title_match.group(1).strip())
-    after_title = remainder[title_match.end() :].strip()
+    title = strip_trailing_period(title_token.value.strip())
 
     locator = None
-    locator_match = re.search(r"(https?://\S+|10\.\S+)$", after_title)
-    if locator_match:
-        locator = locator_match.group(1).strip()
-        after_title = after_title[: locator_match.start()].strip()
-    after_title = after_title.rstrip(".").strip()
+    after_end = len(raw)
+    locator_token = trailing_locator(tokens, raw, title_token.end)
+    if locator_token:
+        locator = locator_token.value
+        after_end = locator_token.start
+    after_title = raw[title_token.end : after_end].strip().rstrip(".").strip()
 
-    journal_match = re.match(r"(.+?)\s+(\d+)\s*\(([^)]+)\):\s*([\w–-]+)", after_title)
+    journal_match = _JOURNAL.match(after_title)
     journal = volume = issue = pages = None
     if journal_match:
         journal = journal_match.group(1).strip()
@@ -46,7 +52,7 @@ def parse_chicago_citation(text: str) -> Reference:
         issue = journal_match.group(3).strip()
         pages = normalize_pages(journal_match.group(4).strip())
     else:
-        place_publisher = re.match(r"([^:]+):\s*([^,]+)", after_title)
+        place_publisher = _PLACE_PUBLISHER.match(after_title)
         publisher = None
         place = None
         if place_publisher:
@@ -83,6 +89,23 @@ def parse_chicago_citation(text: str) -> Reference:
     return reference
 
 
+def _is_year_block(raw: str, token: Token) -> bool:
+    """Return whether ``token`` sits in an ``Authors. 2020. Title`` year block."""
+    before = token.start - 1
+    if before < 1 or not raw[before].isspace():
+        return False
+    while raw[before].isspace():
+        before -= 1
+    if raw[before] != ".":
+        return False
+    after = token.end
+    if token.value[-1] != ".":
+        if not raw.startswith(".", after):
+            return False
+        after += 1
+    return after < len(raw) and raw[after].isspace()
+
+
 def _parse_authors(segment: str) -> list[str]:
     cleaned = segment.rstrip(".").strip()
     if " and " in cleaned:
@@ -1,50 +1,47 @@
 """Parse IEEE-style citations."""
 from __future__ import annotations
 
-import re
-
 from ..reference import Reference
-from .shared import clean_locator, generate_cite_key, normalize_pages, split_authors_delimited
+from .lexer import LOCATOR, NO, PAGES, QUOTED, VOL, YEAR, first, tokenize
+from .shared import check_length, clean_locator, generate_cite_key, normalize_pages, split_authors_delimited
 
 
 def parse_ieee_citation(text: str) -> Reference:
     raw = text.strip().rstrip(".")
     if not raw:
         raise ValueError("Empty IEEE citation string")
+    check_length(raw, "IEEE")
 
-    title_match = re.search(r"\"([^\"]+)\"", raw)
-    if not title_match:
+    tokens = tokenize(raw)
+    title_token = first(tokens, QUOTED)
+    if not title_token:
         raise ValueError("IEEE citation missing title content")
-    title = title_match.group(1).strip().rstrip(",")
-    authors_segment = raw[: title_match.start()].rstrip(", ").strip()
-    post_title = raw[title_match.end() :].strip()
+    title = title_token.value.strip().rstrip(",")
+    authors_segment = raw[: title_token.start].rstrip(", ").strip()
 
-    tokens = [token.strip() for token in post_title.split(",") if token.strip()]
-    if not tokens:
+    container, container_end = _first_field(raw, title_token.end)
+    if not container:
         raise ValueError("IEEE citation missing container segment")
 
-    container = tokens[0]
     volume = issue = pages = year = doi = url = None
-    for token in tokens[1:]:
-        lowered = token.lower()
-        if lowered.startswith("vol."):
-            volume = token.split(" ", 1)[1].strip()
-        elif lowered.startswith("no."):
-            issue = token.split(" ", 1)[1].strip()
-        elif lowered.startswith("pp."):
-            pages = normalize_pages(token.split(" ", 1)[1].strip())
-        elif lowered.startswith("doi"):
-            doi = token.split(":", 1)[-1].strip()
-        elif token.startswith("10."):
-            doi = token.strip()
-        elif lowered.startswith("http"):
-            doi_candidate, url_candidate = clean_locator(token)
+    for token in tokens:
+        if token.start < container_end:
+            continue
+        kind = token.kind
+        if kind == VOL:
+            volume = token.value
+        elif kind == NO:
+            issue = token.value
+        elif kind == PAGES:
+            pages = normalize_pages(token.value)
+        elif kind == YEAR and token.value.isdigit():
+            year = token.value
+        elif kind == LOCATOR:
+            doi_candidate, url_candidate = clean_locator(token.value)
             if doi_candidate:
                 doi = doi_candidate
             elif url_candidate:
                 url = url_candidate
-        elif re.fullmatch(r"\d{4}", token):
-            year = token
 
     authors = _parse_authors(authors_segment)
     cite_key = generate_cite_key(authors, year, title)
@@ -64,6 +61,17 @@ def parse_ieee_citation(text: str) -> Reference:
     return reference
 
 
+def _first_field(raw: str, start: int) -> tuple[str, int]:
+    """Return the first non-empty comma-separated field after ``start`` and its end offset."""
+    while True:
+        comma = raw.find(",", start)
+        end = len(raw) if comma == -1 else comma
+        field = raw[start:end].strip()
+        if field or comma == -1:
+            return field, end
+        start = comma + 1
+
+
 def _parse_authors(segment: str) -> list[str]:
     parts = split_authors_delimited(segment, separators=[", and ", " and ", ", "])
     return [part.strip() for part in parts if part.strip()]
@@ -0,0 +1,112 @@
+"""Single-pass lexer shared by the citation parsers.
+
+:func:`tokenize` scans a citation once with one compiled pattern and returns
+the primitives the style parsers look for: quoted titles, parenthesized
+groups, years, ``vol.``/``no.``/``pp.`` locators and trailing DOIs or URLs.
+Free text between tokens (author lists, titles, container names) is not
+tokenized; parsers slice it out of the raw string by token offsets, and
+check punctuation next to a token the same way.
+"""
+from __future__ import annotations
+
+import re
+from typing import List, NamedTuple, Optional, Sequence
+
+YEAR = "YEAR"
+QUOTED = "QUOTED"
+LOCATOR = "LOCATOR"
+VOL = "VOL"
+NO = "NO"
+PAGES = "PAGES"
+PAREN = "PAREN"
+
+
+class Token(NamedTuple):
+    """A lexed primitive; ``value`` is its payload and ``start``/``end`` its span."""
+
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+# (kind, leading characters, rest of the pattern, value is the whole match).
+# Each rest holds exactly one group: the token value, or the span that tells
+# the rule apart when the whole match is the value. ``(?<!\w.)`` right after
+# the leading character acts as a word boundary in front of it.
+_RULES = (
+    (QUOTED, '"', r'([^"]+)"', False),
+    (PAREN, "(", r"([^()]+)\)", False),
+    (LOCATOR, "h", r"(ttps?://\S*[^\s.,;])", True),
+    (LOCATOR, "dD", r"(?<!\w.)((?i:oi):\s*10\.\S*[^\s.,;])", True),
+    (LOCATOR, "1", r"(?<!\S.)(0\.\d{4,9}/\S*[^\s.,;])", True),
+    (VOL, "vV", r"(?<!\w.)(?i:ol)\.\s*(\w+(?:[–-]\w+)?)", False),
+    (NO, "nN", r"(?<!\w.)(?i:o)\.\s*(\w+(?:[–-]\w+)?)", False),
+    (PAGES, "pP", r"(?<!\w.)(?i:p)\.\s*([\w–-]+)", False),
+    (YEAR, "12", r"(?<!\w.)(\d{3})(?!\w)", True),
+    (YEAR, "n", r"(?<!\w.)(\.d\.)", True),
+)
+
+
+def _compile_rules() -> tuple[re.Pattern[str], List[tuple[str, bool]]]:
+    # Every top-level branch starts with a literal character, which lets the
+    # regex engine skip straight to candidate positions instead of trying
+    # each rule at every offset.
+    branches: List[str] = []
+    groups: List[tuple[str, bool]] = [("", False)]
+    for kind, leading, rest, whole in _RULES:
+        for char in leading:
+            branches.append(re.escape(char) + rest)
+            groups.append((kind, whole))
+    return re.compile("|".join(branches)), groups
+
+
+_MASTER, _GROUPS = _compile_rules()
+
+
+def tokenize(text: str) -> List[Token]:
+    """Return the tokens of ``text`` in order of appearance."""
+    tokens: List[Token] = []
+    for match in _MASTER.finditer(text):
+        index = match.lastindex
+        kind, whole = _GROUPS[index]
+        value = match.group() if whole else match.group(index)
+        tokens.append(Token(kind, value, match.start(), match.end()))
+    return tokens
+
+
+def first(tokens: Sequence[Token], kind: str, start: int = 0) -> Optional[Token]:
+    """Return the first ``kind`` token beginning at or after offset ``start``."""
+    for token in tokens:
+        if token.kind == kind and token.start >= start:
+            return token
+    return None
+
+
+def trailing_locator(tokens: Sequence[Token], text: str, start: int = 0) -> Optional[Token]:
+    """Return the final token if it is a DOI/URL that ends ``text``.
+
+    Only closing ``.``/``,``/``;`` may follow it, and it must begin at or
+    after offset ``start``.
+    """
+    if not tokens:
+        return None
+    token = tokens[-1]
+    if token.kind != LOCATOR or token.start < start or text[token.end :].rstrip().strip(".,;"):
+        return None
+    return token
+
+
+__all__ = [
+    "LOCATOR",
+    "NO",
+    "PAGES",
+    "PAREN",
+    "QUOTED",
+    "Token",
+    "VOL",
+    "YEAR",
+    "first",
+    "tokenize",
+    "trailing_locator",
+]
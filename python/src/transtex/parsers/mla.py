@@ -1,10 +1,10 @@
 """Parse MLA 9th citations."""
 from __future__ import annotations
 
-import re
-
 from ..reference import Reference
+from .lexer import NO, PAGES, QUOTED, VOL, YEAR, first, tokenize, trailing_locator
 from .shared import (
+    check_length,
     clean_locator,
     generate_cite_key,
     normalize_pages,
@@ -17,48 +17,48 @@ def parse_mla_citation(text: str) -> Reference:
     raw = text.strip()
     if not raw:
         raise ValueError("Empty MLA citation string")
+    check_length(raw, "MLA")
 
-    title_match = re.search(r"\"(.+?)\"", raw)
-    if not title_match:
+    tokens = tokenize(raw)
+    title_token = first(tokens, QUOTED)
+    if not title_token:
         raise ValueError("MLA citation missing title")
-    authors_segment = raw[: title_match.start()].strip().rstrip(".")
-    title = strip_trailing_period(title_match.group(1).strip())
-    after_title = raw[title_match.end() :].strip()
+    authors_segment = raw[: title_token.start].strip().rstrip(".")
+    title = strip_trailing_period(title_token.value.strip())
 
     locator = None
-    locator_match = re.search(r"(https?://\S+|10\.\S+)\.?$", after_title)
-    if locator_match:
-        locator = locator_match.group(1).strip()
-        after_title = after_title[: locator_match.start()].strip().rstrip(",")
+    after_end = len(raw)
+    locator_token = trailing_locator(tokens, raw, title_token.end)
+    if locator_token:
+        locator = locator_token.value
+        after_end = locator_token.start
+    after_title = raw[title_token.end : after_end].strip()
+    if locator_token:
+        after_title = after_title.rstrip(",")
+
+    volume = issue = pages = year = None
+    for token in tokens:
+        if token.start < title_token.end or token.end > after_end:
+            continue
+        kind = token.kind
+        if kind == VOL and volume is None:
+            volume = token.value
+        elif kind == NO and issue is None:
+            issue = token.value
+        elif kind == PAGES and pages is None:
+            pages = normalize_pages(token.value)
+        elif kind == YEAR and year is None and token.value.isdigit():
+            year = token.value
 
     container = None
-    year = None
     publisher = None
-    if "vol." in after_title.lower() or "no." in after_title.lower():
+    if volume is not None or issue is not None:
         container = after_title.split(",", 1)[0].strip()
     else:
         # Attempt book/web form: Publisher, Year
         parts = [piece.strip() for piece in after_title.split(",") if piece.strip()]
         if parts:
             publisher = parts[0]
-        if len(parts) > 1 and re.fullmatch(r"\d{4}", parts[1]):
-            year = parts[1]
-
-    volume = None
-    issue = None
-    pages = None
-    vol_match = re.search(r"vol\.\s*([\w]+)", after_title, re.IGNORECASE)
-    if vol_match:
-        volume = vol_match.group(1)
-    issue_match = re.search(r"no\.\s*([\w]+)", after_title, re.IGNORECASE)
-    if issue_match:
-        issue = issue_match.group(1)
-    year_match = re.search(r"(\d{4})", after_title)
-    if year_match:
-        year = year_match.group(1)
-    pages_match = re.search(r"pp\.\s*([\w–-]+)", after_title, re.IGNORECASE)
-    if pages_match:
-        pages = normalize_pages(pages_match.group(1))
 
     reference = Reference(
         entry_type="article" if container else "book",
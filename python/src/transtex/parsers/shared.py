@@ -2,10 +2,26 @@
 from __future__ import annotations
 
 import re
+import threading
 from typing import Iterable, List
 
 from ..reference import Reference
 
+# Longest citation string the parsers accept. Real citations stay well under
+# this; anything longer is rejected before any pattern runs.
+MAX_CITATION_LENGTH = 4096
+
+_NON_ALNUM = re.compile(r"[^A-Za-z0-9]+")
+_PAGE_HYPHEN = re.compile(r"(?<=\d)-(?=\d)")
+_SEPARATOR_PATTERNS: dict[tuple[str, ...], re.Pattern[str]] = {}
+_SEPARATOR_LOCK = threading.Lock()
+
+
+def check_length(raw: str, style: str) -> None:
+    """Reject citation strings longer than :data:`MAX_CITATION_LENGTH`."""
+    if len(raw) > MAX_CITATION_LENGTH:
+        raise ValueError(f"{style} citation exceeds {MAX_CITATION_LENGTH} characters")
+
 
 def clean_locator(locator: str | None) -> tuple[str | None, str | None]:
     """Split locator into doi/url."""
@@ -30,8 +46,7 @@ def clean_locator(locator: str | None) -> tuple[str | None, str | None]:
 def generate_cite_key(authors: list[str], year: str | None, title: str | None) -> str:
     """Generate a simple cite key from author/year/title."""
     def _slug(value: str) -> str:
-        alnum = re.sub(r"[^A-Za-z0-9]+", "", value)
-        return alnum.lower()
+        return _NON_ALNUM.sub("", value).lower()
 
     first_author = authors[0] if authors else ""
     author_piece = _slug(first_author.split(",")[0] if "," in first_author else first_author.split()[-1] if first_author else "anon")
@@ -46,7 +61,7 @@ def normalize_pages(pages: str | None) -> str | None:
     if not pages:
         return None
     cleaned = pages.strip().rstrip(".,;")
-    return re.sub(r"(?<=\d)-(?=\d)", "–", cleaned)
+    return _PAGE_HYPHEN.sub("–", cleaned) if "-" in cleaned else cleaned
 
 
 def strip_trailing_period(text: str) -> str:
@@ -58,8 +73,12 @@ def split_authors_delimited(segment: str, separators: Iterable[str]) -> list[str
     cleaned = segment.strip().rstrip(".")
     if not cleaned:
         return []
-    pattern = "|".join(re.escape(sep) for sep in separators)
-    parts = re.split(pattern, cleaned)
+    key = tuple(separators)
+    pattern = _SEPARATOR_PATTERNS.get(key)
+    if pattern is None:
+        with _SEPARATOR_LOCK:
+            pattern = _SEPARATOR_PATTERNS.setdefault(key, re.compile("|".join(re.escape(sep) for sep in key)))
+    parts = pattern.split(cleaned)
     return [part.strip() for part in parts if part.strip()]
 
 
@@ -71,6 +90,8 @@ def capitalize_sentence(text: str) -> str:
 
 
 __all__ = [
+    "MAX_CITATION_LENGTH",
+    "check_length",
     "clean_locator",
     "generate_cite_key",
     "normalize_pages",
@@ -4,29 +4,36 @@ from __future__ import annotations
 import re
 
 from ..reference import Reference
-from .shared import capitalize_sentence, clean_locator, generate_cite_key, normalize_pages
+from .lexer import LOCATOR, first, tokenize
+from .shared import capitalize_sentence, check_length, clean_locator, generate_cite_key, normalize_pages
+
+_TIMELINE = re.compile(r"(\d{4});?([\d()]+)?:?([\w–-]+)?")
 
 
 def parse_vancouver_citation(text: str) -> Reference:
     raw = text.strip()
     if not raw:
         raise ValueError("Empty Vancouver citation string")
+    check_length(raw, "Vancouver")
 
-    match = re.match(
-        r"^(?P<authors>[^.]+)\.\s+(?P<title>[^.]+)\.\s+(?P<journal>[^.]+)\.\s+(?P<timeline>[^.]+)\.?\s*(?P<locator>.*)$",
-        raw,
-    )
-    if not match:
+    periods = _sentence_periods(raw)
+    if periods is None:
         raise ValueError("Vancouver citation missing expected segments")
+    authors_end, title_end, journal_end = periods
+    timeline_end = raw.find(".", journal_end + 1)
+    if timeline_end == -1:
+        timeline_end = len(raw)
 
-    authors_segment = match.group("authors").strip()
-    title = capitalize_sentence(match.group("title").strip())
-    journal_segment = match.group("journal").strip()
-    timeline_segment = match.group("timeline").strip()
-    locator_segment = match.group("locator").strip()
+    authors_segment = raw[:authors_end].strip()
+    title = capitalize_sentence(raw[authors_end + 1 : title_end].strip())
+    journal_segment = raw[title_end + 1 : journal_end].strip()
+    timeline_segment = raw[journal_end + 1 : timeline_end].strip()
+    if not timeline_segment:
+        raise ValueError("Vancouver citation missing expected segments")
+    locator_token = first(tokenize(raw[timeline_end:]), LOCATOR)
 
     year = volume = issue = pages = None
-    timeline_match = re.match(r"(\d{4});?([\d()]+)?:?([\w–-]+)?", timeline_segment)
+    timeline_match = _TIMELINE.match(timeline_segment)
     if timeline_match:
         year = timeline_match.group(1)
         vol_issue = timeline_match.group(2) or ""
@@ -49,12 +56,29 @@ def parse_vancouver_citation(text: str) -> Reference:
         year=year,
     )
 
-    doi, url = clean_locator(locator_segment)
+    doi, url = clean_locator(locator_token.value if locator_token else None)
     reference.doi = doi
     reference.url = url
     return reference
 
 
+def _sentence_periods(raw: str) -> tuple[int, int, int] | None:
+    """Return the offsets of the periods closing the authors, title and journal.
+
+    Each of those segments is period-free and non-empty, and each closing
+    period is followed by whitespace.
+    """
+    offsets = []
+    start = 0
+    for _ in range(3):
+        period = raw.find(".", start)
+        if period <= start or period + 1 >= len(raw) or not raw[period + 1].isspace():
+            return None
+        offsets.append(period)
+        start = period + 1
+    return offsets[0], offsets[1], offsets[2]
+
+
 def _parse_authors(segment: str) -> list[str]:
     cleaned = segment.strip()
     if not cleaned:
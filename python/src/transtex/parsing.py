@@ -1,9 +1,12 @@
 """Public citation parsing interface."""
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Optional
 
 from .bibtex import reference_to_bibtex
+from .cache import ParseCache
+from .detection import StyleDetection, detect_style
+from .normalization import normalize_citation_text
 from .parsers import (
     parse_apa_citation as _parse_apa_citation_impl,
     parse_chicago_citation as _parse_chicago_citation_impl,
@@ -18,24 +21,19 @@ class CitationParseError(ValueError):
     """Raised when a formatted citation string cannot be parsed."""
 
 
-def parse_citation(style: str, text: str) -> Reference:
-    """Parse a formatted citation string into a Reference."""
+def parse_citation(style: str, text: str, cache: Optional[ParseCache] = None) -> Reference:
+    """Parse a formatted citation string into a Reference.
+
+    Pass ``"auto"`` as the style to run :func:`detect_style` first. The text
+    goes through :func:`normalize_citation_text` once before parsing. With a
+    :class:`ParseCache`, repeated citation strings skip the parser and
+    receive a copy of the earlier result.
+    """
     normalized_style = style.strip().lower()
-    parsers: dict[str, Callable[[str], Reference]] = {
-        "apa": parse_apa_citation,
-        "apa6": parse_apa_citation,
-        "apa7": parse_apa_citation,
-        "ieee": parse_ieee_citation,
-        "chicago": parse_chicago_citation,
-        "mla": parse_mla_citation,
-        "vancouver": parse_vancouver_citation,
-    }
-    parser = parsers.get(normalized_style)
-    if not parser:
-        raise CitationParseError(
-            "Unsupported style '{style}'. Supported: apa, apa7, ieee, chicago, mla, vancouver"
-        )
-    return parser(text)
+    text = normalize_citation_text(text)
+    if cache is not None:
+        return cache.parse(normalized_style, text, lambda value: _parse_normalized(normalized_style, value))
+    return _parse_normalized(normalized_style, text)
 
 
 def citation_to_bibtex(style: str, text: str) -> str:
@@ -45,42 +43,65 @@ def citation_to_bibtex(style: str, text: str) -> str:
 
 
 def parse_apa_citation(text: str) -> Reference:
-    try:
-        return _parse_apa_citation_impl(text)
-    except ValueError as exc:
-        raise CitationParseError(str(exc)) from exc
+    return _run(_parse_apa_citation_impl, normalize_citation_text(text))
 
 
 def parse_ieee_citation(text: str) -> Reference:
-    try:
-        return _parse_ieee_citation_impl(text)
-    except ValueError as exc:
-        raise CitationParseError(str(exc)) from exc
+    return _run(_parse_ieee_citation_impl, normalize_citation_text(text))
 
 
 def parse_chicago_citation(text: str) -> Reference:
-    try:
-        return _parse_chicago_citation_impl(text)
-    except ValueError as exc:
-        raise CitationParseError(str(exc)) from exc
+    return _run(_parse_chicago_citation_impl, normalize_citation_text(text))
 
 
 def parse_mla_citation(text: str) -> Reference:
-    try:
-        return _parse_mla_citation_impl(text)
-    except ValueError as exc:
-        raise CitationParseError(str(exc)) from exc
+    return _run(_parse_mla_citation_impl, normalize_citation_text(text))
 
 
 def parse_vancouver_citation(text: str) -> Reference:
+    return _run(_parse_vancouver_citation_impl, normalize_citation_text(text))
+
+
+def _parse_normalized(style: str, text: str) -> Reference:
+    if style == "auto":
+        detected = detect_style(text)
+        if detected.style is None:
+            raise CitationParseError("Could not detect the citation style")
+        if detected.reference is not None:
+            return detected.reference
+        style = detected.style
+    parser = _PARSERS.get(style)
+    if not parser:
+        raise CitationParseError(
+            f"Unsupported style '{style}'. Supported: apa, apa7, ieee, chicago, mla, vancouver, auto"
+        )
+    return _run(parser, text)
+
+
+def _run(parser: Callable[[str], Reference], text: str) -> Reference:
     try:
-        return _parse_vancouver_citation_impl(text)
+        return parser(text)
     except ValueError as exc:
         raise CitationParseError(str(exc)) from exc
 
 
+# Style implementations; text reaching them is already normalized.
+_PARSERS: dict[str, Callable[[str], Reference]] = {
+    "apa": _parse_apa_citation_impl,
+    "apa6": _parse_apa_citation_impl,
+    "apa7": _parse_apa_citation_impl,
+    "ieee": _parse_ieee_citation_impl,
+    "chicago": _parse_chicago_citation_impl,
+    "mla": _parse_mla_citation_impl,
+    "vancouver": _parse_vancouver_citation_impl,
+}
+
+
 __all__ = [
     "CitationParseError",
+    "StyleDetection",
+    "detect_style",
+    "normalize_citation_text",
     "parse_citation",
     "citation_to_bibtex",
     "parse_apa_citation",
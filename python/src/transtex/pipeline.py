@@ -0,0 +1,208 @@
+"""Lazy, composable read → filter → map → format → write pipelines."""
+from __future__ import annotations
+
+import os
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from .batch import (
+    DEFAULT_CHUNKSIZE,
+    _capture,
+    _convert_chunk,
+    _convert_chunk_captured,
+    _format_chunk,
+    _format_chunk_captured,
+    _formatter_style,
+    _parse_chunk,
+    _parse_chunk_captured,
+    _parser_style,
+    _run,
+)
+from .bibtex import iter_bibtex_entries, parse_bibtex_entry, reference_to_bibtex
+
+PathOrFile = Union[str, "os.PathLike[str]", TextIO]
+_Stage = Callable[[Iterator[Any]], Iterator[Any]]
+
+
+class Pipeline:
+    """A chain of lazy stages over a stream of items.
+
+    Each builder method returns a new pipeline with one more stage; nothing
+    is read until the pipeline is iterated or written. Stages are chained
+    generators, so items stream through the whole chain in a single pass
+    and memory stays constant however long the input is.
+
+    :meth:`map`, :meth:`parse`, :meth:`format` and :meth:`convert` handle
+    one item at a time on the calling thread by default. Given ``workers``
+    they run on a process pool (or a thread pool with
+    ``executor="thread"``) in chunks of ``chunksize`` items, with only a
+    few chunks in flight, and still yield results in input order.
+    Functions passed to :meth:`map` must be picklable for a process pool.
+
+    >>> read_bib("refs.bib").filter(lambda ref: ref.entry_type == "article").format("ieee").write("refs.txt")
+    """
+
+    def __init__(self, source: Union[Iterable[Any], Callable[[], Iterable[Any]]], *, _stages: Tuple[_Stage, ...] = ()):
+        self._source = source
+        self._stages = _stages
+
+    def __iter__(self) -> Iterator[Any]:
+        items = iter(self._source() if callable(self._source) else self._source)
+        for stage in self._stages:
+            items = stage(items)
+        return items
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "Pipeline":
+        """Keep the items for which ``predicate`` returns true."""
+        return self._then(partial(filter, predicate))
+
+    def map(
+        self,
+        function: Callable[[Any], Any],
+        *,
+        workers: Optional[int] = 1,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        executor: str = "process",
+    ) -> "Pipeline":
+        """Replace each item with ``function(item)``."""
+        return self._parallel(partial(_map_chunk, function), workers, chunksize, executor)
+
+    def parse(
+        self,
+        style: str = "auto",
+        *,
+        errors: str = "raise",
+        workers: Optional[int] = 1,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        executor: str = "process",
+    ) -> "Pipeline":
+        """Parse citation strings into references, as :func:`transtex.parse_many` does."""
+        if _capture(errors):
+            task = partial(_parse_chunk_captured, _parser_style(style))
+        else:
+            task = partial(_parse_chunk, _parser_style(style))
+        return self._parallel(task, workers, chunksize, executor)
+
+    def format(
+        self,
+        style: str,
+        *,
+        errors: str = "raise",
+        workers: Optional[int] = 1,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        executor: str = "process",
+    ) -> "Pipeline":
+        """Format references in ``style``, as :func:`transtex.format_many` does."""
+        if _capture(errors):
+            task = partial(_format_chunk_captured, _formatter_style(style))
+        else:
+            task = partial(_format_chunk, _formatter_style(style))
+        return self._parallel(task, workers, chunksize, executor)
+
+    def convert(
+        self,
+        from_style: str,
+        to_style: str,
+        *,
+        errors: str = "raise",
+        workers: Optional[int] = 1,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        executor: str = "process",
+    ) -> "Pipeline":
+        """Convert citation strings between styles in one stage.
+
+        Unlike ``.parse(...).format(...)``, parsed references never leave the
+        worker, which saves pickling them on a process pool.
+        """
+        source, target = _parser_style(from_style), _formatter_style(to_style)
+        if _capture(errors):
+            task = partial(_convert_chunk_captured, source, target)
+        else:
+            task = partial(_convert_chunk, source, target)
+        return self._parallel(task, workers, chunksize, executor)
+
+    def bibtex(self, *, encode_latex: bool = False) -> "Pipeline":
+        """Render references as BibTeX entries."""
+        return self._then(partial(map, partial(reference_to_bibtex, encode_latex=encode_latex)))
+
+    def write(self, target: PathOrFile, *, end: str = "\n") -> int:
+        """Run the pipeline, writing each (string) item followed by ``end``.
+
+        ``target`` is an open text file or a path, which is created or
+        truncated as UTF-8. Returns the number of items written.
+        """
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, "w", encoding="utf-8") as handle:
+                return self.write(handle, end=end)
+        count = 0
+        for item in self:
+            target.write(item)
+            target.write(end)
+            count += 1
+        return count
+
+    def collect(self) -> List[Any]:
+        """Run the pipeline and return its items as a list."""
+        return list(self)
+
+    def _then(self, stage: _Stage) -> "Pipeline":
+        return Pipeline(self._source, _stages=(*self._stages, stage))
+
+    def _parallel(
+        self,
+        task: Callable[[List[Any]], List[Any]],
+        workers: Optional[int],
+        chunksize: int,
+        executor: str,
+    ) -> "Pipeline":
+        # Validate now so a bad option fails when the pipeline is built, not
+        # halfway through the input.
+        _run(task, (), workers, chunksize, True, executor)
+        if workers == 1:
+            return self._then(partial(map, partial(_call_one, task)))
+        return self._then(lambda items: _run(task, items, workers, chunksize, True, executor))
+
+
+def read_bib(source: PathOrFile, *, decode_latex: bool = False) -> Pipeline:
+    """Start a pipeline over the references in a BibTeX file.
+
+    ``source`` is a path, opened afresh each time the pipeline runs, or an
+    open text file. Entries are read and parsed one at a time.
+    """
+    return Pipeline(partial(_bib_references, source, decode_latex))
+
+
+def read_citations(source: PathOrFile) -> Pipeline:
+    """Start a pipeline over the non-blank lines of a file of citations."""
+    return Pipeline(partial(_citation_lines, source))
+
+
+def _open_lines(source: PathOrFile) -> Iterator[str]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as handle:
+            yield from handle
+    else:
+        yield from source
+
+
+def _bib_references(source: PathOrFile, decode_latex: bool) -> Iterator[Any]:
+    for entry in iter_bibtex_entries(_open_lines(source)):
+        yield parse_bibtex_entry(entry, decode_latex=decode_latex)
+
+
+def _citation_lines(source: PathOrFile) -> Iterator[str]:
+    for line in _open_lines(source):
+        text = line.strip()
+        if text:
+            yield text
+
+
+def _call_one(task: Callable[[List[Any]], List[Any]], item: Any) -> Any:
+    return task([item])[0]
+
+
+def _map_chunk(function: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    return [function(item) for item in items]
+
+
+__all__ = ["Pipeline", "read_bib", "read_citations"]
@@ -35,6 +35,15 @@ class Reference:
     url: Optional[str] = None
     extra_fields: Dict[str, str] = field(default_factory=dict)
 
+    def copy(self) -> "Reference":
+        """Return an independent copy; list and dict fields are duplicated."""
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.authors = list(self.authors)
+        clone.editors = list(self.editors)
+        clone.extra_fields = dict(self.extra_fields)
+        return clone
+
     def normalized_authors(self) -> List[str]:
         """Return authors stripped of surrounding whitespace."""
         return [author.strip() for author in self.authors if author.strip()]
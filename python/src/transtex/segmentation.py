@@ -0,0 +1,242 @@
+"""Split plain-text reference lists into individual citations."""
+from __future__ import annotations
+
+import io
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Union
+
+from .cache import ParseCache
+from .parsing import CitationParseError, parse_citation
+from .reference import Reference
+
+_MARKER = re.compile(r"\s*(?:\[(\d{1,4})\]|(\d{1,4})[.)])\s+")
+# Characters that open, close or separate parts of a multi-citation field.
+# URLs and DOIs match as a whole so their ";" and "(" are skipped; a ";"
+# followed by whitespace still ends them.
+_PART_EVENTS = re.compile(
+    r"(?P<url>(?:https?://|doi:\s*10\.|\b10\.\d{4,9}/)[^\s;]*(?:;(?=\S)[^\s;]*)*)"
+    r"|[;\"\u201c\u201d()\[\]]"
+)
+_CLOSERS = {")": "(", "]": "["}
+
+LAYOUTS = ("auto", "numbered", "hanging", "paragraph")
+
+
+@dataclass(frozen=True)
+class CitationBlock:
+    """One citation found in a reference list, with 1-based inclusive line numbers."""
+
+    text: str
+    start_line: int
+    end_line: int
+
+
+@dataclass(frozen=True)
+class CitationPart:
+    """One part of a multi-citation field.
+
+    ``index`` counts parts from 0 and ``line`` is the 1-based source line.
+    Exactly one of ``reference`` and ``error`` is set.
+    """
+
+    index: int
+    line: int
+    text: str
+    reference: Optional[Reference] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class ParsedCitation:
+    """A parsed :class:`Reference` together with its source line span."""
+
+    reference: Reference
+    start_line: int
+    end_line: int
+
+
+def iter_citation_blocks(
+    source: Union[str, Iterable[str]],
+    *,
+    layout: str = "auto",
+) -> Iterator[CitationBlock]:
+    """Yield the citations contained in a plain-text reference list.
+
+    ``source`` is a string or any iterable of lines (such as an open file),
+    which is consumed lazily so only the current citation is held in memory.
+    ``layout`` selects how entries are delimited:
+
+    * ``numbered``: every entry starts with ``[1]``, ``1.`` or ``1)``; the
+      marker is removed and unmarked lines continue the current entry. After
+      the first entry only the next number in sequence starts an entry, so
+      a wrapped line beginning with ``2020.`` is not mistaken for one.
+    * ``hanging``: entries start at column zero and continue on indented lines.
+    * ``paragraph``: entries are separated by blank lines.
+    * ``auto`` (default): numbered once a marker is seen, hanging once an
+      indented continuation is seen, paragraph when blank lines separate
+      unindented entries.
+
+    Blank lines always end the current entry.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unsupported layout '{layout}'. Supported layouts: {', '.join(LAYOUTS)}")
+    lines = io.StringIO(source) if isinstance(source, str) else source
+
+    current: List[str] = []
+    start_line = end_line = 0
+    detected: Optional[str] = None if layout == "auto" else layout
+    last_number: Optional[int] = None
+    for line_number, line in enumerate(lines, start=1):
+        stripped = line.strip()
+        if not stripped:
+            if current:
+                yield CitationBlock(" ".join(current), start_line, end_line)
+                current = []
+                if detected is None:
+                    detected = "paragraph"
+            continue
+
+        marker = _MARKER.match(line) if detected in (None, "numbered") else None
+        if marker:
+            number = int(marker.group(1) or marker.group(2))
+            if last_number is not None and number != last_number + 1:
+                marker = None
+        indented = line[:1].isspace()
+        if marker:
+            detected = "numbered"
+            last_number = number
+            starts_entry = True
+            stripped = line[marker.end() :].strip()
+        elif not current:
+            starts_entry = True
+        elif detected == "numbered" or (detected == "paragraph" and not indented):
+            starts_entry = False
+        elif indented:
+            if layout == "auto":
+                detected = "hanging"
+            starts_entry = False
+        else:
+            starts_entry = True
+
+        if starts_entry and current:
+            yield CitationBlock(" ".join(current), start_line, end_line)
+            current = []
+        if not current:
+            start_line = line_number
+        current.append(stripped)
+        end_line = line_number
+
+    if current:
+        yield CitationBlock(" ".join(current), start_line, end_line)
+
+
+def parse_reference_list(
+    source: Union[str, Iterable[str]],
+    style: str,
+    *,
+    layout: str = "auto",
+    skip_invalid: bool = False,
+) -> Iterator[ParsedCitation]:
+    """Segment a plain-text reference list and parse every entry in ``style``.
+
+    ``style`` may be ``"auto"`` to detect the style per entry. Entries that
+    fail to parse raise :class:`CitationParseError` naming their line span,
+    or are dropped when ``skip_invalid`` is true.
+    """
+    for block in iter_citation_blocks(source, layout=layout):
+        try:
+            reference = parse_citation(style, block.text)
+        except CitationParseError as exc:
+            if skip_invalid:
+                continue
+            raise CitationParseError(
+                f"Lines {block.start_line}-{block.end_line}: {exc}"
+            ) from exc
+        yield ParsedCitation(reference, block.start_line, block.end_line)
+
+
+def iter_citation_parts(source: Union[str, Iterable[str]]) -> Iterator[CitationBlock]:
+    """Split fields that pack several citations into one string.
+
+    Parts are separated by newlines and by semicolons outside quotes,
+    parentheses, brackets and URLs. A semicolon directly followed by a digit
+    is kept, so Vancouver ``2020;42(7):1-10`` timelines stay intact. Lines
+    are read lazily from iterables, and parts are yielded as they are found.
+    """
+    lines = io.StringIO(source) if isinstance(source, str) else source
+    for line_number, line in enumerate(lines, start=1):
+        for text in _split_parts(line):
+            yield CitationBlock(text, line_number, line_number)
+
+
+def parse_citations(
+    style: str,
+    source: Union[str, Iterable[str]],
+    *,
+    cache: Optional[ParseCache] = None,
+) -> Iterator[CitationPart]:
+    """Parse every part of a multi-citation field in ``style``.
+
+    Yields one :class:`CitationPart` per part in input order, carrying the
+    parsed reference or the parse error message, so a bad part never stops
+    the rest. Only the current part is held in memory.
+    """
+    for index, block in enumerate(iter_citation_parts(source)):
+        try:
+            reference = parse_citation(style, block.text, cache=cache)
+        except CitationParseError as exc:
+            yield CitationPart(index, block.start_line, block.text, error=str(exc))
+        else:
+            yield CitationPart(index, block.start_line, block.text, reference=reference)
+
+
+def _split_parts(line: str) -> Iterator[str]:
+    start = 0
+    quote: Optional[str] = None
+    brackets: List[str] = []
+    for match in _PART_EVENTS.finditer(line):
+        char = match.group()
+        if match.lastgroup == "url":
+            continue
+        if char == '"':
+            if quote is None:
+                quote = '"'
+            elif quote == '"':
+                quote = None
+        elif char == "\u201c":
+            quote = quote or "\u201d"
+        elif char == "\u201d":
+            if quote == "\u201d":
+                quote = None
+        elif quote is not None:
+            continue
+        elif char in "([":
+            brackets.append(char)
+        elif char in _CLOSERS:
+            if brackets and brackets[-1] == _CLOSERS[char]:
+                brackets.pop()
+        elif not brackets and not line[match.end() : match.end() + 1].isdigit():
+            part = line[start : match.start()].strip()
+            if part:
+                yield part
+            start = match.end()
+    part = line[start:].strip()
+    if part:
+        yield part
+
+
+__all__ = [
+    "CitationBlock",
+    "CitationPart",
+    "LAYOUTS",
+    "ParsedCitation",
+    "iter_citation_blocks",
+    "iter_citation_parts",
+    "parse_citations",
+    "parse_reference_list",
+]
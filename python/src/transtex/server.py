@@ -0,0 +1,340 @@
+"""Stdlib HTTP service exposing batch parse, format and convert endpoints.
+
+Endpoints take and return JSON over HTTP/1.1 keep-alive connections:
+
+* ``POST /convert`` ``{"from": "apa", "to": "ieee", "citations": [...]}``
+* ``POST /parse`` ``{"style": "auto", "citations": [...]}``
+* ``POST /format`` ``{"style": "apa7", "references": [{...}, ...]}``
+* ``GET /health``
+
+A single ``"citation"`` string may be sent instead of ``"citations"``.
+Responses carry ``{"results": [...]}`` with one ``{"value": ...}`` or
+``{"error": {"code", "message", "stage"}}`` object per item, in order.
+"""
+from __future__ import annotations
+
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .batch import (
+    BatchResult,
+    _convert_chunk_captured,
+    _format_chunk_captured,
+    _formatter_style,
+    _parse_chunk_captured,
+    _parser_style,
+)
+from .converter import ConversionError
+from .reference import Reference
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+_Task = Callable[[List[Any]], List[BatchResult]]
+
+
+class _BadRequest(ValueError):
+    pass
+
+
+class _Batch:
+    def __init__(self, task: _Task) -> None:
+        self.task = task
+        self.items: List[Any] = []
+        self.waiters: List[Tuple[int, int, "Future[List[BatchResult]]"]] = []
+
+
+class Coalescer:
+    """Merge items from concurrent requests into one batch call.
+
+    The first request for an operation waits ``window`` seconds for others
+    to join, then runs the combined batch in its own thread and hands each
+    request its slice of the results. A batch that reaches ``max_batch``
+    items runs at once in the thread that filled it.
+    """
+
+    def __init__(self, window: float = 0.002, max_batch: int = 1024) -> None:
+        self.window = window
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._batches: Dict[Tuple[str, ...], _Batch] = {}
+
+    def submit(self, key: Tuple[str, ...], task: _Task, items: List[Any]) -> List[BatchResult]:
+        future: Future[List[BatchResult]] = Future()
+        with self._lock:
+            batch = self._batches.get(key)
+            leader = batch is None
+            if batch is None:
+                batch = self._batches[key] = _Batch(task)
+            batch.waiters.append((len(batch.items), len(items), future))
+            batch.items.extend(items)
+            full = len(batch.items) >= self.max_batch
+            if full:
+                del self._batches[key]
+        if full:
+            self._run(batch)
+        elif leader:
+            time.sleep(self.window)
+            with self._lock:
+                mine = self._batches.get(key) is batch
+                if mine:
+                    del self._batches[key]
+            if mine:
+                self._run(batch)
+        return future.result()
+
+    @staticmethod
+    def _run(batch: _Batch) -> None:
+        try:
+            results = batch.task(batch.items)
+        except BaseException as exc:
+            for _, _, future in batch.waiters:
+                future.set_exception(exc)
+            return
+        for start, count, future in batch.waiters:
+            future.set_result(results[start : start + count])
+
+
+class TransTexServer(ThreadingHTTPServer):
+    """Threaded HTTP server carrying the :class:`Coalescer` shared by its handlers."""
+
+    daemon_threads = True
+    # socketserver's default backlog of 5 resets bursts of new connections.
+    request_queue_size = 1024
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        *,
+        window: float = 0.002,
+        max_batch: int = 1024,
+        bind_and_activate: bool = True,
+    ) -> None:
+        super().__init__(address, _Handler, bind_and_activate=bind_and_activate)
+        self.coalescer = Coalescer(window, max_batch)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # second waits for the client's delayed ACK on keep-alive connections.
+    disable_nagle_algorithm = True
+    server: TransTexServer
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"no such endpoint: {self.path}"})
+
+    def do_POST(self) -> None:
+        if "Content-Length" not in self.headers:
+            # Without a length the body cannot be told apart from the next
+            # request on the connection, so refuse it and hang up.
+            self.close_connection = True
+            self._send(HTTPStatus.LENGTH_REQUIRED, {"error": "Content-Length is required"})
+            return
+        route = _ROUTES.get(self.path)
+        if route is None:
+            self._discard_body()
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"no such endpoint: {self.path}"})
+            return
+        try:
+            payload = self._read_json()
+            key, task, items = route(payload)
+        except _BadRequest as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        except ConversionError as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        results = self.server.coalescer.submit(key, task, items) if items else []
+        self._send(HTTPStatus.OK, {"results": [_result_json(result) for result in results]})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Per-request access logs would dominate the cost of small requests.
+        pass
+
+    def _read_json(self) -> Any:
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            self.close_connection = True
+            raise _BadRequest(f"Content-Length must be between 0 and {MAX_BODY_BYTES}")
+        try:
+            return json.loads(self.rfile.read(length) or b"null")
+        except ValueError as exc:
+            raise _BadRequest(f"invalid JSON: {exc}") from None
+
+    def _discard_body(self) -> None:
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = 0
+        if 0 < length <= MAX_BODY_BYTES:
+            self.rfile.read(length)
+        else:
+            self.close_connection = True
+
+    def _send(self, status: HTTPStatus, body: Any) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _citations(payload: Dict[str, Any]) -> List[str]:
+    if "citation" in payload:
+        items = [payload["citation"]]
+    else:
+        items = payload.get("citations")
+    if not isinstance(items, list) or not all(isinstance(item, str) for item in items):
+        raise _BadRequest("expected 'citation' string or 'citations' list of strings")
+    return items
+
+
+def _object(payload: Any) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise _BadRequest("request body must be a JSON object")
+    return payload
+
+
+def _string(payload: Dict[str, Any], name: str, default: Optional[str] = None) -> str:
+    value = payload.get(name, default)
+    if not isinstance(value, str):
+        raise _BadRequest(f"'{name}' must be a string")
+    return value
+
+
+def _convert_route(payload: Any) -> Tuple[Tuple[str, ...], _Task, List[Any]]:
+    payload = _object(payload)
+    source = _parser_style(_string(payload, "from"))
+    target = _formatter_style(_string(payload, "to"))
+    return ("convert", source, target), partial(_convert_chunk_captured, source, target), _citations(payload)
+
+
+def _parse_route(payload: Any) -> Tuple[Tuple[str, ...], _Task, List[Any]]:
+    payload = _object(payload)
+    style = _parser_style(_string(payload, "style", "auto"))
+    return ("parse", style), partial(_parse_chunk_captured, style), _citations(payload)
+
+
+def _format_route(payload: Any) -> Tuple[Tuple[str, ...], _Task, List[Any]]:
+    payload = _object(payload)
+    style = _formatter_style(_string(payload, "style"))
+    raw = payload.get("reference")
+    raw_items = [raw] if raw is not None else payload.get("references")
+    if not isinstance(raw_items, list):
+        raise _BadRequest("expected 'reference' object or 'references' list")
+    references = []
+    for index, item in enumerate(raw_items):
+        try:
+            references.append(Reference(**_object(item)))
+        except (TypeError, _BadRequest) as exc:
+            raise _BadRequest(f"reference {index}: {exc}") from None
+    return ("format", style), partial(_format_chunk_captured, style), references
+
+
+_ROUTES: Dict[str, Callable[[Any], Tuple[Tuple[str, ...], _Task, List[Any]]]] = {
+    "/convert": _convert_route,
+    "/parse": _parse_route,
+    "/format": _format_route,
+}
+
+
+def _result_json(result: BatchResult) -> Dict[str, Any]:
+    if not result.ok:
+        return {"error": {"code": result.code, "message": result.message, "stage": result.stage}}
+    value = result.value
+    return {"value": asdict(value) if isinstance(value, Reference) else value}
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    *,
+    workers: int = 1,
+    window: float = 0.002,
+    max_batch: int = 1024,
+    ready: Optional[Callable[[Tuple[str, int]], None]] = None,
+) -> None:
+    """Serve until interrupted.
+
+    With ``workers`` above 1 the listening socket is bound once and
+    ``workers`` processes are forked to accept on it, each with its own
+    request threads and coalescing window; children that exit are
+    replaced, and SIGINT/SIGTERM stop them all. Forking needs a POSIX
+    system; elsewhere a single process serves. ``ready`` is called with the
+    bound address once the server accepts connections.
+    """
+    server = TransTexServer((host, port), window=window, max_batch=max_batch)
+    if ready is not None:
+        ready(server.server_address[:2])
+    if workers <= 1 or not hasattr(os, "fork"):
+        with server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+        return
+    _prefork(server, workers)
+
+
+def _prefork(server: TransTexServer, workers: int) -> None:
+    children: set[int] = set()
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            try:
+                server.serve_forever()
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for _ in range(workers):
+        spawn()
+    try:
+        while children:
+            try:
+                pid, _ = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            children.discard(pid)
+            if not stopping:
+                print(f"transtex: worker {pid} exited, starting another", file=sys.stderr)
+                spawn()
+    finally:
+        server.server_close()
+
+
+__all__ = ["Coalescer", "MAX_BODY_BYTES", "TransTexServer", "serve"]
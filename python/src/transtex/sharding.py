@@ -0,0 +1,278 @@
+"""Split, map and reduce large jobs across processes or hosts sharing a filesystem.
+
+A job lives in a work directory. :func:`split` reads the inputs once and
+writes each record to one of N shard files, chosen by a stable hash of its
+cite key (or of the citation text for ``convert`` jobs), together with a
+manifest describing the job. Each node then runs :func:`map_shard` on the
+shards assigned to it, and :func:`merge_shards` reads the finished outputs
+back in input order. Every file is written under a temporary name and
+renamed into place, so readers on other hosts never see a partial file.
+
+Layout of a work directory::
+
+    manifest.json         the job, shard count and record count
+    shard-0000.jsonl      [sequence, label, text] per input record
+    shard-0000.out.jsonl  [sequence, label, value, error] per record
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import partial
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .batch import (
+    DEFAULT_CHUNKSIZE,
+    BatchResult,
+    _convert_chunk_captured,
+    _format_bibtex_chunk_captured,
+    _formatter_style,
+    _parser_style,
+    _run,
+)
+from .inputs import _entries, _lines
+
+MANIFEST = "manifest.json"
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+_CITE_KEY = re.compile(r"@\s*\w+\s*[{(]\s*([^,\s]+)\s*,")
+
+
+class ShardError(RuntimeError):
+    """Raised when a work directory is missing files or does not match its manifest."""
+
+
+def shard_of(key: str, shards: int) -> int:
+    """Return the shard (``0 <= shard < shards``) that ``key`` belongs to.
+
+    The hash is the same in every process and on every host, unlike
+    :func:`hash` on strings.
+    """
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shards
+
+
+def split(
+    workdir: PathLike,
+    inputs: Iterable[str],
+    *,
+    shards: int,
+    style: Optional[str] = None,
+    from_style: Optional[str] = None,
+    to_style: Optional[str] = None,
+    decode_latex: bool = False,
+) -> int:
+    """Split ``inputs`` into ``shards`` shard files under ``workdir``.
+
+    Pass ``style`` to format BibTeX entries, or ``from_style`` and
+    ``to_style`` to convert citations given one per line. Outputs left in
+    ``workdir`` by an earlier split are removed. Returns the number of
+    records written; raises :class:`ShardError` if an input is not UTF-8.
+    """
+    if shards < 1:
+        raise ValueError("shards must be at least 1")
+    if style is not None:
+        if from_style is not None or to_style is not None:
+            raise ValueError("pass either style or from_style and to_style")
+        job: Dict[str, Any] = {"command": "format", "style": _formatter_style(style), "decode_latex": decode_latex}
+        records: Iterator[Tuple[str, Union[str, BatchResult]]] = _entries(inputs)
+        key = _entry_key
+    elif from_style is not None and to_style is not None:
+        job = {"command": "convert", "from": _parser_style(from_style), "to": _formatter_style(to_style)}
+        records = _lines(inputs)
+        key = _line_key
+    else:
+        raise ValueError("pass either style or from_style and to_style")
+
+    directory = Path(workdir)
+    directory.mkdir(parents=True, exist_ok=True)
+    for stale in (directory / MANIFEST, *directory.glob("shard-*.jsonl")):
+        stale.unlink(missing_ok=True)
+    count = 0
+    with ExitStack() as stack:
+        files = [stack.enter_context(_atomic(_input_path(directory, index))) for index in range(shards)]
+        for label, text in records:
+            if isinstance(text, BatchResult):
+                raise ShardError(f"{label}: {text.message}")
+            files[shard_of(key(text), shards)].write(_record([count, label, text]))
+            count += 1
+    with _atomic(directory / MANIFEST) as manifest:
+        json.dump({**job, "shards": shards, "records": count}, manifest, indent=2)
+        manifest.write("\n")
+    return count
+
+
+def map_shard(
+    workdir: PathLike,
+    index: int,
+    *,
+    workers: Optional[int] = 1,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    executor: str = "process",
+) -> int:
+    """Run the job on one shard and write its output file; return the record count.
+
+    ``workers``, ``chunksize`` and ``executor`` spread the shard over a
+    local pool as in :func:`transtex.convert_many`. Failed records are kept
+    in the output with their error rather than stopping the shard.
+    """
+    directory = Path(workdir)
+    manifest = _manifest(directory)
+    if not 0 <= index < manifest["shards"]:
+        raise ShardError(f"shard {index} is out of range for {manifest['shards']} shards")
+    if manifest["command"] == "format":
+        task = partial(_format_bibtex_chunk_captured, manifest["style"], manifest["decode_latex"])
+    else:
+        task = partial(_convert_chunk_captured, manifest["from"], manifest["to"])
+
+    pending: Deque[Tuple[int, str]] = deque()
+
+    def texts(source: IO[str]) -> Iterator[str]:
+        for line in source:
+            sequence, label, text = json.loads(line)
+            pending.append((sequence, label))
+            yield text
+
+    count = 0
+    with open(_input_path(directory, index), encoding="utf-8") as source, _atomic(
+        _output_path(directory, index)
+    ) as target:
+        for result in _run(task, texts(source), workers, chunksize, True, executor):
+            sequence, label = pending.popleft()
+            error = None if result.ok else [result.code, result.message, result.stage]
+            target.write(_record([sequence, label, result.value if result.ok else None, error]))
+            count += 1
+    return count
+
+
+def map_local(workdir: PathLike, *, processes: Optional[int] = None, jobs: int = 1) -> None:
+    """Run every shard of ``workdir`` in its own ``transtex shard map`` process.
+
+    This is the single-machine stand-in for a cluster: at most
+    ``processes`` shards (default: all of them) run at once, each with
+    ``jobs`` workers, and they share nothing but the work directory.
+    """
+    shards = _manifest(Path(workdir))["shards"]
+    limit = processes or shards
+    package_root = str(Path(__file__).resolve().parents[1])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    # Each thread blocks on one child, so shards are collected in the order
+    # they finish and a slow shard never holds up starting the next one.
+    with ThreadPoolExecutor(min(limit, shards)) as pool:
+        pending = {
+            pool.submit(
+                subprocess.call,
+                [sys.executable, "-m", "transtex", "shard", "map", "-d", str(workdir), str(index), "-j", str(jobs), "-q"],
+                env=env,
+            ): index
+            for index in range(shards)
+        }
+        failed = [pending[future] for future in as_completed(pending) if future.result() != 0]
+    if failed:
+        raise ShardError(f"shards failed: {', '.join(map(str, sorted(failed)))}")
+
+
+def merge_shards(workdir: PathLike) -> Iterator[Tuple[str, BatchResult]]:
+    """Yield ``(label, result)`` for every record of a finished job, in input order.
+
+    The shard outputs are merged by input sequence number, one record per
+    shard in memory at a time. Raises :class:`ShardError` before yielding
+    anything if a shard has not finished.
+    """
+    directory = Path(workdir)
+    manifest = _manifest(directory)
+    missing = [index for index in range(manifest["shards"]) if not _output_path(directory, index).exists()]
+    if missing:
+        raise ShardError(f"shards not finished: {', '.join(map(str, missing))}")
+    return _merge(directory, manifest)
+
+
+def _merge(directory: Path, manifest: Dict[str, Any]) -> Iterator[Tuple[str, BatchResult]]:
+    count = 0
+    with ExitStack() as stack:
+        outputs = [
+            map(json.loads, stack.enter_context(open(_output_path(directory, index), encoding="utf-8")))
+            for index in range(manifest["shards"])
+        ]
+        for sequence, label, value, error in heapq.merge(*outputs, key=_sequence):
+            if sequence != count:
+                raise ShardError(f"record {count} is missing from the shard outputs")
+            count += 1
+            if error is None:
+                yield label, BatchResult(value)
+            else:
+                code, message, stage = error
+                yield label, BatchResult(code=code, message=message, stage=stage)
+    if count != manifest["records"]:
+        raise ShardError(f"shard outputs hold {count} records, expected {manifest['records']}")
+
+
+def _sequence(record: List[Any]) -> int:
+    return record[0]
+
+
+def _entry_key(entry: str) -> str:
+    match = _CITE_KEY.match(entry.lstrip())
+    return match.group(1) if match else entry
+
+
+def _line_key(line: str) -> str:
+    return line
+
+
+def _record(fields: List[Any]) -> str:
+    return json.dumps(fields, ensure_ascii=False) + "\n"
+
+
+def _input_path(directory: Path, index: int) -> Path:
+    return directory / f"shard-{index:04d}.jsonl"
+
+
+def _output_path(directory: Path, index: int) -> Path:
+    return directory / f"shard-{index:04d}.out.jsonl"
+
+
+def _manifest(directory: Path) -> Dict[str, Any]:
+    try:
+        with open(directory / MANIFEST, encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        raise ShardError(f"{directory} has no {MANIFEST}; run split first") from None
+
+
+class _atomic:
+    """Write a text file under a temporary name and rename it into place on success."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    def __enter__(self) -> IO[str]:
+        self.handle = open(self.temporary, "w", encoding="utf-8")
+        return self.handle
+
+    def __exit__(self, exc_type: Any, *rest: Any) -> None:
+        if exc_type is None:
+            # Flush to disk before the rename so another host never sees the
+            # new name with missing contents.
+            self.handle.flush()
+            os.fsync(self.handle.fileno())
+            self.handle.close()
+            os.replace(self.temporary, self.path)
+        else:
+            self.handle.close()
+            self.temporary.unlink(missing_ok=True)
+
+
+__all__ = ["MANIFEST", "ShardError", "map_local", "map_shard", "merge_shards", "shard_of", "split"]
@@ -0,0 +1,278 @@
+"""Keep rendered reference lists in step with .bib files that are being edited.
+
+:class:`BibWatcher` polls its files with :func:`os.stat` only, so it needs
+nothing beyond the standard library and works on network filesystems that
+do not deliver change notifications. When a file's size or modification
+time changes, its entries are hashed and compared with the previous scan;
+only entries whose text is new are parsed and formatted, and the rendered
+file is rewritten from the first line that differs onwards.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from dataclasses import dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .batch import DEFAULT_CHUNKSIZE, BatchResult, _format_bibtex_chunk_captured, _formatter_style, _run
+from .bibtex import iter_bibtex_entries
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+@dataclass(frozen=True)
+class WatchUpdate:
+    """What one scan of a changed .bib file did.
+
+    ``formatted`` entries were new or edited and had to be rendered,
+    ``unchanged`` ones reused their earlier rendering and ``removed`` ones
+    are no longer in the file. ``failures`` holds an entry label and the
+    failed :class:`~transtex.batch.BatchResult` for each entry that could
+    not be parsed or formatted; those entries are left out of the output.
+    ``error`` says why the file could not be read, in which case its output
+    was left as it was. ``deleted`` means the file is gone and its output
+    was removed.
+    """
+
+    source: str
+    output: str
+    formatted: int
+    unchanged: int
+    removed: int
+    bytes_written: int
+    failures: List[Tuple[str, BatchResult]] = field(default_factory=list)
+    error: Optional[str] = None
+    deleted: bool = False
+
+
+class _Tracked:
+    def __init__(self, output: Path) -> None:
+        self.output = output
+        self.signature: Optional[Tuple[int, int]] = None
+        self.hashes: List[bytes] = []
+        # Lines the output file holds, and its (size, mtime) after our last write.
+        self.lines: Optional[List[str]] = None
+        self.output_signature: Optional[Tuple[int, int]] = None
+        # Last stat error reported, so a lasting one is reported only once.
+        self.error: Optional[str] = None
+
+
+class BibWatcher:
+    """Render .bib files in ``style`` and re-render them as they change.
+
+    ``paths`` are .bib files or directories, which are searched for
+    ``*.bib`` files on every scan so new files are picked up. Each file
+    ``refs.bib`` is rendered to ``refs.<style>.txt`` next to it, or in
+    ``output_dir``, one formatted reference per line in file order, as
+    ``transtex format`` writes it. Renderings are kept by entry hash, so an
+    entry that is moved, or copied into another watched file, is not
+    formatted again. ``workers`` formats new entries on a pool, which pays
+    off for the first scan of a large file.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[PathLike],
+        style: str,
+        *,
+        output_dir: Optional[PathLike] = None,
+        decode_latex: bool = False,
+        workers: Optional[int] = 1,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+    ) -> None:
+        self.paths = [Path(path) for path in paths]
+        self.style = _formatter_style(style)
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.workers = workers
+        self.chunksize = chunksize
+        self._task = partial(_format_bibtex_chunk_captured, self.style, decode_latex)
+        self._tracked: Dict[Path, _Tracked] = {}
+        self._rendered: Dict[bytes, BatchResult] = {}
+
+    def poll(self) -> List[WatchUpdate]:
+        """Scan every file once and update the outputs of those that changed.
+
+        Files that cannot be read are reported with ``error`` set and tried
+        again once they change. Files that have been deleted are forgotten
+        and their outputs removed.
+        """
+        updates = []
+        present = set()
+        for source in self._sources():
+            try:
+                stat = os.stat(source)
+            except FileNotFoundError:
+                continue
+            except OSError as exc:
+                present.add(source)
+                tracked = self._track(source)
+                if tracked.error != str(exc):
+                    tracked.error = str(exc)
+                    updates.append(_unreadable(source, tracked, exc))
+                continue
+            present.add(source)
+            tracked = self._track(source)
+            tracked.error = None
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if signature == tracked.signature:
+                continue
+            tracked.signature = signature
+            try:
+                updates.append(self._update(source, tracked))
+            except (OSError, UnicodeDecodeError) as exc:
+                updates.append(_unreadable(source, tracked, exc))
+        for source in [source for source in self._tracked if source not in present]:
+            deleted = self._evict(source)
+            if deleted is not None:
+                updates.append(deleted)
+        self._forget_unused()
+        return updates
+
+    def run(
+        self,
+        interval: float = 1.0,
+        stop: Optional[threading.Event] = None,
+        report: Optional[Callable[[WatchUpdate], None]] = None,
+    ) -> None:
+        """Poll every ``interval`` seconds until ``stop`` is set.
+
+        ``report`` is called with each :class:`WatchUpdate`.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            for update in self.poll():
+                if report is not None:
+                    report(update)
+            stop.wait(interval)
+
+    def _sources(self) -> List[Path]:
+        sources = []
+        for path in self.paths:
+            if path.is_dir():
+                sources.extend(sorted(path.glob("*.bib")))
+            else:
+                sources.append(path)
+        return sources
+
+    def _track(self, source: Path) -> _Tracked:
+        tracked = self._tracked.get(source)
+        if tracked is None:
+            output = (self.output_dir or source.parent) / f"{source.stem}.{self.style}.txt"
+            tracked = self._tracked[source] = _Tracked(output)
+        return tracked
+
+    def _evict(self, source: Path) -> Optional[WatchUpdate]:
+        tracked = self._tracked.pop(source)
+        if tracked.lines is None:
+            return None  # Nothing was written for it.
+        update = WatchUpdate(
+            source=str(source),
+            output=str(tracked.output),
+            formatted=0,
+            unchanged=0,
+            removed=len(set(tracked.hashes)),
+            bytes_written=0,
+            deleted=True,
+        )
+        try:
+            tracked.output.unlink(missing_ok=True)
+        except OSError as exc:
+            return replace(update, error=str(exc))
+        return update
+
+    def _update(self, source: Path, tracked: _Tracked) -> WatchUpdate:
+        with open(source, encoding="utf-8") as handle:
+            entries = list(iter_bibtex_entries(handle))
+        hashes = [hashlib.blake2b(entry.encode("utf-8"), digest_size=16).digest() for entry in entries]
+
+        fresh: Dict[bytes, str] = {}
+        for digest, entry in zip(hashes, entries):
+            if digest not in self._rendered:
+                fresh.setdefault(digest, entry)
+        results = _run(self._task, fresh.values(), self.workers, self.chunksize, True, "process")
+        self._rendered.update(zip(fresh, results))
+
+        lines = []
+        failures = []
+        for number, digest in enumerate(hashes, 1):
+            result = self._rendered[digest]
+            if result.ok:
+                lines.append(f"{result.value}\n")
+            else:
+                failures.append((f"{source}: entry {number}", result))
+        written = _patch(tracked, lines)
+        removed = len(set(tracked.hashes) - set(hashes))
+        tracked.hashes = hashes
+        return WatchUpdate(
+            source=str(source),
+            output=str(tracked.output),
+            formatted=len(fresh),
+            unchanged=len(set(hashes)) - len(fresh),
+            removed=removed,
+            bytes_written=written,
+            failures=failures,
+        )
+
+    def _forget_unused(self) -> None:
+        live = set()
+        for tracked in self._tracked.values():
+            live.update(tracked.hashes)
+        for digest in [digest for digest in self._rendered if digest not in live]:
+            del self._rendered[digest]
+
+
+def _unreadable(source: Path, tracked: _Tracked, exc: Exception) -> WatchUpdate:
+    error = f"not valid UTF-8 ({exc})" if isinstance(exc, UnicodeDecodeError) else str(exc)
+    return WatchUpdate(
+        source=str(source),
+        output=str(tracked.output),
+        formatted=0,
+        unchanged=0,
+        removed=0,
+        bytes_written=0,
+        error=error,
+    )
+
+
+def _patch(tracked: _Tracked, lines: List[str]) -> int:
+    """Make ``tracked.output`` hold ``lines``, rewriting only from the first difference."""
+    path = tracked.output
+    try:
+        stat = os.stat(path)
+        current = (stat.st_size, stat.st_mtime_ns)
+    except FileNotFoundError:
+        current = None
+    if current is None:
+        tracked.lines = []
+    elif tracked.lines is None or current != tracked.output_signature:
+        # First scan, or someone else wrote the file: find out what it holds.
+        with open(path, encoding="utf-8", newline="") as handle:
+            tracked.lines = handle.readlines()
+
+    old = tracked.lines
+    common = 0
+    for before, after in zip(old, lines):
+        if before != after:
+            break
+        common += 1
+    written = 0
+    if current is None or common < len(old) or common < len(lines):
+        offset = sum(len(line.encode("utf-8")) for line in lines[:common])
+        tail = "".join(lines[common:]).encode("utf-8")
+        with open(path, "r+b" if current is not None else "wb") as handle:
+            handle.seek(offset)
+            handle.write(tail)
+            handle.truncate()
+        written = len(tail)
+        stat = os.stat(path)
+        tracked.output_signature = (stat.st_size, stat.st_mtime_ns)
+    else:
+        tracked.output_signature = current
+    tracked.lines = lines
+    return written
+
+
+__all__ = ["BibWatcher", "WatchUpdate"]
@@ -0,0 +1,154 @@
+"""Stream formatted reference lists to text, Markdown, HTML or RTF files."""
+from __future__ import annotations
+
+import html
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, TextIO
+
+from .bibliography import entry_label
+from .cache import RenderCache
+from .converter import ConversionError, _FORMATTERS, format_reference
+from .reference import Reference
+
+# Private-use code points bracket container titles while a reference is
+# formatted; each writer swaps them for its own italic markup after escaping.
+_ITALIC_OPEN = "\ue000"
+_ITALIC_CLOSE = "\ue001"
+
+
+@dataclass(frozen=True)
+class _Markup:
+    header: str
+    footer: str
+    entry_open: str
+    entry_close: str
+    italic_open: str
+    italic_close: str
+    escape: Callable[[str], str]
+
+
+def _escape_plain(text: str) -> str:
+    return text
+
+
+_MARKDOWN_ESCAPES = str.maketrans({char: f"\\{char}" for char in "\\`*_[]<>"})
+
+
+def _escape_markdown(text: str) -> str:
+    return text.translate(_MARKDOWN_ESCAPES)
+
+
+def _escape_html(text: str) -> str:
+    return html.escape(text, quote=False)
+
+
+_RTF_ESCAPES = str.maketrans({"\\": "\\\\", "{": "\\{", "}": "\\}"})
+
+
+def _escape_rtf(text: str) -> str:
+    escaped = text.translate(_RTF_ESCAPES)
+    if escaped.isascii():
+        return escaped
+    pieces = []
+    for char in escaped:
+        code = ord(char)
+        if code < 128 or char in (_ITALIC_OPEN, _ITALIC_CLOSE):
+            pieces.append(char)
+        elif code <= 0xFFFF:
+            pieces.append(f"\\u{code if code < 0x8000 else code - 0x10000}?")
+        else:
+            # RTF \u takes signed 16-bit values, so astral characters are written as surrogate pairs.
+            code -= 0x10000
+            for unit in (0xD800 + (code >> 10), 0xDC00 + (code & 0x3FF)):
+                pieces.append(f"\\u{unit - 0x10000}?")
+    return "".join(pieces)
+
+
+MARKUPS: Dict[str, _Markup] = {
+    "text": _Markup("", "", "", "\n", "", "", _escape_plain),
+    "markdown": _Markup("", "", "", "\n\n", "*", "*", _escape_markdown),
+    "html": _Markup(
+        '<div class="bibliography">\n',
+        "</div>\n",
+        '  <div class="entry">',
+        "</div>\n",
+        "<i>",
+        "</i>",
+        _escape_html,
+    ),
+    "rtf": _Markup(
+        "{\\rtf1\\ansi\\deff0{\\fonttbl{\\f0 Times New Roman;}}\n",
+        "}\n",
+        "",
+        "\\par\n",
+        "{\\i ",
+        "}",
+        _escape_rtf,
+    ),
+}
+
+
+def write_bibliography(
+    references: Iterable[Reference],
+    style: str,
+    fp: TextIO,
+    *,
+    markup: str = "text",
+    cache: Optional[RenderCache] = None,
+) -> int:
+    """Format ``references`` in ``style`` and write them to ``fp`` one by one.
+
+    ``references`` may be any iterator; entries are written in the order
+    received, so only one reference is held at a time (pass the result of
+    :func:`transtex.sort_references` for an ordered list). ``markup`` is one
+    of ``text``, ``markdown``, ``html`` or ``rtf``; the last three italicize
+    journal and book titles. IEEE and Vancouver entries are numbered.
+
+    Returns the number of entries written.
+    """
+    spec = MARKUPS.get(markup.strip().lower())
+    if spec is None:
+        supported = ", ".join(sorted(MARKUPS))
+        raise ConversionError(f"Unsupported markup '{markup}'. Supported markups: {supported}")
+    normalized_style = style.strip().lower()
+    if normalized_style not in _FORMATTERS:
+        supported = ", ".join(sorted(_FORMATTERS.keys()))
+        raise ConversionError(f"Unsupported style '{style}'. Supported styles: {supported}")
+
+    fp.write(spec.header)
+    count = 0
+    for count, reference in enumerate(references, start=1):
+        text = render_marked(normalized_style, reference, cache=cache)
+        label = entry_label(normalized_style, count)
+        if label:
+            text = f"{label} {text}"
+        escaped = spec.escape(text)
+        escaped = escaped.replace(_ITALIC_OPEN, spec.italic_open).replace(_ITALIC_CLOSE, spec.italic_close)
+        fp.write(f"{spec.entry_open}{escaped}{spec.entry_close}")
+    fp.write(spec.footer)
+    return count
+
+
+def render_marked(style: str, reference: Reference, cache: Optional[RenderCache] = None) -> str:
+    """Format ``reference`` with its container title bracketed by italic markers."""
+    marked = reference
+    if reference.journal or reference.booktitle:
+        marked = reference.copy()
+        marked.journal = _mark_italic(reference.journal)
+        marked.booktitle = _mark_italic(reference.booktitle)
+    text = format_reference(style, marked, cache=cache)
+    # Chicago already wraps book titles in asterisks; keep a single emphasis.
+    return text.replace(f"*{_ITALIC_OPEN}", _ITALIC_OPEN).replace(f"{_ITALIC_CLOSE}*", _ITALIC_CLOSE)
+
+
+def _mark_italic(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return value
+    # Leave a trailing period outside the markers so sentence joining still
+    # recognises it as terminal punctuation.
+    if value.endswith("."):
+        return f"{_ITALIC_OPEN}{value[:-1]}{_ITALIC_CLOSE}."
+    return f"{_ITALIC_OPEN}{value}{_ITALIC_CLOSE}"
+
+
+__all__ = ["MARKUPS", "render_marked", "write_bibliography"]
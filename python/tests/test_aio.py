@@ -0,0 +1,106 @@
+import asyncio
+import os
+import subprocess
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from transtex import (
+    AsyncBatcher,
+    CitationParseError,
+    ConversionError,
+    Reference,
+    aconvert,
+    aconvert_many,
+    aformat,
+    aparse,
+    convert_citation,
+    format_apa,
+    format_ieee,
+    parse_citation,
+)
+
+
+def _reference(index: int) -> Reference:
+    return Reference(
+        entry_type="article",
+        cite_key=f"ref{index}",
+        title=f"Deep Learning for Everything, Part {index}",
+        authors=["John Doe", "Jane Smith"],
+        journal="Journal of Omniscience",
+        year=str(1990 + index % 30),
+        volume=str(index % 60 + 1),
+        issue=str(index % 12 + 1),
+        pages=f"{index}-{index + 12}",
+    )
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.jobs = 0
+
+    def submit(self, *args, **kwargs):
+        self.jobs += 1
+        return super().submit(*args, **kwargs)
+
+
+class AsyncBatcherTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.references = [_reference(index) for index in range(40)]
+        self.citations = [format_apa(reference) for reference in self.references]
+
+    async def test_module_functions_match_sync_calls(self) -> None:
+        text = self.citations[0]
+        self.assertEqual(await aconvert("apa", "ieee", text), convert_citation("apa", "ieee", text))
+        self.assertEqual(await aparse("apa", text), parse_citation("apa", text))
+        self.assertEqual(await aformat("ieee", self.references[0]), format_ieee(self.references[0]))
+        with self.assertRaises(ConversionError):
+            await aconvert("apa", "ieee", "not a citation")
+        with self.assertRaises(CitationParseError):
+            await aparse("apa", "")
+
+    async def test_concurrent_calls_share_executor_jobs(self) -> None:
+        executor = CountingExecutor()
+        async with AsyncBatcher(executor, window=0.05, max_batch=16) as batcher:
+            results = await asyncio.gather(*(batcher.convert("apa", "ieee", text) for text in self.citations))
+        executor.shutdown()
+        self.assertEqual(results, [format_ieee(reference) for reference in self.references])
+        self.assertEqual(executor.jobs, 3)
+
+    async def test_queue_is_bounded(self) -> None:
+        async with AsyncBatcher(window=0.01, max_queued=4) as batcher:
+            calls = [asyncio.ensure_future(batcher.parse("apa", text)) for text in self.citations[:10]]
+            await asyncio.sleep(0)
+            state = batcher._state()
+            self.assertEqual(sum(len(batch.items) for batch in state.batches.values()), 4)
+            parsed = await asyncio.gather(*calls)
+        self.assertEqual(parsed, [parse_citation("apa", text) for text in self.citations[:10]])
+
+    async def test_stream_accepts_async_input(self) -> None:
+        async def texts():
+            for text in self.citations:
+                yield text
+
+        results = [text async for text in aconvert_many("apa", "ieee", texts(), chunksize=7)]
+        self.assertEqual(results, [format_ieee(reference) for reference in self.references])
+
+    async def test_stream_can_capture_errors(self) -> None:
+        async with AsyncBatcher(max_workers=2) as batcher:
+            results = [item async for item in batcher.convert_many("apa", "ieee", ["", self.citations[0]], errors="capture")]
+            self.assertEqual([result.ok for result in results], [False, True])
+            with self.assertRaises(ConversionError):
+                [item async for item in batcher.convert_many("apa", "ieee", ["not a citation"])]
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_package_import_leaves_asyncio_alone(self) -> None:
+        code = "import sys, transtex; print('asyncio' in sys.modules); transtex.AsyncBatcher; print('asyncio' in sys.modules)"
+        env = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[1] / "src"))
+        output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ["False", "True"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import sys
+import threading
+import unittest
+
+from transtex import (
+    BatchResult,
+    ConversionError,
+    ParseCache,
+    Reference,
+    convert_citation,
+    convert_many,
+    decode_latex,
+    encode_latex,
+    format_apa,
+    format_ieee,
+    format_many,
+    parse_citation,
+    parse_many,
+)
+from transtex.batch import EMPTY_INPUT, FORMAT_FAILED, PARSE_FAILED, TOO_LONG, UNDETECTED_STYLE
+
+
+def _reference(index: int) -> Reference:
+    return Reference(
+        entry_type="article",
+        cite_key=f"ref{index}",
+        title=f"Deep Learning for Everything, Part {index}",
+        authors=["John Doe", "Jane Smith"],
+        journal="Journal of Omniscience",
+        year=str(1990 + index % 30),
+        volume=str(index % 60 + 1),
+        issue=str(index % 12 + 1),
+        pages=f"{index}-{index + 12}",
+    )
+
+
+class BatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.references = [_reference(index) for index in range(25)]
+        self.citations = [format_apa(reference) for reference in self.references]
+
+    def test_convert_many_matches_single_calls(self) -> None:
+        expected = [convert_citation("apa", "ieee", text) for text in self.citations]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = list(convert_many("apa", "ieee", self.citations, workers=workers, chunksize=4))
+                self.assertEqual(results, expected)
+
+    def test_unordered_results_carry_their_index(self) -> None:
+        results = list(convert_many("apa", "ieee", self.citations, workers=2, chunksize=3, ordered=False))
+        self.assertEqual(sorted(index for index, _ in results), list(range(len(self.citations))))
+        for index, text in results:
+            self.assertEqual(text, format_ieee(self.references[index]))
+
+    def test_parse_and_format_many(self) -> None:
+        parsed = list(parse_many("apa", self.citations, workers=2, chunksize=5))
+        self.assertEqual(parsed, [parse_citation("apa", text) for text in self.citations])
+        formatted = list(format_many("ieee", self.references, workers=1))
+        self.assertEqual(formatted, [format_ieee(reference) for reference in self.references])
+
+    def test_input_is_consumed_lazily(self) -> None:
+        consumed = []
+
+        def texts():
+            for text in self.citations:
+                consumed.append(text)
+                yield text
+
+        results = convert_many("apa", "ieee", texts(), workers=1, chunksize=4)
+        next(results)
+        self.assertEqual(len(consumed), 4)
+
+    def test_failures_raise(self) -> None:
+        with self.assertRaises(ConversionError):
+            list(convert_many("apa", "ieee", ["not a citation"], workers=2))
+        with self.assertRaises(ValueError):
+            convert_many("apa", "ieee", self.citations, chunksize=0)
+
+
+class BatchErrorCaptureTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.good = format_apa(_reference(1))
+        self.texts = [self.good, "", "not a citation", "x" * 5000, self.good]
+
+    def test_failures_become_results(self) -> None:
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = list(convert_many("apa", "ieee", self.texts, workers=workers, errors="capture"))
+                self.assertEqual([result.ok for result in results], [True, False, False, False, True])
+                self.assertEqual(results[0], BatchResult(format_ieee(_reference(1))))
+                self.assertEqual([result.code for result in results[1:4]], [EMPTY_INPUT, PARSE_FAILED, TOO_LONG])
+                self.assertEqual({result.stage for result in results[1:4]}, {"parse"})
+                self.assertTrue(results[2].message)
+
+    def test_auto_style_reports_undetected_input(self) -> None:
+        results = list(parse_many("auto", ["???", self.good], workers=1, errors="capture"))
+        self.assertEqual(results[0].code, UNDETECTED_STYLE)
+        self.assertEqual(results[1].value, parse_citation("apa", self.good))
+
+    def test_format_failures_are_captured(self) -> None:
+        results = list(format_many("ieee", [_reference(1), None], workers=1, errors="capture"))
+        self.assertTrue(results[0].ok)
+        self.assertEqual((results[1].code, results[1].stage), (FORMAT_FAILED, "format"))
+
+    def test_unsupported_style_fails_before_reading_input(self) -> None:
+        with self.assertRaises(ConversionError):
+            convert_many("apa", "harvard", iter(()), errors="capture")
+        with self.assertRaises(ValueError):
+            convert_many("apa", "ieee", [], errors="ignore")
+
+
+class ThreadSafetyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.references = [_reference(index) for index in range(60)]
+        self.citations = [format_apa(reference) for reference in self.references]
+
+    def tearDown(self) -> None:
+        sys.setswitchinterval(self.interval)
+
+    def test_thread_executor_matches_serial_results(self) -> None:
+        expected = [convert_citation("apa", "ieee", text) for text in self.citations]
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                results = list(
+                    convert_many("apa", "ieee", self.citations, workers=8, chunksize=1, ordered=ordered, executor="thread")
+                )
+                if not ordered:
+                    results = [text for _, text in sorted(results)]
+                self.assertEqual(results, expected)
+        captured = list(parse_many("auto", self.citations, workers=4, chunksize=3, executor="thread", errors="capture"))
+        self.assertTrue(all(result.ok for result in captured))
+
+    def test_shared_state_under_concurrent_calls(self) -> None:
+        cache = ParseCache(maxsize=16)
+        texts = [chr(0x100 + index) + "e\\u{g}" for index in range(200)]
+        failures = []
+
+        def work(offset: int) -> None:
+            for index in range(offset, len(self.citations) + offset):
+                text = self.citations[index % len(self.citations)]
+                if parse_citation("apa", text, cache=cache) != parse_citation("apa", text):
+                    failures.append(text)
+                value = texts[index % len(texts)]
+                if decode_latex(encode_latex(value)) != decode_latex(value):
+                    failures.append(value)
+
+        threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(failures, [])
+        self.assertLessEqual(len(cache), 16)
+
+    def test_rejects_unknown_executor(self) -> None:
+        with self.assertRaises(ValueError):
+            convert_many("apa", "ieee", [], executor="cluster")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from transtex import ConversionError, Reference, render_bibliography, sort_references
+from transtex.bibliography import year_suffix
+
+
+def _article(cite_key: str, authors: list[str], year: str | None, title: str) -> Reference:
+    return Reference(
+        entry_type="article",
+        cite_key=cite_key,
+        title=title,
+        authors=authors,
+        journal="Journal of Omniscience",
+        year=year,
+        volume="1",
+    )
+
+
+class SortReferencesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.references = [
+            _article("smith2020", ["Jane Smith"], "2020", "Zebra patterns"),
+            _article("doe2020b", ["John Doe"], "2020", "Second thoughts"),
+            _article("doe2019", ["John Doe"], "2019", "Early work"),
+            _article("doe2020a", ["John Doe"], "2020", "First steps"),
+        ]
+
+    def test_author_date_sorting_and_suffixes(self) -> None:
+        ordered = sort_references(self.references, "apa7")
+        self.assertEqual(
+            [(ref.cite_key, ref.year) for ref in ordered],
+            [
+                ("doe2019", "2019"),
+                ("doe2020a", "2020a"),
+                ("doe2020b", "2020b"),
+                ("smith2020", "2020"),
+            ],
+        )
+        # Inputs keep their original years.
+        self.assertEqual(self.references[1].year, "2020")
+
+    def test_mla_sorts_without_suffixes(self) -> None:
+        ordered = sort_references(self.references, "mla")
+        self.assertEqual([ref.year for ref in ordered], ["2019", "2020", "2020", "2020"])
+
+    def test_numbered_styles_keep_input_order(self) -> None:
+        ordered = sort_references(self.references, "ieee")
+        self.assertEqual([ref.cite_key for ref in ordered], [ref.cite_key for ref in self.references])
+
+    def test_missing_year_gets_nd_suffix(self) -> None:
+        references = [
+            _article("a", ["John Doe"], None, "Alpha"),
+            _article("b", ["John Doe"], None, "Beta"),
+        ]
+        ordered = sort_references(references, "apa")
+        self.assertEqual([ref.year for ref in ordered], ["n.d.-a", "n.d.-b"])
+
+    def test_authors_sharing_a_surname_are_not_suffixed(self) -> None:
+        references = [
+            _article("john", ["Doe, John"], "2020", "Alpha"),
+            _article("jane", ["Doe, Jane"], "2020", "Beta"),
+            _article("jane2", ["Jane Doe"], "2020", "Gamma"),
+        ]
+        ordered = sort_references(references, "apa")
+        self.assertEqual(
+            [(ref.cite_key, ref.year) for ref in ordered],
+            [("jane", "2020a"), ("jane2", "2020b"), ("john", "2020")],
+        )
+
+    def test_year_suffix_rolls_over(self) -> None:
+        self.assertEqual(year_suffix(0), "a")
+        self.assertEqual(year_suffix(25), "z")
+        self.assertEqual(year_suffix(26), "aa")
+
+
+class RenderBibliographyTests(unittest.TestCase):
+    def test_render_apa_list(self) -> None:
+        references = [
+            _article("doe2020b", ["Doe, J."], "2020", "Second thoughts"),
+            _article("doe2020a", ["Doe, J."], "2020", "First steps"),
+        ]
+        rendered = render_bibliography(references, "apa7")
+        self.assertEqual(
+            rendered,
+            [
+                "Doe, J. (2020a). First steps. Journal of Omniscience, 1.",
+                "Doe, J. (2020b). Second thoughts. Journal of Omniscience, 1.",
+            ],
+        )
+
+    def test_render_ieee_list_is_numbered(self) -> None:
+        references = [
+            _article("b", ["John Doe"], "2020", "Beta"),
+            _article("a", ["Jane Smith"], "2019", "Alpha"),
+        ]
+        rendered = render_bibliography(references, "ieee")
+        self.assertTrue(rendered[0].startswith('[1] J. Doe, "Beta,"'))
+        self.assertTrue(rendered[1].startswith('[2] J. Smith, "Alpha,"'))
+
+    def test_unsupported_style(self) -> None:
+        with self.assertRaises(ConversionError):
+            render_bibliography([], "harvard")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from transtex import BibTeXError, parse_bibtex_entry, reference_to_bibtex
+from transtex import BibTeXError, Reference, decode_latex, encode_latex, parse_bibtex_entry, reference_to_bibtex
 
 
 SAMPLE_ENTRY = """@article{doe2020deep,
@@ -15,6 +15,14 @@ SAMPLE_ENTRY = """@article{doe2020deep,
   url = {https://example.com/article}
 }"""
 
+ACCENTED_ENTRY = r"""@article{mueller2019,
+  author = {J{\"u}rgen M{\"u}ller and Fran\c{c}ois Dvo{\v{r}}{\'a}k and Paul Erd\H{o}s},
+  title = {Stra{\ss}en \& Br\"ucken in {\"O}sterreich, 1900--1950},
+  journal = {Acta {\'E}cole},
+  pages = {12--19},
+  url = {https://example.org/~mueller/a--b}
+}"""
+
 
 class BibTeXParsingTests(unittest.TestCase):
     def test_parse_entry(self) -> None:
@@ -46,5 +54,92 @@ class BibTeXParsingTests(unittest.TestCase):
             parse_bibtex_entry("invalid")
 
 
+class LatexDecodingTests(unittest.TestCase):
+    def test_decodes_fields_when_requested(self) -> None:
+        reference = parse_bibtex_entry(ACCENTED_ENTRY, decode_latex=True)
+        self.assertEqual(reference.authors, ["Jürgen Müller", "François Dvořák", "Paul Erdős"])
+        self.assertEqual(reference.title, "Straßen & Brücken in Österreich, 1900–1950")
+        self.assertEqual(reference.journal, "Acta École")
+        self.assertEqual(reference.pages, "12–19")
+        self.assertEqual(reference.url, "https://example.org/~mueller/a--b")
+
+    def test_decoding_is_off_by_default(self) -> None:
+        reference = parse_bibtex_entry(ACCENTED_ENTRY)
+        self.assertEqual(reference.journal, r"Acta {\'E}cole")
+
+    def test_decode_latex_commands(self) -> None:
+        cases = {
+            r"{\ss}": "ß",
+            r"Stra\ss e": "Straße",
+            r"\'e": "é",
+            r"\'{\i}": "í",
+            r"\c c": "ç",
+            r"\AA{}ngstr\"om": "Ångström",
+            r"{\L}ukasiewicz": "Łukasiewicz",
+            r"50\% \$ \_ \#": "50% $ _ #",
+            r"\~{}": "~",
+            r"a---b": "a—b",
+            r"``quoted''": "“quoted”",
+            r"J.~Doe": "J. Doe",
+            r"{\em Deep} \emph{Learning}": "Deep Learning",
+        }
+        for source, expected in cases.items():
+            with self.subTest(source=source):
+                self.assertEqual(decode_latex(source), expected)
+
+    def test_leaves_protective_braces_and_unknown_commands(self) -> None:
+        self.assertEqual(decode_latex("{DNA} repair"), "{DNA} repair")
+        self.assertEqual(decode_latex(r"\unknown{x} $x^2$"), r"\unknown{x} $x^2$")
+        self.assertEqual(decode_latex(r"{\foo}"), r"{\foo}")
+
+
+class LatexEncodingTests(unittest.TestCase):
+    def test_writer_encodes_when_requested(self) -> None:
+        reference = Reference(
+            entry_type="article",
+            cite_key="mueller2019",
+            title="Straßen & Brücken: 50% of {DNA}, 1900–1950",
+            authors=["Jürgen Müller", "Łukasz O’Brien"],
+            journal="Revue d'Économie",
+            url="https://example.org/~m_ller/a%20b",
+        )
+        serialized = reference_to_bibtex(reference, encode_latex=True)
+        self.assertIn(r"author = {J{\"u}rgen M{\"u}ller and {\L}ukasz O{\textquoteright}Brien}", serialized)
+        self.assertIn(r"title = {Stra{\ss}en \& Br{\"u}cken: 50\% of {DNA}, 1900--1950}", serialized)
+        self.assertIn(r"journal = {Revue d'{\'E}conomie}", serialized)
+        self.assertIn("url = {https://example.org/~m_ller/a%20b}", serialized)
+        self.assertTrue(serialized.isascii())
+        reparsed = parse_bibtex_entry(serialized, decode_latex=True)
+        self.assertEqual(reparsed.title, reference.title)
+        self.assertEqual(reparsed.authors, reference.authors)
+        self.assertEqual(reparsed.journal, reference.journal)
+
+    def test_unbalanced_braces_are_escaped(self) -> None:
+        self.assertEqual(encode_latex("a } b {c"), r"a \textbraceright{} b \textbraceleft{}c")
+        self.assertEqual(encode_latex("{DNA} repair"), "{DNA} repair")
+        reference = Reference(entry_type="misc", cite_key="x", title="Broken } title")
+        reparsed = parse_bibtex_entry(reference_to_bibtex(reference, encode_latex=True), decode_latex=True)
+        self.assertEqual(reparsed.title, "Broken } title")
+
+    def test_encode_round_trips_through_decode(self) -> None:
+        for text in ("C:\\tmp~^ #1 a_b $5", "naïve café — “quoted”", "plain ascii", "日本語 ǵ"):
+            with self.subTest(text=text):
+                self.assertEqual(decode_latex(encode_latex(text)), text)
+
+    def test_existing_latex_is_not_escaped_twice(self) -> None:
+        for value in (r'Sch{\"o}n \& Co', r"Caf\'e 50\% off", r"$\alpha$-helices", r"{\em Ab initio} methods"):
+            with self.subTest(value=value):
+                self.assertEqual(encode_latex(value), value)
+        self.assertEqual(encode_latex(r"Sch{\"o}n & Müller"), r'Sch{\"o}n \& M{\"u}ller')
+        entry = r"""@article{schoen,
+  title = {Sch{\"o}n \& Co: {\L}{\'o}d{\'z} 1900--1950},
+  year = {2020}
+}"""
+        raw = parse_bibtex_entry(entry)
+        self.assertEqual(reference_to_bibtex(raw, encode_latex=True), reference_to_bibtex(raw))
+        decoded = parse_bibtex_entry(entry, decode_latex=True)
+        self.assertEqual(reference_to_bibtex(decoded, encode_latex=True), reference_to_bibtex(raw))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,187 @@
+import gc
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+from unittest import mock
+
+from transtex import CitationParseError, ParseCache, Reference, RenderCache, format_reference, parse_citation
+from transtex import cache as cache_module
+from transtex.cache import LRUCache, citation_cache_key, reference_digest
+
+
+class RenderCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.reference = Reference(
+            entry_type="article",
+            cite_key="doe2020deep",
+            title="Deep Learning for Everything",
+            authors=["John Doe", "Jane Smith"],
+            journal="Journal of Omniscience",
+            year="2020",
+            volume="42",
+            issue="7",
+            pages="1-10",
+            doi="10.1000/j.jo.2020.01.001",
+        )
+
+    def test_memory_hit_matches_uncached_output(self) -> None:
+        cache = RenderCache()
+        first = format_reference("apa7", self.reference, cache=cache)
+        second = format_reference("apa7", self.reference, cache=cache)
+        self.assertEqual(first, format_reference("apa7", self.reference))
+        self.assertEqual(second, first)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+
+    def test_changed_reference_is_reformatted(self) -> None:
+        cache = RenderCache()
+        format_reference("ieee", self.reference, cache=cache)
+        changed = replace(self.reference, year="2021")
+        self.assertIn("2021", format_reference("ieee", changed, cache=cache))
+        self.assertEqual(cache.stats().misses, 2)
+
+    def test_digest_covers_extra_fields(self) -> None:
+        changed = replace(self.reference, extra_fields={"note": "x"})
+        self.assertNotEqual(reference_digest(changed), reference_digest(self.reference))
+
+    def test_sqlite_tier_persists_between_instances(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "renders.sqlite")
+            with RenderCache(path) as cache:
+                expected = format_reference("chicago", self.reference, cache=cache)
+            with RenderCache(path) as cache:
+                with mock.patch.dict(
+                    "transtex.converter._FORMATTERS",
+                    {"chicago": _fail_formatter("transtex.formatters.chicago", "format_chicago")},
+                ):
+                    cached = format_reference("chicago", self.reference, cache=cache)
+                self.assertEqual(cached, expected)
+                self.assertEqual(cache.stats().hits, 1)
+
+    def test_pending_rows_are_served_before_a_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            with RenderCache(os.path.join(tmp, "renders.sqlite"), maxsize=1) as cache:
+                expected = format_reference("apa7", self.reference, cache=cache)
+                format_reference("apa7", replace(self.reference, year="2021"), cache=cache)
+                with mock.patch.dict(
+                    "transtex.converter._FORMATTERS",
+                    {"apa7": _fail_formatter("transtex.formatters.apa7", "format_apa7")},
+                ):
+                    self.assertEqual(format_reference("apa7", self.reference, cache=cache), expected)
+
+    def test_unclosed_cache_flushes_when_collected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "renders.sqlite")
+            cache = RenderCache(path)
+            format_reference("ieee", self.reference, cache=cache)
+            del cache
+            gc.collect()
+            with RenderCache(path) as cache:
+                format_reference("ieee", self.reference, cache=cache)
+                self.assertEqual(cache.stats().hits, 1)
+
+    def test_formatter_change_invalidates_sqlite_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "renders.sqlite")
+            with RenderCache(path) as cache:
+                format_reference("mla", self.reference, cache=cache)
+            with mock.patch.dict(cache_module._VERSION_CACHE, {"transtex.formatters.mla": "edited"}):
+                with RenderCache(path) as cache:
+                    format_reference("mla", self.reference, cache=cache)
+                    self.assertEqual(cache.stats().misses, 1)
+
+
+class LRUCacheTests(unittest.TestCase):
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(len(cache), 2)
+
+
+def _fail_formatter(module: str, name: str):
+    def formatter(reference: Reference) -> str:
+        raise AssertionError("cache miss")
+
+    formatter.__module__ = module
+    formatter.__qualname__ = name
+    return formatter
+
+
+class ParseCacheTests(unittest.TestCase):
+    citation = (
+        "Doe, J., & Smith, J. (2020). Deep learning for everything. "
+        "Journal of Omniscience, 42(7), 1\u201310."
+    )
+
+    def test_hit_returns_equal_copy(self) -> None:
+        cache = ParseCache()
+        first = parse_citation("apa", self.citation, cache=cache)
+        second = parse_citation("apa", self.citation, cache=cache)
+        self.assertEqual(first, parse_citation("apa", self.citation))
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_results_can_be_mutated_without_touching_cache(self) -> None:
+        cache = ParseCache()
+        first = parse_citation("apa", self.citation, cache=cache)
+        first.authors.append("Intruder, I.")
+        first.title = "Changed"
+        second = parse_citation("apa", self.citation, cache=cache)
+        self.assertEqual(second, parse_citation("apa", self.citation))
+
+    def test_whitespace_and_dash_variants_share_an_entry(self) -> None:
+        cache = ParseCache()
+        plain = "Doe, J. (2020). A title. Journal of X, 1(2), 3-4."
+        parse_citation("apa", plain, cache=cache)
+        parse_citation("apa", plain.replace("A title", "A  title").replace("3-4", "3\u20134"), cache=cache)
+        parse_citation("APA", " " + self.citation.replace(" ", "  \n"), cache=cache)
+        parse_citation("apa", self.citation.replace("\u2013", "\u2212"), cache=cache)
+        self.assertEqual((len(cache), cache.stats().hits), (2, 2))
+        self.assertEqual(citation_cache_key("a \t b\u2014c"), "a b-c")
+
+    def test_results_do_not_depend_on_insertion_order(self) -> None:
+        dashed = self.citation.replace("Deep learning for everything", "Deep learning\u2014a survey")
+        hyphenated = dashed.replace("\u2014", "-")
+        spaced = dashed.replace("Journal of", "Journal  of")
+        expected = parse_citation("apa", citation_cache_key(dashed))
+        for order in ((dashed, hyphenated, spaced), (spaced, hyphenated, dashed)):
+            cache = ParseCache()
+            for text in order:
+                self.assertEqual(parse_citation("apa", text, cache=cache), expected)
+        self.assertEqual(expected.title, "Deep learning-a survey")
+
+    def test_unsupported_style_is_named(self) -> None:
+        with self.assertRaisesRegex(CitationParseError, "Unsupported style 'harvard'"):
+            parse_citation("harvard", self.citation, cache=ParseCache())
+
+    def test_styles_are_cached_separately(self) -> None:
+        cache = ParseCache()
+        parse_citation("apa", self.citation, cache=cache)
+        parse_citation("auto", self.citation, cache=cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_failures_are_not_cached(self) -> None:
+        cache = ParseCache()
+        for _ in range(2):
+            with self.assertRaises(CitationParseError):
+                parse_citation("ieee", "not a citation", cache=cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_maxsize_bounds_entries(self) -> None:
+        cache = ParseCache(maxsize=1)
+        parse_citation("apa", self.citation, cache=cache)
+        parse_citation("apa", self.citation.replace("2020", "2021"), cache=cache)
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from transtex import (
+    CitationIndex,
+    ConversionError,
+    Reference,
+    cite_keys,
+    format_apa7_intext,
+    format_apa_intext,
+    format_chicago_intext,
+    format_ieee_intext,
+    format_mla_intext,
+    format_vancouver_intext,
+)
+
+
+def _reference(cite_key: str, authors: list[str], year: str, title: str = "Title") -> Reference:
+    return Reference(entry_type="article", cite_key=cite_key, title=title, authors=authors, year=year)
+
+
+class InTextFormatterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pair = _reference("doe2020", ["John Doe", "Jane Smith"], "2020")
+        self.trio = _reference("doe2021", ["John Doe", "Jane Smith", "Alice Lee"], "2021")
+
+    def test_apa7(self) -> None:
+        self.assertEqual(format_apa7_intext(self.pair), "(Doe & Smith, 2020)")
+        self.assertEqual(format_apa7_intext(self.trio, "15"), "(Doe et al., 2021, p. 15)")
+
+    def test_apa6_lists_up_to_five_authors(self) -> None:
+        self.assertEqual(format_apa_intext(self.trio), "(Doe, Smith, & Lee, 2021)")
+
+    def test_chicago_with_locator(self) -> None:
+        self.assertEqual(format_chicago_intext(self.pair, "15"), "(Doe and Smith 2020, 15)")
+
+    def test_mla_has_no_year(self) -> None:
+        self.assertEqual(format_mla_intext(self.pair, "15-17"), "(Doe and Smith 15–17)")
+        self.assertEqual(format_mla_intext(self.trio), "(Doe et al.)")
+
+    def test_numbered_styles(self) -> None:
+        self.assertEqual(format_ieee_intext(12), "[12]")
+        self.assertEqual(format_ieee_intext(12, "15"), "[12, p. 15]")
+        self.assertEqual(format_vancouver_intext(3), "(3)")
+
+    def test_missing_authors_use_title(self) -> None:
+        reference = _reference("anon", [], "2019", title="Annual Report")
+        self.assertEqual(format_apa7_intext(reference), '("Annual Report", 2019)')
+
+
+class CitationIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.references = [
+            _reference("doe2020b", ["John Doe"], "2020", "Second"),
+            _reference("lee2019", ["Alice Lee"], "2019", "Other"),
+            _reference("doe2020a", ["John Doe"], "2020", "First"),
+        ]
+
+    def test_author_date_suffixes_match_reference_list(self) -> None:
+        index = CitationIndex(self.references, "apa7")
+        self.assertEqual(index.cite("doe2020b"), "(Doe, 2020b)")
+        self.assertEqual(index.cite(["doe2020a", "lee2019"]), "(Doe, 2020a; Lee, 2019)")
+
+    def test_numbered_styles_follow_collection_order(self) -> None:
+        index = CitationIndex(self.references, "ieee")
+        self.assertEqual(index.cite(["lee2019", "doe2020a"]), "[2], [3]")
+        vancouver = CitationIndex(self.references, "vancouver")
+        self.assertEqual(vancouver.cite(["doe2020b", "lee2019"]), "(1, 2)")
+
+    def test_batch_lookup(self) -> None:
+        self.assertEqual(
+            cite_keys(self.references, "chicago", ["lee2019", ["doe2020a", "doe2020b"]]),
+            ["(Lee 2019)", "(Doe 2020a; Doe 2020b)"],
+        )
+
+    def test_locator_applies_to_last_key(self) -> None:
+        index = CitationIndex(self.references, "chicago")
+        self.assertEqual(index.cite(["lee2019", "doe2020a"], locator="15"), "(Lee 2019; Doe 2020a, 15)")
+        self.assertEqual(index.cite("doe2020a"), "(Doe 2020a)")
+
+    def test_unknown_key(self) -> None:
+        index = CitationIndex(self.references, "apa7")
+        with self.assertRaises(ConversionError):
+            index.cite("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+from transtex import Reference, format_apa, format_ieee, iter_bibtex_entries, parse_bibtex_entry
+from transtex.checkpoint import load_checkpoint
+from transtex.cli import _parse_to_bibtex, main
+
+BIB = r"""% exported by a reference manager
+@string{jo = "Journal of Omniscience"}
+
+@article{doe2020deep,
+  author = {John Doe and J{\"u}rgen M{\"u}ller},
+  title = {Deep Learning for Everything},
+  journal = {Journal of Omniscience},
+  year = {2020},
+  volume = {42},
+  number = {7},
+  pages = {1--10}
+}
+@comment{ignored}
+@book{turing1950,
+  author = {Alan M. Turing},
+  title = {Computing Machinery and Intelligence},
+  publisher = {Oxford University Press},
+  year = {1950}
+}
+"""
+
+
+def run(argv, stdin=""):
+    out, err = io.StringIO(), io.StringIO()
+    with mock.patch("sys.stdin", io.StringIO(stdin)), redirect_stdout(out), redirect_stderr(err):
+        status = main(argv)
+    return status, out.getvalue(), err.getvalue()
+
+
+class CommandLineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.bib = Path(self.directory.name) / "refs.bib"
+        self.bib.write_text(BIB, encoding="utf-8")
+        self.references = [parse_bibtex_entry(entry, decode_latex=True) for entry in iter_bibtex_entries(BIB)]
+
+    def test_iter_bibtex_entries_skips_non_references(self) -> None:
+        self.assertEqual([reference.cite_key for reference in self.references], ["doe2020deep", "turing1950"])
+
+    def test_format_file(self) -> None:
+        status, out, err = run(["format", "--style", "apa", "--decode-latex", str(self.bib)])
+        self.assertEqual(status, 0)
+        self.assertEqual(out.splitlines(), [format_apa(reference) for reference in self.references])
+        self.assertIn("format: 2 items, 0 failed", err)
+        # Like parse_bibtex_entry, the command leaves LaTeX alone unless asked.
+        status, out, _ = run(["format", "--style", "apa", "-q", str(self.bib)])
+        self.assertIn(r'M{\"u}ller', out)
+
+    def test_convert_stdin_with_jobs(self) -> None:
+        lines = "\n".join(format_apa(_article(index)) for index in range(12)) + "\n\n"
+        for executor in ("process", "thread"):
+            with self.subTest(executor=executor):
+                status, out, _ = run(
+                    ["convert", "--from", "apa", "--to", "ieee", "-j", "2", "--chunksize", "5", "--executor", executor, "-q"],
+                    stdin=lines,
+                )
+                self.assertEqual(status, 0)
+                expected = [format_ieee(_article(index)) for index in range(12)]
+                self.assertEqual(out.splitlines(), expected)
+
+    def test_failures_are_reported_and_skipped(self) -> None:
+        status, out, err = run(["convert", "--from", "apa", "--to", "ieee"], stdin="not a citation\n" + format_apa(_article(1)))
+        self.assertEqual(status, 1)
+        self.assertEqual(out.splitlines(), [format_ieee(_article(1))])
+        self.assertIn("<stdin>:1: parse failed", err)
+        self.assertIn("2 items, 1 failed", err)
+
+    def test_parse_writes_bibtex_to_output_file(self) -> None:
+        target = Path(self.directory.name) / "out.bib"
+        lines = format_apa(_article(1)) + "\n" + format_apa(_article(2)) + "\n"
+        status, out, _ = run(["parse", "--style", "apa", "-o", str(target), "-q"], stdin=lines)
+        self.assertEqual((status, out), (0, ""))
+        entries = list(iter_bibtex_entries(target.read_text(encoding="utf-8")))
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(parse_bibtex_entry(entries[1]).volume, "3")
+
+    def test_undecodable_input_is_reported_and_skipped(self) -> None:
+        latin1 = Path(self.directory.name) / "latin1.txt"
+        latin1.write_bytes(format_apa(_article(1)).encode("utf-8") + b"\nM\xfcller, J. (2020). Title.\n")
+        good = Path(self.directory.name) / "good.txt"
+        good.write_text(format_apa(_article(2)) + "\n", encoding="utf-8")
+        status, out, err = run(["convert", "--from", "apa", "--to", "ieee", "-j", "2", str(latin1), str(good)])
+        self.assertEqual(status, 1)
+        self.assertEqual(out.splitlines(), [format_ieee(_article(1)), format_ieee(_article(2))])
+        self.assertIn(f"{latin1}:2: read failed: not valid UTF-8", err)
+        self.assertIn("3 items, 1 failed", err)
+
+        broken = Path(self.directory.name) / "broken.bib"
+        broken.write_bytes(BIB.encode("utf-8").replace(b"Alan", b"Al\xe1n"))
+        status, out, err = run(["format", "--style", "apa", "--decode-latex", str(broken)])
+        self.assertEqual(status, 1)
+        self.assertEqual(out.splitlines(), [format_apa(self.references[0])])
+        self.assertIn(f"{broken}: entry 2: read failed", err)
+
+    def test_missing_input_file(self) -> None:
+        status, _, err = run(["format", "--style", "apa", str(self.bib) + ".missing"])
+        self.assertEqual(status, 2)
+        self.assertIn("No such file", err)
+
+
+class CheckpointTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        lines = [format_apa(_article(index)) for index in range(40)]
+        lines.insert(13, "not a citation")
+        self.inputs = []
+        for part in range(2):
+            path = self.root / f"part{part}.txt"
+            path.write_bytes(("\r\n".join(lines[part * 20 :]) + "\r\n\r\n").encode("utf-8"))
+            self.inputs.append(str(path))
+        self.argv = ["parse", "--style", "apa", *self.inputs, "-q", "--checkpoint-every", "7"]
+
+    def test_resume_after_crash_is_byte_identical(self) -> None:
+        expected = self.root / "expected.bib"
+        status, _, _ = run([*self.argv, "-o", str(expected)])
+        self.assertEqual(status, 1)
+
+        output = self.root / "out.bib"
+        checkpoint = str(self.root / "job.checkpoint")
+        argv = [*self.argv, "-o", str(output), "--checkpoint", checkpoint]
+        calls = 0
+
+        def crash_after_some_chunks(*args):
+            nonlocal calls
+            calls += 1
+            if calls > 30:
+                raise KeyboardInterrupt
+            return _parse_to_bibtex(*args)
+
+        with mock.patch("transtex.cli._parse_to_bibtex", crash_after_some_chunks):
+            with self.assertRaises(KeyboardInterrupt):
+                run([*argv, "--chunksize", "1"])
+        with open(output, "a", encoding="utf-8") as handle:
+            handle.write("@article{torn,\n  title = {half a wri")
+        self.assertNotEqual(output.read_bytes(), expected.read_bytes())
+
+        status, _, err = run([*argv, "--resume", "-j", "2", "--executor", "thread"])
+        self.assertEqual(status, 1)
+        self.assertEqual(output.read_bytes(), expected.read_bytes())
+        # The failure on line 14 came before the checkpoint, so it is not redone.
+        self.assertNotIn("part0.txt:14", err)
+
+    def test_undecodable_input_is_recorded_in_the_checkpoint(self) -> None:
+        lines = Path(self.inputs[0]).read_bytes().split(b"\r\n")
+        lines[4] = lines[4].replace(b"Doe", b"D\xf6e")
+        Path(self.inputs[0]).write_bytes(b"\r\n".join(lines))
+        expected = self.root / "expected.bib"
+        status, _, err = run([*self.argv, "-o", str(expected)])
+        self.assertEqual(status, 1)
+        self.assertIn("part0.txt:5: read failed", err)
+
+        output = self.root / "out.bib"
+        checkpoint = self.root / "job.checkpoint"
+        argv = [*self.argv, "-o", str(output), "--checkpoint", str(checkpoint)]
+        status, _, err = run(argv)
+        self.assertEqual(status, 1)
+        self.assertIn("part0.txt:5: read failed", err)
+        self.assertEqual(output.read_bytes(), expected.read_bytes())
+        saved = load_checkpoint(checkpoint)
+        self.assertEqual((saved.position.file, saved.items, saved.failed), (1, 26, 1))
+
+        # A finished job resumes to the same output without reading again.
+        status, _, err = run([*argv, "--resume"])
+        self.assertEqual(status, 1)
+        self.assertNotIn("read failed", err)
+        self.assertEqual(output.read_bytes(), expected.read_bytes())
+
+    def test_checkpoint_is_tied_to_its_job(self) -> None:
+        output = str(self.root / "out.bib")
+        checkpoint = str(self.root / "job.checkpoint")
+        self.assertEqual(run([*self.argv, "-o", output, "--checkpoint", checkpoint])[0], 1)
+        other = ["parse", "--style", "auto", *self.inputs, "-o", output, "--checkpoint", checkpoint, "--resume"]
+        status, _, err = run(other)
+        self.assertEqual(status, 2)
+        self.assertIn("different job", err)
+        status, _, err = run(["convert", "--from", "apa", "--to", "ieee", "--checkpoint", checkpoint])
+        self.assertEqual(status, 2)
+        self.assertIn("needs input files and -o", err)
+
+
+def _article(index: int) -> Reference:
+    return Reference(
+        entry_type="article",
+        cite_key=f"ref{index}",
+        title=f"Deep Learning for Everything, Part {index}",
+        authors=["John Doe", "Jane Smith"],
+        journal="Journal of Omniscience",
+        year=str(1990 + index % 30),
+        volume=str(index % 60 + 1),
+        issue=str(index % 12 + 1),
+        pages=f"{index}-{index + 12}",
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
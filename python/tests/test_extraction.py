@@ -0,0 +1,92 @@
+import unittest
+
+from transtex import extract_references, find_reference_section
+
+IEEE_ENTRY = (
+    'J. Doe and J. Smith, "Deep Learning for Everything," Journal of Omniscience, '
+    "vol. 42, no. 7, pp. 1–10, 2020, doi: 10.1000/j.jo.2020.01.001."
+)
+
+DOCUMENT = (
+    "Contents\n"
+    "1 Introduction\n"
+    "7 References\n"
+    "\n"
+    "1 Introduction\n"
+    "Body text citing [1] and [2].\n"
+    "\n"
+    "References\n"
+    f"[1] {IEEE_ENTRY}\n"
+    f"[2] {IEEE_ENTRY.replace('2020', '2021')}\n"
+    "\n"
+    "Appendix A: Proofs\n"
+    "[1] This is not a reference.\n"
+)
+
+
+class FindReferenceSectionTests(unittest.TestCase):
+    def test_uses_last_heading_and_stops_at_appendix(self) -> None:
+        section = find_reference_section(DOCUMENT)
+        assert section is not None
+        self.assertEqual(section.heading, "References")
+        self.assertEqual(section.start_line, 9)
+        self.assertTrue(section.text.startswith("[1] J. Doe"))
+        self.assertNotIn("Appendix", section.text)
+        self.assertEqual(DOCUMENT[section.start : section.end], section.text)
+
+    def test_wrapped_entry_is_not_a_section_heading(self) -> None:
+        document = (
+            "References\n"
+            "[1] J. Doe, \"Indexing the literature,\" Journal of Omniscience,\n"
+            "Index Medicus, vol. 4, pp. 1–10, 2020.\n"
+            "[2] J. Smith, \"Appendices,\" Journal of Omniscience, vol. 5,\n"
+            "appendix to vol. 4, 2021,\n"
+            "pp. 11–20.\n"
+            "\n"
+            "Index\n"
+            "Deep learning, 1\n"
+        )
+        section = find_reference_section(document)
+        assert section is not None
+        self.assertTrue(section.text.endswith("pp. 11–20.\n\n"))
+
+    def test_numbered_heading_variants(self) -> None:
+        document = "Intro\n\n8. Works Cited:\nDoe, J. (2020). Title.\n"
+        section = find_reference_section(document)
+        assert section is not None
+        self.assertEqual(section.heading, "Works Cited")
+        self.assertEqual(section.text, "Doe, J. (2020). Title.\n")
+
+    def test_falls_back_to_numbered_line_run(self) -> None:
+        entries = "\n".join(f"[{number}] Entry {number}" for number in range(1, 6))
+        document = f"Some text with [1] inline.\n\n{entries}\ncontinued line\n\nTrailing paragraph.\n"
+        section = find_reference_section(document)
+        assert section is not None
+        self.assertIsNone(section.heading)
+        self.assertTrue(section.text.startswith("[1] Entry 1"))
+        self.assertTrue(section.text.endswith("continued line"))
+
+    def test_no_section(self) -> None:
+        self.assertIsNone(find_reference_section("Just prose.\n[1] one\n"))
+
+    def test_large_document_with_inline_markers(self) -> None:
+        # Timing lives in benchmarks/bench_extraction.py; this checks that the
+        # inline [n] markers in a long body are not taken for entries.
+        filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit [12].\n" * 20_000
+        document = f"{filler}References\n[1] {IEEE_ENTRY}\n"
+        section = find_reference_section(document)
+        assert section is not None
+        self.assertEqual(section.heading, "References")
+        self.assertEqual(section.start_line, 20_002)
+        self.assertEqual(section.text, f"[1] {IEEE_ENTRY}\n")
+
+
+class ExtractReferencesTests(unittest.TestCase):
+    def test_parses_section_with_document_line_numbers(self) -> None:
+        parsed = list(extract_references(DOCUMENT, "ieee"))
+        self.assertEqual([item.reference.year for item in parsed], ["2020", "2021"])
+        self.assertEqual([item.start_line for item in parsed], [9, 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ from transtex import (
     format_mla,
     format_vancouver,
 )
+from transtex.formatters.shared import sentence_case, title_case
 
 
 class FormattingTests(unittest.TestCase):
@@ -197,5 +198,34 @@ class FormattingTests(unittest.TestCase):
         self.assertEqual(formatted, expected)
 
 
+class CasingTests(unittest.TestCase):
+    def test_sentence_case_honors_brace_protection(self) -> None:
+        self.assertEqual(
+            sentence_case("{DNA} Repair in {Bayesian} Models of the {RNA World}"),
+            "DNA repair in Bayesian models of the RNA World",
+        )
+
+    def test_title_case_honors_brace_protection(self) -> None:
+        self.assertEqual(title_case("the {iPhone} of the year"), "The iPhone of the Year")
+        self.assertEqual(title_case("{B}ayesian networks"), "Bayesian Networks")
+
+    def test_latex_command_groups_keep_braces(self) -> None:
+        self.assertEqual(sentence_case('Sch{\\"o}n Studies'), 'Sch{\\"o}n studies')
+
+    def test_unbalanced_braces_are_literal(self) -> None:
+        self.assertEqual(sentence_case("Open {Brace Here"), "Open {brace here")
+
+    def test_apa_title_keeps_protected_acronym(self) -> None:
+        reference = Reference(
+            entry_type="article",
+            cite_key="dna",
+            title="{DNA} Sequencing at Scale",
+            authors=["John Doe"],
+            journal="Genome",
+            year="2021",
+        )
+        self.assertIn("(2021). DNA sequencing at scale.", format_apa7(reference))
+
+
 if __name__ == "__main__":
     unittest.main()
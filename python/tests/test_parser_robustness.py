@@ -0,0 +1,106 @@
+import random
+import time
+import unittest
+from unittest import mock
+
+from transtex import CitationParseError, parse_citation
+from transtex.parsers import shared
+from transtex.parsers import (
+    parse_apa_citation,
+    parse_chicago_citation,
+    parse_ieee_citation,
+    parse_mla_citation,
+    parse_vancouver_citation,
+)
+
+PARSERS = {
+    "apa": parse_apa_citation,
+    "chicago": parse_chicago_citation,
+    "ieee": parse_ieee_citation,
+    "mla": parse_mla_citation,
+    "vancouver": parse_vancouver_citation,
+}
+
+# Generous enough for slow CI machines; the quadratic patterns these inputs
+# used to trigger took seconds at this size.
+WORST_CASE_SECONDS = 0.5
+SIZE = 64_000
+
+
+def adversarial_inputs(size: int) -> dict[str, str]:
+    return {
+        "open parens": "(" * size,
+        "unclosed issues": "Doe, J. (2020). T. J" + ", 1(" * (size // 4),
+        "comma runs": "Doe, J. (2020). T. J" + ", 1" * (size // 3) + "!",
+        "url fragments": "Doe, J. (2020). T. " + "http://" * (size // 7) + " x",
+        "doi fragments": 'Doe. 2020. "T." ' + "10." * (size // 3) + " x",
+        "unclosed quote": '"' + "a" * size,
+        "quotes and newlines": '"\n' * (size // 2),
+        "dotless": "a " * (size // 2),
+        "dotted": "a. " * (size // 3),
+        "chicago issues": 'Doe. 2020. "T." J' + " 1 (" * (size // 4),
+        "year runs": ". 2020. \n" * (size // 9),
+    }
+
+
+class ParserTimingTests(unittest.TestCase):
+    def assert_fast(self, parser, text: str, label: str) -> None:
+        start = time.perf_counter()
+        try:
+            parser(text)
+        except ValueError:
+            pass
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, WORST_CASE_SECONDS, f"{parser.__name__} on {label}: {elapsed:.2f}s")
+
+    def test_adversarial_inputs_parse_in_linear_time(self) -> None:
+        with mock.patch.object(shared, "MAX_CITATION_LENGTH", SIZE * 2):
+            for label, text in adversarial_inputs(SIZE).items():
+                for parser in PARSERS.values():
+                    self.assert_fast(parser, text, label)
+
+    def test_random_punctuation_fuzz(self) -> None:
+        rng = random.Random(20240521)
+        alphabet = 'aZ09 .,;:()"&/\n–-' + "httpsdoi"
+        for _ in range(200):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 400)))
+            for parser in PARSERS.values():
+                self.assert_fast(parser, text, repr(text[:40]))
+
+
+class InputLimitTests(unittest.TestCase):
+    def test_long_input_is_rejected(self) -> None:
+        text = "Doe, J. (2020). " + "x" * shared.MAX_CITATION_LENGTH
+        for style in PARSERS:
+            with self.assertRaisesRegex(CitationParseError, "exceeds"):
+                parse_citation(style, text)
+
+    def test_surrounding_whitespace_does_not_count(self) -> None:
+        citation = "Doe, J. (2020). Title. Journal, 1(2), 3-4."
+        padded = " " * shared.MAX_CITATION_LENGTH + citation + "\n"
+        self.assertEqual(parse_citation("apa", padded).title, "Title")
+
+
+class TrailingLocatorTests(unittest.TestCase):
+    CITATIONS = {
+        "apa": "Doe, J. (2020). Deep learning. Journal of Omniscience, 42(7), {pages}.",
+        "mla": 'Doe, John. "Deep Learning." Journal of Omniscience, vol. 42, no. 7, 2020, pp. {pages}.',
+        "chicago": 'Doe, John. 2020. "Deep Learning." Journal of Omniscience 42 (7): {pages}.',
+    }
+
+    def test_page_ranges_ending_in_10_are_not_dois(self) -> None:
+        for style, template in self.CITATIONS.items():
+            for pages, expected in (("1–10", "1–10"), ("100-110", "100–110"), ("5-10", "5–10")):
+                with self.subTest(style=style, pages=pages):
+                    reference = parse_citation(style, template.format(pages=pages))
+                    self.assertEqual(reference.pages, expected)
+                    self.assertIsNone(reference.doi)
+
+    def test_bare_doi_after_pages_is_still_found(self) -> None:
+        text = self.CITATIONS["apa"].format(pages="1-10") + " 10.1000/j.jo.2020.01.001"
+        reference = parse_citation("apa", text)
+        self.assertEqual((reference.pages, reference.doi), ("1–10", "10.1000/j.jo.2020.01.001"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 import unittest
+from unittest import mock
 
 from transtex import (
     CitationParseError,
     citation_to_bibtex,
+    detect_style,
     format_apa,
     format_chicago,
     format_ieee,
@@ -13,6 +15,10 @@ from transtex import (
     parse_ieee_citation,
     reference_to_bibtex,
 )
+from transtex.detection import _PARSERS as _DETECTION_PARSERS, StyleDetection
+from transtex.normalization import normalize_citation_text
+from transtex.parsers.lexer import LOCATOR, NO, PAGES, PAREN, QUOTED, VOL, YEAR, tokenize
+from transtex.parsing import _PARSERS
 from transtex.reference import Reference
 
 
@@ -90,5 +96,129 @@ class ParsingTests(unittest.TestCase):
         self.assertIn("@article{doe2020deeplearningforeverything", bibtex)
 
 
+class LexerTests(unittest.TestCase):
+    def kinds(self, text: str) -> list:
+        return [(token.kind, token.value) for token in tokenize(text)]
+
+    def test_ieee_primitives(self) -> None:
+        text = 'J. Doe, "Deep Learning," Journal, vol. 42, no. 3-4, pp. 1–10, 2020, doi: 10.1000/j.1.'
+        self.assertEqual(
+            self.kinds(text),
+            [
+                (QUOTED, "Deep Learning,"),
+                (VOL, "42"),
+                (NO, "3-4"),
+                (PAGES, "1–10"),
+                (YEAR, "2020"),
+                (LOCATOR, "doi: 10.1000/j.1"),
+            ],
+        )
+
+    def test_offsets_slice_the_source(self) -> None:
+        text = "Doe, J. (2020). Title. Journal, 42(7), 1–10. https://doi.org/10.1000/j.1"
+        for token in tokenize(text):
+            self.assertIn(token.value, text[token.start : token.end])
+        self.assertEqual([token.kind for token in tokenize(text)], [PAREN, PAREN, LOCATOR])
+
+    def test_tokens_need_a_word_boundary(self) -> None:
+        self.assertEqual(self.kinds("Evol. 5 piano. 7 12345 1999a"), [])
+        self.assertEqual(self.kinds("Doe. n.d. Title"), [(YEAR, "n.d.")])
+
+    def test_quoted_title_hides_its_contents(self) -> None:
+        self.assertEqual(self.kinds('"Vol. 3 of 2020 (Reprint)" 1999'), [(QUOTED, "Vol. 3 of 2020 (Reprint)"), (YEAR, "1999")])
+
+    def test_locator_excludes_closing_punctuation(self) -> None:
+        self.assertEqual(self.kinds("see https://example.org/a."), [(LOCATOR, "https://example.org/a")])
+
+    def test_chicago_without_date(self) -> None:
+        reference = parse_citation("chicago", 'Doe, John. n.d. "Deep Learning." J Omni 42 (7): 1–10.')
+        self.assertEqual((reference.year, reference.volume, reference.issue), ("n.d.", "42", "7"))
+
+
+class NormalizationTests(unittest.TestCase):
+    def test_pdf_punctuation_is_mapped(self) -> None:
+        text = "J.\u00a0Doe, \u201cDe\u00adep \ufb01ndings,\u201d O\u2019Brien, pp. 1\u20122\u200b"
+        self.assertEqual(normalize_citation_text(text), "J. Doe, \"Deep findings,\" O'Brien, pp. 1–2")
+
+    def test_decomposed_accents_are_composed(self) -> None:
+        self.assertEqual(normalize_citation_text("Cafe\u0301"), "Caf\u00e9")
+
+    def test_ascii_is_returned_as_is(self) -> None:
+        text = "Doe, J. (2020). Title."
+        self.assertIs(normalize_citation_text(text), text)
+
+    def test_parsers_accept_pasted_text(self) -> None:
+        ieee = format_ieee(
+            Reference(
+                entry_type="article",
+                cite_key="x",
+                title="Deep Learning",
+                authors=["John Doe"],
+                journal="Journal",
+                year="2020",
+                volume="42",
+                pages="1-10",
+            )
+        )
+        pasted = ieee.replace('"', "\u201c", 1).replace(',"', ",\u201d").replace(" ", "\u00a0")
+        self.assertEqual(parse_citation("ieee", pasted).title, "Deep Learning")
+        self.assertEqual(parse_ieee_citation(pasted).volume, "42")
+        self.assertEqual(detect_style(pasted).style, "ieee")
+
+
+class StyleDetectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.reference = Reference(
+            entry_type="article",
+            cite_key="doe2020deep",
+            title="Deep Learning for Everything",
+            authors=["John Doe", "Jane Smith"],
+            journal="Journal of Omniscience",
+            year="2020",
+            volume="42",
+            issue="7",
+            pages="1-10",
+            doi="10.1000/j.jo.2020.01.001",
+        )
+
+    def test_detects_each_style(self) -> None:
+        formatters = {
+            "apa": format_apa,
+            "ieee": format_ieee,
+            "mla": format_mla,
+            "chicago": format_chicago,
+            "vancouver": format_vancouver,
+        }
+        for style, formatter in formatters.items():
+            with self.subTest(style=style):
+                detection = detect_style(formatter(self.reference))
+                self.assertEqual(detection.style, style)
+                self.assertGreater(detection.confidence, 0.5)
+
+    def test_tie_is_settled_by_parsing(self) -> None:
+        text = 'J. Doe, "Title," Journal, vol. 42, no. 7, 2020, pp. 1-10.'
+        detection = detect_style(text)
+        self.assertEqual(detection.style, "ieee")
+        self.assertLessEqual(detection.confidence, 0.5)
+        self.assertEqual(detection.reference, parse_citation("ieee", text))
+        # "auto" reuses the parse that broke the tie instead of parsing again.
+        with mock.patch.dict(_PARSERS, ieee=mock.Mock(side_effect=AssertionError("parsed twice"))):
+            self.assertEqual(parse_citation("auto", text), detection.reference)
+
+    def test_undetectable_text(self) -> None:
+        # No probe matched, so no parser is tried.
+        with mock.patch.dict(_DETECTION_PARSERS, {style: mock.Mock() for style in _DETECTION_PARSERS}):
+            self.assertEqual(detect_style("Doe J. Title here. Journal. 2020."), StyleDetection(None, 0.0))
+            self.assertFalse(any(parser.called for parser in _DETECTION_PARSERS.values()))
+        self.assertIsNone(detect_style("not a citation").style)
+
+    def test_parse_citation_auto(self) -> None:
+        parsed = parse_citation("auto", format_chicago(self.reference))
+        self.assertEqual(parsed.title, self.reference.title)
+        self.assertEqual(parsed.volume, "42")
+        with self.assertRaises(CitationParseError):
+            parse_citation("auto", "not a citation")
+
+
 if __name__ == "__main__":
     unittest.main()
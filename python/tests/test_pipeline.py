@@ -0,0 +1,107 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from transtex import (
+    BatchResult,
+    ConversionError,
+    Pipeline,
+    Reference,
+    convert_citation,
+    format_apa,
+    format_ieee,
+    parse_bibtex_entry,
+    read_bib,
+    read_citations,
+    reference_to_bibtex,
+)
+
+
+def _reference(index: int) -> Reference:
+    return Reference(
+        entry_type="article" if index % 3 else "book",
+        cite_key=f"ref{index}",
+        title=f"Deep Learning for Everything, Part {index}",
+        authors=["John Doe", "Jane Smith"],
+        journal="Journal of Omniscience",
+        publisher="Omniscience Press",
+        year=str(1990 + index % 30),
+        pages=f"{index}-{index + 12}",
+    )
+
+
+def _upper_title(reference: Reference) -> Reference:
+    copy = reference.copy()
+    copy.title = (copy.title or "").upper()
+    return copy
+
+
+class PipelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.references = [_reference(index) for index in range(20)]
+        self.bib = "\n\n".join(reference_to_bibtex(reference) for reference in self.references)
+
+    def test_read_filter_map_format_write(self) -> None:
+        parsed = [parse_bibtex_entry(reference_to_bibtex(reference)) for reference in self.references]
+        expected = [format_ieee(_upper_title(ref)) for ref in parsed if ref.entry_type == "article"]
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / "refs.bib"
+            source.write_text(self.bib, encoding="utf-8")
+            target = Path(directory) / "refs.txt"
+            pipeline = read_bib(source).filter(lambda ref: ref.entry_type == "article").map(_upper_title)
+            count = pipeline.format("ieee").write(target)
+            self.assertEqual(count, len(expected))
+            self.assertEqual(target.read_text(encoding="utf-8").splitlines(), expected)
+            # A path source is reopened, so the pipeline can run again.
+            self.assertEqual(pipeline.format("ieee").collect(), expected)
+
+    def test_stages_are_lazy_and_fused(self) -> None:
+        seen = []
+
+        def source():
+            for reference in self.references:
+                seen.append(reference.cite_key)
+                yield reference
+
+        results = iter(Pipeline(source()).map(_upper_title).format("apa"))
+        self.assertEqual(seen, [])
+        self.assertEqual(next(results), format_apa(_upper_title(self.references[0])))
+        self.assertEqual(seen, ["ref0"])
+
+    def test_parallel_stages_keep_order(self) -> None:
+        citations = [format_apa(reference) for reference in self.references]
+        expected = [convert_citation("apa", "ieee", text) for text in citations]
+        for executor in ("process", "thread"):
+            with self.subTest(executor=executor):
+                pipeline = read_citations(io.StringIO("\n\n".join(citations)))
+                converted = pipeline.convert("apa", "ieee", workers=2, chunksize=3, executor=executor)
+                self.assertEqual(converted.collect(), expected)
+                mapped = Pipeline(self.references).map(_upper_title, workers=2, chunksize=4, executor=executor)
+                self.assertEqual(mapped.collect(), [_upper_title(reference) for reference in self.references])
+
+    def test_parse_then_bibtex(self) -> None:
+        citations = [format_apa(reference) for reference in self.references[:3]]
+        entries = Pipeline(citations).parse("apa").bibtex().collect()
+        self.assertEqual(len(entries), 3)
+        self.assertTrue(all(entry.startswith("@") for entry in entries))
+
+    def test_capture_errors(self) -> None:
+        results = Pipeline(["not a citation", format_apa(self.references[1])]).convert(
+            "apa", "ieee", errors="capture"
+        ).collect()
+        self.assertIsInstance(results[0], BatchResult)
+        self.assertFalse(results[0].ok)
+        self.assertTrue(results[1].ok)
+
+    def test_bad_options_fail_when_built(self) -> None:
+        with self.assertRaises(ConversionError):
+            Pipeline([]).format("nope")
+        with self.assertRaises(ValueError):
+            Pipeline([]).map(str, workers=2, executor="fiber")
+        with self.assertRaises(ValueError):
+            Pipeline([]).parse(errors="ignore")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import io
+import unittest
+
+from transtex import CitationParseError, parse_citations, parse_reference_list
+from transtex.segmentation import iter_citation_blocks, iter_citation_parts
+
+IEEE_ENTRY = (
+    'J. Doe and J. Smith, "Deep Learning for Everything," Journal of Omniscience, '
+    "vol. 42, no. 7, pp. 1–10, 2020, doi: 10.1000/j.jo.2020.01.001."
+)
+VANCOUVER_ENTRY = (
+    "Doe J, Smith J. Deep learning for everything. Journal of Omniscience. "
+    "2020;42(7):1–10. doi:10.1000/j.jo.2020.01.001."
+)
+
+
+class CitationBlockTests(unittest.TestCase):
+    def test_bracketed_numbers_with_wrapped_lines(self) -> None:
+        text = (
+            '[1] J. Doe and J. Smith, "Deep Learning for Everything,"\n'
+            "Journal of Omniscience, vol. 42, no. 7, pp. 1–10,\n"
+            "2020. More text\n"
+            '[2] A. Lee, "Other Work," Nature, vol. 1, 2019.\n'
+        )
+        blocks = list(iter_citation_blocks(text))
+        self.assertEqual(len(blocks), 2)
+        self.assertEqual((blocks[0].start_line, blocks[0].end_line), (1, 3))
+        self.assertTrue(blocks[0].text.startswith("J. Doe and J. Smith"))
+        self.assertIn("pp. 1–10, 2020. More text", blocks[0].text)
+        self.assertEqual((blocks[1].start_line, blocks[1].end_line), (4, 4))
+
+    def test_dotted_numbers(self) -> None:
+        text = "1. First entry\n   continues here\n2. Second entry\n"
+        blocks = list(iter_citation_blocks(text))
+        self.assertEqual([block.text for block in blocks], ["First entry continues here", "Second entry"])
+
+    def test_hanging_indent(self) -> None:
+        text = "Doe, J. (2020). First.\n    Journal, 1.\nLee, A. (2019). Second.\nSmith, J. (2018). Third.\n"
+        blocks = list(iter_citation_blocks(text))
+        self.assertEqual(len(blocks), 3)
+        self.assertEqual(blocks[0].text, "Doe, J. (2020). First. Journal, 1.")
+        self.assertEqual((blocks[2].start_line, blocks[2].end_line), (4, 4))
+
+    def test_paragraph_layout(self) -> None:
+        text = "\nDoe, J. (2020). First.\nJournal, 1.\n\nLee, A. (2019).\nSecond.\n"
+        blocks = list(iter_citation_blocks(text, layout="paragraph"))
+        self.assertEqual([(b.start_line, b.end_line) for b in blocks], [(2, 3), (5, 6)])
+
+    def test_reads_lines_lazily_from_file_objects(self) -> None:
+        stream = io.StringIO("[1] One\n[2] Two\n")
+        iterator = iter_citation_blocks(stream)
+        self.assertEqual(next(iterator).text, "One")
+        self.assertEqual(next(iterator).text, "Two")
+
+    def test_rejects_unknown_layout(self) -> None:
+        with self.assertRaises(ValueError):
+            list(iter_citation_blocks("x", layout="columns"))
+
+
+class ParseReferenceListTests(unittest.TestCase):
+    def test_parses_ieee_list_with_spans(self) -> None:
+        text = f"[1] {IEEE_ENTRY}\n\n[2] {IEEE_ENTRY.replace('2020', '2021')}\n"
+        parsed = list(parse_reference_list(text, "ieee"))
+        self.assertEqual([item.reference.year for item in parsed], ["2020", "2021"])
+        self.assertEqual([(item.start_line, item.end_line) for item in parsed], [(1, 1), (3, 3)])
+
+    def test_auto_style_on_vancouver_list(self) -> None:
+        text = f"1. {VANCOUVER_ENTRY}\n2. {VANCOUVER_ENTRY}\n"
+        parsed = list(parse_reference_list(text, "auto"))
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual(parsed[0].reference.volume, "42")
+
+    def test_invalid_entries_report_lines_or_are_skipped(self) -> None:
+        text = f"[1] not a citation\n[2] {IEEE_ENTRY}\n"
+        with self.assertRaises(CitationParseError) as ctx:
+            list(parse_reference_list(text, "ieee"))
+        self.assertIn("Lines 1-1", str(ctx.exception))
+        parsed = list(parse_reference_list(text, "ieee", skip_invalid=True))
+        self.assertEqual([item.start_line for item in parsed], [2])
+
+
+class MultiCitationTests(unittest.TestCase):
+    def parts(self, text: str) -> list:
+        return [block.text for block in iter_citation_parts(text)]
+
+    def test_semicolons_and_newlines_separate_parts(self) -> None:
+        self.assertEqual(self.parts("One; Two\nThree;\n\n; Four"), ["One", "Two", "Three", "Four"])
+
+    def test_quotes_and_brackets_are_respected(self) -> None:
+        text = 'A, "On; Semicolons," B (1; 2) [x; y]; \u201cCurly; quote\u201d C'
+        self.assertEqual(
+            self.parts(text),
+            ['A, "On; Semicolons," B (1; 2) [x; y]', "\u201cCurly; quote\u201d C"],
+        )
+
+    def test_urls_and_vancouver_timelines_stay_whole(self) -> None:
+        text = f"See https://example.org/a;b=(c; {VANCOUVER_ENTRY}; D"
+        self.assertEqual(self.parts(text), ["See https://example.org/a;b=(c", VANCOUVER_ENTRY, "D"])
+
+    def test_parse_citations_reports_per_part_errors(self) -> None:
+        results = list(parse_citations("ieee", f"{IEEE_ENTRY}; not a citation\n{IEEE_ENTRY}"))
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertEqual([result.index for result in results], [0, 1, 2])
+        self.assertEqual([result.line for result in results], [1, 1, 2])
+        self.assertEqual(results[0].reference.volume, "42")
+        self.assertIsNone(results[1].reference)
+        self.assertIn("title", results[1].error)
+
+    def test_parse_citations_streams_lines(self) -> None:
+        lines = iter([f"{VANCOUVER_ENTRY}; {VANCOUVER_ENTRY}\n", "broken\n"])
+        results = parse_citations("vancouver", lines)
+        first = next(results)
+        self.assertEqual(first.reference.issue, "7")
+        self.assertEqual(next(lines), "broken\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
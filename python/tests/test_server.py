@@ -0,0 +1,150 @@
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from transtex import Reference, format_apa, format_ieee
+from transtex.batch import _convert_chunk_captured
+from transtex.server import Coalescer, TransTexServer
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+def _article(index: int) -> Reference:
+    return Reference(
+        entry_type="article",
+        cite_key=f"ref{index}",
+        title=f"Deep Learning for Everything, Part {index}",
+        authors=["John Doe", "Jane Smith"],
+        journal="Journal of Omniscience",
+        year=str(1990 + index % 30),
+        volume=str(index % 60 + 1),
+        issue=str(index % 12 + 1),
+        pages=f"{index}-{index + 12}",
+    )
+
+
+def _post(connection: http.client.HTTPConnection, path: str, body: object) -> tuple[int, dict]:
+    connection.request("POST", path, body=json.dumps(body), headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class ServerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = TransTexServer(("127.0.0.1", 0), window=0.001)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.connection = http.client.HTTPConnection(*self.server.server_address[:2], timeout=10)
+        self.addCleanup(self.connection.close)
+
+    def test_endpoints_share_one_keep_alive_connection(self) -> None:
+        citations = [format_apa(_article(index)) for index in range(3)]
+        status, body = _post(self.connection, "/convert", {"from": "apa", "to": "ieee", "citations": citations + [""]})
+        self.assertEqual(status, 200)
+        self.assertEqual([item.get("value") for item in body["results"][:3]], [format_ieee(_article(i)) for i in range(3)])
+        self.assertEqual(body["results"][3]["error"]["code"], "empty_input")
+        sock = self.connection.sock
+
+        status, body = _post(self.connection, "/parse", {"style": "apa", "citation": citations[1]})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["results"][0]["value"]["volume"], "2")
+
+        reference = {"entry_type": "article", "cite_key": "x", "title": "A title", "authors": ["John Doe"], "year": "2020"}
+        status, body = _post(self.connection, "/format", {"style": "ieee", "references": [reference]})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["results"][0]["value"], format_ieee(Reference(**reference)))
+        self.assertIs(self.connection.sock, sock)
+
+    def test_bad_requests(self) -> None:
+        self.assertEqual(_post(self.connection, "/convert", {"from": "apa", "to": "harvard", "citations": []})[0], 400)
+        self.assertEqual(_post(self.connection, "/parse", {"citations": "not a list"})[0], 400)
+        self.assertEqual(_post(self.connection, "/format", {"style": "apa", "references": [{"bogus": 1}]})[0], 400)
+        self.assertEqual(_post(self.connection, "/nowhere", {})[0], 404)
+        self.connection.request("GET", "/health")
+        self.assertEqual(json.loads(self.connection.getresponse().read()), {"status": "ok"})
+
+
+    def test_post_without_content_length_is_refused(self) -> None:
+        body = b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+        with socket.create_connection(self.server.server_address[:2], timeout=10) as sock:
+            sock.sendall(b"POST /convert HTTP/1.1\r\nHost: x\r\n\r\n" + body)
+            received = b""
+            while chunk := sock.recv(65536):
+                received += chunk
+        # One 411 and a closed connection: the body is never read as a request.
+        self.assertTrue(received.startswith(b"HTTP/1.1 411 "))
+        self.assertEqual(received.count(b"HTTP/1.1 "), 1)
+
+class CoalescerTests(unittest.TestCase):
+    def test_concurrent_requests_share_one_batch(self) -> None:
+        calls = []
+
+        def task(items):
+            calls.append(len(items))
+            return _convert_chunk_captured("apa", "ieee", items)
+
+        coalescer = Coalescer(window=0.2, max_batch=1000)
+        citations = [format_apa(_article(index)) for index in range(8)]
+        results = [None] * len(citations)
+
+        def request(index: int) -> None:
+            results[index] = coalescer.submit(("convert",), task, [citations[index]])
+
+        threads = [threading.Thread(target=request, args=(index,)) for index in range(len(citations))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [8])
+        self.assertEqual([result[0].value for result in results], [format_ieee(_article(i)) for i in range(8)])
+
+    def test_full_batch_runs_immediately(self) -> None:
+        coalescer = Coalescer(window=30, max_batch=2)
+        started = time.perf_counter()
+        results = coalescer.submit(("convert",), lambda items: _convert_chunk_captured("apa", "ieee", items), ["", ""])
+        self.assertLess(time.perf_counter() - started, 5)
+        self.assertEqual([result.code for result in results], ["empty_input", "empty_input"])
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "preforking needs os.fork")
+class PreforkTests(unittest.TestCase):
+    def test_preforked_workers_serve_requests(self) -> None:
+        env = dict(os.environ, PYTHONPATH=str(SRC))
+        process = subprocess.Popen(
+            [sys.executable, "-m", "transtex", "serve", "--port", "0", "--workers", "2"],
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        try:
+            line = process.stderr.readline()
+            self.assertIn("serving on http://", line)
+            host, port = line.rsplit("//", 1)[1].strip().rsplit(":", 1)
+            connection = http.client.HTTPConnection(host, int(port), timeout=10)
+            status, body = _post(connection, "/convert", {"from": "apa", "to": "ieee", "citation": format_apa(_article(1))})
+            connection.close()
+            self.assertEqual(status, 200)
+            self.assertEqual(body["results"][0]["value"], format_ieee(_article(1)))
+        finally:
+            process.terminate()
+            self.assertEqual(process.wait(timeout=10), 0)
+            process.stderr.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
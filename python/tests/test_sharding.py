@@ -0,0 +1,114 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from transtex import Reference, format_apa, format_ieee, reference_to_bibtex
+from transtex.cli import main
+from transtex.sharding import MANIFEST, ShardError, map_local, map_shard, merge_shards, shard_of, split
+
+
+def _article(index: int) -> Reference:
+    return Reference(
+        entry_type="article",
+        cite_key=f"ref{index}",
+        title=f"Deep Learning for Everything, Part {index}",
+        authors=["John Doe", "Jane Smith"],
+        journal="Journal of Omniscience",
+        year=str(1990 + index % 30),
+        volume=str(index % 60 + 1),
+        issue=str(index % 12 + 1),
+        pages=f"{index}-{index + 12}",
+    )
+
+
+class ShardingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        self.references = [_article(index) for index in range(30)]
+        self.bib = self.root / "refs.bib"
+        self.bib.write_text("\n\n".join(map(reference_to_bibtex, self.references)), encoding="utf-8")
+        self.citations = self.root / "apa.txt"
+        lines = [format_apa(reference) for reference in self.references]
+        lines.insert(7, "not a citation")
+        self.citations.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def test_shard_of_is_stable(self) -> None:
+        # Fixed values: every process and host must agree on the shard.
+        self.assertEqual([shard_of(f"ref{index}", 4) for index in range(6)], [0, 2, 2, 1, 0, 3])
+        self.assertEqual(shard_of("doe2020deep", 1), 0)
+        self.assertEqual(len({shard_of(f"ref{index}", 4) for index in range(100)}), 4)
+
+    def test_split_places_entries_by_cite_key(self) -> None:
+        workdir = self.root / "job"
+        self.assertEqual(split(workdir, [str(self.bib)], shards=3, style="ieee"), 30)
+        manifest = json.loads((workdir / MANIFEST).read_text(encoding="utf-8"))
+        self.assertEqual((manifest["command"], manifest["shards"], manifest["records"]), ("format", 3, 30))
+        # Like parse_bibtex_entry and read_bib, LaTeX is only decoded on request.
+        self.assertIs(manifest["decode_latex"], False)
+        for index in range(3):
+            for line in (workdir / f"shard-{index:04d}.jsonl").read_text(encoding="utf-8").splitlines():
+                sequence, _, _ = json.loads(line)
+                self.assertEqual(shard_of(f"ref{sequence}", 3), index)
+
+    def test_merge_restores_input_order(self) -> None:
+        workdir = self.root / "job"
+        split(workdir, [str(self.bib)], shards=4, style="ieee")
+        for index in reversed(range(4)):
+            map_shard(workdir, index)
+        results = list(merge_shards(workdir))
+        self.assertEqual([result.value for _, result in results], [format_ieee(ref) for ref in self.references])
+        self.assertEqual(results[2][0], f"{self.bib}: entry 3")
+
+    def test_merge_refuses_unfinished_jobs(self) -> None:
+        workdir = self.root / "job"
+        split(workdir, [str(self.citations)], shards=2, from_style="apa", to_style="ieee")
+        map_shard(workdir, 0)
+        with self.assertRaisesRegex(ShardError, "not finished: 1"):
+            merge_shards(workdir)
+        with self.assertRaises(ShardError):
+            map_shard(workdir, 2)
+        # Splitting again discards outputs of the previous split.
+        split(workdir, [str(self.citations)], shards=2, from_style="apa", to_style="ieee")
+        self.assertFalse((workdir / "shard-0000.out.jsonl").exists())
+
+    def test_processes_stand_in_for_nodes(self) -> None:
+        workdir = self.root / "job"
+        split(workdir, [str(self.citations)], shards=3, from_style="apa", to_style="ieee")
+        map_local(workdir, processes=2)
+        results = list(merge_shards(workdir))
+        self.assertEqual(len(results), 31)
+        self.assertEqual((results[7][0], results[7][1].code), (f"{self.citations}:8", "parse_failed"))
+        values = [result.value for _, result in results if result.ok]
+        self.assertEqual(values, [format_ieee(reference) for reference in self.references])
+
+    def test_failed_shard_processes_are_reported(self) -> None:
+        workdir = self.root / "job"
+        split(workdir, [str(self.bib)], shards=3, style="ieee")
+        (workdir / "shard-0001.jsonl").unlink()
+        with redirect_stderr(io.StringIO()), self.assertRaisesRegex(ShardError, "shards failed: 1$"):
+            map_local(workdir, processes=2)
+        self.assertTrue((workdir / "shard-0002.out.jsonl").exists())
+
+    def test_command_line_run_matches_convert(self) -> None:
+        def run(argv):
+            out, err = io.StringIO(), io.StringIO()
+            with redirect_stdout(out), redirect_stderr(err):
+                status = main(argv)
+            return status, out.getvalue(), err.getvalue()
+
+        workdir = str(self.root / "job")
+        sharded = run(["shard", "run", "-d", workdir, "--shards", "3", "--convert", "apa", "ieee", str(self.citations)])
+        direct = run(["convert", "--from", "apa", "--to", "ieee", str(self.citations)])
+        self.assertEqual(sharded[:2], direct[:2])
+        self.assertEqual(sharded[0], 1)
+        self.assertIn("shard run: 31 items, 1 failed", sharded[2])
+        self.assertEqual(run(["shard", "reduce", "-d", str(self.root / "missing")])[0], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
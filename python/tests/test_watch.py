@@ -0,0 +1,138 @@
+import io
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr
+from pathlib import Path
+from unittest import mock
+
+from transtex import Reference, format_ieee, parse_bibtex_entry, reference_to_bibtex
+from transtex.batch import _format_bibtex_chunk_captured
+from transtex.cli import main
+from transtex.watch import BibWatcher
+
+
+def _article(index: int, title: str = "") -> Reference:
+    return Reference(
+        entry_type="article",
+        cite_key=f"ref{index}",
+        title=title or f"Deep Learning for Everything, Part {index}",
+        authors=["John Doe", "Jane Smith"],
+        journal="Journal of Omniscience",
+        year=str(1990 + index % 30),
+        pages=f"{index}-{index + 12}",
+    )
+
+
+class BibWatcherTests(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        self.bib = self.root / "refs.bib"
+        self.references = [_article(index) for index in range(10)]
+        self._write(self.references)
+        self.output = self.root / "refs.ieee.txt"
+
+    def _write(self, references) -> None:
+        self.bib.write_text("\n\n".join(map(reference_to_bibtex, references)) + "\n", encoding="utf-8")
+        # Make every rewrite visible even on filesystems with coarse timestamps.
+        stat = self.bib.stat()
+        os.utime(self.bib, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def _expected(self, references) -> str:
+        parsed = (parse_bibtex_entry(reference_to_bibtex(reference)) for reference in references)
+        return "".join(format_ieee(reference) + "\n" for reference in parsed)
+
+    def test_only_changed_entries_are_formatted(self) -> None:
+        with mock.patch("transtex.watch._format_bibtex_chunk_captured", wraps=_format_bibtex_chunk_captured) as task:
+            watcher = BibWatcher([self.root], "ieee")
+        [update] = watcher.poll()
+        self.assertEqual((update.formatted, update.unchanged, update.removed), (10, 0, 0))
+        self.assertEqual(self.output.read_text(encoding="utf-8"), self._expected(self.references))
+        self.assertEqual(watcher.poll(), [])
+
+        edited = list(self.references)
+        edited[7] = _article(7, "A Better Title")
+        del edited[8]
+        edited.append(_article(42))
+        self._write(edited)
+        task.reset_mock()
+        [update] = watcher.poll()
+        self.assertEqual(sum(len(call.args[2]) for call in task.call_args_list), 2)
+        self.assertEqual((update.formatted, update.unchanged, update.removed), (2, 8, 2))
+        self.assertEqual(self.output.read_text(encoding="utf-8"), self._expected(edited))
+        # Lines before the first edited entry were left alone.
+        self.assertEqual(update.bytes_written, len(self._expected(edited[7:]).encode("utf-8")))
+
+    def test_outputs_written_by_others_are_reread(self) -> None:
+        watcher = BibWatcher([self.bib], "ieee", output_dir=self.root / "out")
+        (self.root / "out").mkdir()
+        watcher.poll()
+        output = self.root / "out" / "refs.ieee.txt"
+        output.write_text("clobbered\n", encoding="utf-8")
+        self._write(self.references[:3])
+        watcher.poll()
+        self.assertEqual(output.read_text(encoding="utf-8"), self._expected(self.references[:3]))
+
+    def test_failed_entries_are_reported_and_skipped(self) -> None:
+        self.bib.write_text(reference_to_bibtex(self.references[0]) + "\n@article{broken,\n", encoding="utf-8")
+        [update] = BibWatcher([self.bib], "ieee").poll()
+        self.assertEqual([label for label, _ in update.failures], [f"{self.bib}: entry 2"])
+        self.assertEqual(self.output.read_text(encoding="utf-8"), self._expected(self.references[:1]))
+
+    def test_unreadable_files_are_reported_and_retried(self) -> None:
+        watcher = BibWatcher([self.root], "ieee")
+        watcher.poll()
+        self.bib.write_bytes(reference_to_bibtex(_article(1, "Caf\xe9")).encode("latin-1"))
+        (self.root / "folder.bib").mkdir()
+        updates = {Path(update.source).name: update for update in watcher.poll()}
+        self.assertIn("not valid UTF-8", updates["refs.bib"].error)
+        self.assertIn("Is a directory", updates["folder.bib"].error)
+        self.assertEqual(self.output.read_text(encoding="utf-8"), self._expected(self.references))
+        self.assertEqual(watcher.poll(), [])
+
+        self._write(self.references[:2])
+        [update] = watcher.poll()
+        self.assertIsNone(update.error)
+        self.assertEqual(self.output.read_text(encoding="utf-8"), self._expected(self.references[:2]))
+
+    def test_deleted_files_are_forgotten_and_outputs_removed(self) -> None:
+        other = self.root / "other.bib"
+        other.write_text(reference_to_bibtex(_article(99)), encoding="utf-8")
+        watcher = BibWatcher([self.root, self.bib], "ieee")
+        self.assertEqual(len(watcher.poll()), 2)
+        self.bib.unlink()
+        other.unlink()
+        updates = watcher.poll()
+        removed = sorted((Path(update.source).name, update.removed) for update in updates)
+        self.assertEqual(removed, [("other.bib", 1), ("refs.bib", 10)])
+        self.assertTrue(all(update.deleted for update in updates))
+        self.assertFalse(self.output.exists())
+        self.assertFalse((self.root / "other.ieee.txt").exists())
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual((watcher._tracked, watcher._rendered), ({}, {}))
+
+    def test_run_until_stopped(self) -> None:
+        stop = threading.Event()
+        updates = []
+
+        def report(update) -> None:
+            updates.append(update)
+            stop.set()
+
+        BibWatcher([self.bib], "ieee").run(interval=0.01, stop=stop, report=report)
+        self.assertEqual(len(updates), 1)
+
+    def test_command_line_once(self) -> None:
+        err = io.StringIO()
+        with redirect_stderr(err):
+            status = main(["watch", "--style", "ieee", "--once", str(self.bib)])
+        self.assertEqual(status, 0)
+        self.assertIn("10 formatted, 0 unchanged, 0 removed", err.getvalue())
+        self.assertEqual(self.output.read_text(encoding="utf-8"), self._expected(self.references))
+
+
+if __name__ == "__main__":
+    unittest.main()
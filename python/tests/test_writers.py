@@ -0,0 +1,83 @@
+import io
+import unittest
+
+from transtex import ConversionError, Reference, write_bibliography
+
+
+class WriteBibliographyTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.article = Reference(
+            entry_type="article",
+            cite_key="doe2020deep",
+            title="Deep Learning for Everything",
+            authors=["John Doe", "Jane Smith"],
+            journal="Journal of Omniscience & Co",
+            year="2020",
+            volume="42",
+            issue="7",
+            pages="1-10",
+        )
+        self.chapter = Reference(
+            entry_type="incollection",
+            cite_key="lee2019",
+            title="A Chapter",
+            authors=["Alice Lee"],
+            booktitle="Big Book",
+            publisher="Press",
+            year="2019",
+        )
+
+    def _write(self, references, style: str, markup: str) -> str:
+        buffer = io.StringIO()
+        write_bibliography(iter(references), style, buffer, markup=markup)
+        return buffer.getvalue()
+
+    def test_plain_text_matches_formatter_output(self) -> None:
+        output = self._write([self.article], "apa7", "text")
+        self.assertEqual(
+            output,
+            "Doe, J., & Smith, J. (2020). Deep learning for everything. "
+            "Journal of Omniscience & Co, 42(7), 1–10.\n",
+        )
+
+    def test_markdown_italicizes_container(self) -> None:
+        output = self._write([self.article], "ieee", "markdown")
+        self.assertTrue(output.startswith("\\[1\\] J. Doe and J. Smith"))
+        self.assertIn("*Journal of Omniscience & Co*, vol. 42", output)
+
+    def test_html_escapes_and_italicizes(self) -> None:
+        output = self._write([self.article, self.chapter], "apa7", "html")
+        self.assertTrue(output.startswith('<div class="bibliography">\n'))
+        self.assertIn("<i>Journal of Omniscience &amp; Co</i>, 42(7)", output)
+        self.assertIn("In <i>Big Book</i>", output)
+        self.assertEqual(output.count('<div class="entry">'), 2)
+
+    def test_chicago_book_title_single_emphasis(self) -> None:
+        output = self._write([self.chapter], "chicago", "markdown")
+        self.assertIn("In *Big Book*", output)
+        self.assertNotIn("**", output)
+
+    def test_rtf_escapes_braces_and_unicode(self) -> None:
+        reference = Reference(
+            entry_type="article",
+            cite_key="x",
+            title="On {braces",
+            authors=["Zoë Müller"],
+            journal="Journal",
+            year="2020",
+        )
+        output = self._write([reference], "mla", "rtf")
+        self.assertTrue(output.startswith("{\\rtf1"))
+        self.assertIn("M\\u252?ller", output)
+        self.assertIn("{\\i Journal}", output)
+        self.assertIn("\\{", output)
+        self.assertTrue(output.endswith("\\par\n}\n"))
+
+    def test_returns_count_and_rejects_unknown_markup(self) -> None:
+        self.assertEqual(write_bibliography([], "apa", io.StringIO()), 0)
+        with self.assertRaises(ConversionError):
+            write_bibliography([], "apa", io.StringIO(), markup="latex")
+
+
+if __name__ == "__main__":
+    unittest.main()